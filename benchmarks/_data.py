@@ -0,0 +1,55 @@
+# benchmarks/_data.py
+
+import random
+from typing import List, Dict
+
+
+STATES = [
+    ("Alabama", "AL"), ("Alaska", "AK"), ("Arizona", "AZ"), ("California", "CA"),
+    ("Colorado", "CO"), ("Florida", "FL"), ("Georgia", "GA"), ("Illinois", "IL"),
+    ("Massachusetts", "MA"), ("New York", "NY"), ("Ohio", "OH"), ("Texas", "TX"),
+    ("Washington", "WA"),
+]
+TIMEZONES = [
+    {"name": "EST", "offset": "UTC-5"},
+    {"name": "CST", "offset": "UTC-6"},
+    {"name": "MST", "offset": "UTC-7"},
+    {"name": "PST", "offset": "UTC-8"},
+    {"name": "AKST", "offset": "UTC-9"},
+]
+
+
+def synthetic_geo_records(size: int = 42000, seed: int = 7) -> List[Dict]:
+    """
+    Builds geo records shaped like the real database, for benchmarks that cannot
+    rely on the encrypted dataset being installed.
+    """
+    rng = random.Random(seed)
+    zip_codes = sorted(rng.sample(range(501, 99951), size))
+    records = []
+    for zc in zip_codes:
+        state, state_iso = rng.choice(STATES)
+        npa = str(rng.randint(201, 989))
+        nxx = str(rng.randint(200, 999))
+        lat = round(rng.uniform(25.0, 49.0), 4)
+        lon = round(rng.uniform(-124.0, -67.0), 4)
+        records.append(
+            {
+                "npa": npa,
+                "nxx": nxx,
+                "npanxx": npa + nxx,
+                "city": f"City {zc % 9000}",
+                "state": state,
+                "stateISO": state_iso,
+                "country": "United States",
+                "countryISO": "US",
+                "zipCode": f"{zc:05d}",
+                "gmtOffset": "-5",
+                "gmtOffsetDST": "-4",
+                "dstObserved": "1",
+                "longitude": str(lon),
+                "timezone": dict(rng.choice(TIMEZONES)),
+                "location": {"latitude": str(lat), "longitude": str(lon)},
+            }
+        )
+    return records
@@ -0,0 +1,60 @@
+# benchmarks/bulk_extraction.py
+#
+# Measures the throughput of bulk phone and ZIP extraction over synthetic
+# email-sized documents with 1, 2, 4 and 8 worker processes.
+#
+#   python -m benchmarks.bulk_extraction
+
+import os
+import random
+import time
+
+from uscodekit.phone import extract_phone_numbers_many
+from uscodekit.zip_code import extract_all_zip_codes_many
+
+
+WORDS = (
+    "please find attached the invoice for order shipped to our office call me "
+    "tomorrow regarding the account thanks best regards meeting schedule"
+).split()
+
+
+def documents(count: int, seed: int = 11):
+    rng = random.Random(seed)
+    docs = []
+    for _ in range(count):
+        words = [rng.choice(WORDS) for _ in range(300)]
+        for _ in range(3):
+            words.insert(
+                rng.randrange(len(words)),
+                f"({rng.randint(201, 989)}) {rng.randint(200, 999)}-{rng.randint(0, 9999):04d}",
+            )
+            words.insert(rng.randrange(len(words)), f"{rng.randint(501, 99950):05d}")
+        docs.append(" ".join(words))
+    return docs
+
+
+def main(count: int = 20000, chunksize: int = 256) -> None:
+    docs = documents(count)
+    megabytes = sum(map(len, docs)) / 1e6
+    print(f"{count} documents, {megabytes:.1f} MB, {os.cpu_count()} CPUs")
+    for label, extract in (
+        ("phones", extract_phone_numbers_many),
+        ("zip codes", extract_all_zip_codes_many),
+    ):
+        print(f"{label}:")
+        baseline = None
+        for workers in (1, 2, 4, 8):
+            start = time.perf_counter()
+            for _ in extract(docs, workers=workers, chunksize=chunksize):
+                pass
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(
+                f"  {workers} worker(s)      {count / elapsed:>10.0f} docs/s "
+                f"{megabytes / elapsed:>8.1f} MB/s  x{baseline / elapsed:.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# benchmarks/city_search.py
+#
+# Measures the latency of typo-tolerant city search over a synthetic dataset
+# with realistic city names, on queries with one or two typos.
+#
+#   python -m benchmarks.city_search
+
+import random
+import time
+
+from uscodekit.services import geo
+from uscodekit.services.geo import GeoIndex, GeoService
+
+from benchmarks._data import synthetic_geo_records
+
+
+PREFIXES = ["", "", "", "", "San ", "Saint ", "Fort ", "Mount ", "North ", "Lake ", "New "]
+ONSETS = [
+    "", "b", "br", "c", "ch", "d", "f", "g", "gr", "h", "k", "l",
+    "m", "n", "p", "r", "s", "sh", "st", "t", "tr", "v", "w",
+]
+VOWELS = ["a", "e", "i", "o", "u", "ea", "ou", "y"]
+CODAS = ["", "", "n", "r", "l", "s", "t", "m", "ck", "nd", "rt", "ll"]
+SUFFIXES = [
+    "", "", "", "ton", "ville", "field", "wood", "ford", "dale", "burg", "port", " City", " Springs",
+]
+
+
+def city_names(count: int, rng: random.Random):
+    names = set()
+    while len(names) < count:
+        word = "".join(
+            rng.choice(ONSETS) + rng.choice(VOWELS) + rng.choice(CODAS)
+            for _ in range(rng.randint(2, 3))
+        )
+        names.add(rng.choice(PREFIXES) + word.capitalize() + rng.choice(SUFFIXES))
+    return sorted(names)
+
+
+def typo(name: str, rng: random.Random) -> str:
+    chars = list(name)
+    for _ in range(rng.randint(1, 2)):
+        i = rng.randrange(len(chars))
+        op = rng.randrange(3)
+        if op == 0 and len(chars) > 4:
+            del chars[i]
+        elif op != 2:
+            chars[i] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+        else:
+            chars.insert(i, rng.choice("abcdefghijklmnopqrstuvwxyz"))
+    return "".join(chars)
+
+
+def main(size: int = 42000, cities: int = 28000, queries: int = 2000) -> None:
+    rng = random.Random(3)
+    records = synthetic_geo_records(size)
+    names = city_names(cities, rng)
+    for record in records:
+        record["city"] = rng.choice(names)
+    geo._geo_index = GeoIndex(records)
+    service = GeoService()
+
+    start = time.perf_counter()
+    service.index.city_search
+    print(f"index build          {(time.perf_counter() - start) * 1e3:>10.1f} ms")
+
+    samples = [rng.choice(records) for _ in range(queries)]
+    for label, with_state in (("any state", False), ("given state", True)):
+        latencies = []
+        found = 0
+        for record in samples:
+            query = typo(record["city"], rng)
+            state = record["stateISO"] if with_state else None
+            start = time.perf_counter()
+            results = service.search_city(query, state)
+            latencies.append(time.perf_counter() - start)
+            found += any(result["city"] == record["city"] for result in results)
+
+        latencies.sort()
+        print(f"{label}:")
+        for name, q in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+            print(f"  {name:<18} {latencies[int(q * (len(latencies) - 1))] * 1e6:>10.1f} us")
+        print(f"  {'recall':<18} {found / len(samples):>10.1%}")
+
+
+if __name__ == "__main__":
+    main()
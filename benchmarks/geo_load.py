@@ -0,0 +1,85 @@
+# benchmarks/geo_load.py
+#
+# Compares the wall time and peak RSS of the legacy geo loader (gunzip to disk,
+# read, decrypt, decode, parse, write a JSON copy) with the streaming loader.
+# Each path runs in a fresh process against a synthetic encrypted database.
+#
+#   python -m benchmarks.geo_load
+
+import gzip
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from cryptography.fernet import Fernet
+
+from benchmarks._data import synthetic_geo_records
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run(path: str, root: str, queue) -> None:
+    from uscodekit.configs import Config, GeoConfig
+    from uscodekit.services import geo
+
+    root = Path(root)
+    Config.encryption_key_fp = root / "encryption.key"
+    GeoConfig.encrypted_database_fp = root / "geo.gz"
+    GeoConfig.decompressed_data_fp = root / "decompressed.geo.bin"
+    GeoConfig.decompressed_json_fp = root / "decompressed.geo.json"
+
+    loader = geo.get_database if path == "legacy" else geo.stream_database
+    baseline = _peak_rss_mb()
+    start = time.perf_counter()
+    records = loader()
+    elapsed = time.perf_counter() - start
+    queue.put((len(records), elapsed, baseline, _peak_rss_mb()))
+
+
+def _prepare(root: str, size: int, queue) -> None:
+    key = Fernet.generate_key()
+    Path(root, "encryption.key").write_bytes(key)
+    plaintext = json.dumps(synthetic_geo_records(size)).encode("utf-8")
+    with gzip.open(Path(root, "geo.gz"), "wb") as f:
+        f.write(Fernet(key).encrypt(plaintext))
+    queue.put(len(plaintext))
+
+
+def main(size: int = 42000) -> None:
+    # children inherit the peak RSS of their parent, so the dataset is built in
+    # a process of its own and the parent stays small
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as root:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_prepare, args=(root, size, queue))
+        proc.start()
+        print(f"dataset: {size} records, {queue.get() / 1e6:.1f} MB of JSON")
+        proc.join()
+
+        for path in ("legacy", "streaming"):
+            for name in ("decompressed.geo.bin", "decompressed.geo.json"):
+                if os.path.exists(Path(root, name)):
+                    os.remove(Path(root, name))
+            queue = ctx.Queue()
+            proc = ctx.Process(target=_run, args=(path, root, queue))
+            proc.start()
+            count, elapsed, baseline, peak = queue.get()
+            proc.join()
+            left = sorted(p for p in os.listdir(root) if p.startswith("decompressed"))
+            print(
+                f"{path:<10} {count} records  {elapsed * 1e3:8.1f} ms  "
+                f"peak RSS +{peak - baseline:6.1f} MB  files left: {left or 'none'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
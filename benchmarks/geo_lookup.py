@@ -0,0 +1,53 @@
+# benchmarks/geo_lookup.py
+#
+# Compares the indexed GeoService lookups against the linear scan they replaced.
+#
+#   python -m benchmarks.geo_lookup
+
+import random
+import timeit
+
+from uscodekit.services import geo
+from uscodekit.services.geo import GeoIndex, GeoService
+
+from benchmarks._data import synthetic_geo_records
+
+
+def linear_zip_lookup(records, zip_code):
+    result = list(filter(lambda x: x["zipCode"] == zip_code, records))
+    return result[0] if result else {}
+
+
+def linear_area_code_lookup(records, area_code):
+    result = list(filter(lambda x: x["npa"] == area_code, records))
+    return result[0] if result else {}
+
+
+def main(size: int = 42000, lookups: int = 200) -> None:
+    records = synthetic_geo_records(size)
+    geo._geo_index = GeoIndex(records)
+    service = GeoService()
+
+    rng = random.Random(1)
+    zips = [rng.choice(records)["zipCode"] for _ in range(lookups)]
+    npas = [rng.choice(records)["npa"] for _ in range(lookups)]
+
+    cases = [
+        ("zip code (scan)", lambda: [linear_zip_lookup(records, z) for z in zips]),
+        ("zip code (index)", lambda: [service.get_zip_code_info(z) for z in zips]),
+        ("area code (scan)", lambda: [linear_area_code_lookup(records, n) for n in npas]),
+        ("area code (index)", lambda: [service.get_phone_info(n) for n in npas]),
+    ]
+    timings = {}
+    for name, fn in cases:
+        best = min(timeit.repeat(fn, number=1, repeat=3))
+        timings[name] = best / lookups
+        print(f"{name:<20} {timings[name] * 1e6:>12.2f} us/lookup")
+
+    for kind in ("zip code", "area code"):
+        speedup = timings[f"{kind} (scan)"] / timings[f"{kind} (index)"]
+        print(f"{kind} speedup: {speedup:,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# tests/sample_data.py
+
+SAMPLE_RECORDS = [
+    {
+        "npa": "907",
+        "nxx": "200",
+        "zipCode": "99686",
+        "city": "Valdez",
+        "state": "Alaska",
+        "stateISO": "AK",
+        "location": {"latitude": 61.1381, "longitude": -146.3572},
+        "timezone": {"name": "AKST", "offset": "UTC-9"},
+    },
+    {
+        "npa": "907",
+        "nxx": "225",
+        "zipCode": "99901",
+        "city": "Ketchikan",
+        "state": "Alaska",
+        "stateISO": "AK",
+        "location": {"latitude": 55.3422, "longitude": -131.6461},
+        "timezone": {"name": "AKST", "offset": "UTC-9"},
+    },
+    {
+        "npa": "617",
+        "nxx": "495",
+        "zipCode": "02138",
+        "city": "Cambridge",
+        "state": "Massachusetts",
+        "stateISO": "MA",
+        "location": {"latitude": 42.372, "longitude": -71.1137},
+        "timezone": {"name": "EST", "offset": "UTC-5"},
+    },
+]
@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from uscodekit import aio
+from uscodekit.services import geo
+from uscodekit.services.geo import GeoIndex
+
+from tests.sample_data import SAMPLE_RECORDS
+
+
+@pytest.fixture
+def slow_load(monkeypatch):
+    """Replaces the database load by a slow one that counts its calls."""
+    calls = []
+
+    def load():
+        calls.append(threading.current_thread())
+        time.sleep(0.05)
+        index = GeoIndex(SAMPLE_RECORDS)
+        geo._geo_index = index
+        return index
+
+    monkeypatch.setattr(geo, "_geo_index", None)
+    monkeypatch.setattr(geo, "get_geo_index", load)
+    monkeypatch.setattr(aio, "_load_future", None)
+    return calls
+
+
+def test_aload_runs_once_off_the_loop(slow_load):
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        task = asyncio.create_task(ticker())
+        indexes = await asyncio.gather(*(aload() for aload in [aio.aload] * 10))
+        task.cancel()
+        return indexes, ticks
+
+    indexes, ticks = asyncio.run(main())
+    assert len(slow_load) == 1
+    assert slow_load[0] is not threading.main_thread()
+    assert all(index is indexes[0] for index in indexes)
+    # the event loop kept running while the database loaded
+    assert ticks > 1
+
+
+def test_loaded_index_needs_no_thread_hop(slow_load, monkeypatch):
+    index = GeoIndex(SAMPLE_RECORDS)
+    monkeypatch.setattr(geo, "_geo_index", index)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        loop.run_in_executor = None  # any hop to the executor would fail
+        return await aio.aload()
+
+    assert asyncio.run(main()) is index
+    assert slow_load == []
+
+
+def test_cancelled_caller_does_not_cancel_the_load(slow_load):
+    async def main():
+        first = asyncio.create_task(aio.aload())
+        second = asyncio.create_task(aio.aload())
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert len(asyncio.run(main()).store) == 3
+    assert len(slow_load) == 1
+
+
+def test_missing_database_is_retried(monkeypatch):
+    calls = []
+
+    def load():
+        calls.append(1)
+        return GeoIndex([])
+
+    monkeypatch.setattr(geo, "_geo_index", None)
+    monkeypatch.setattr(geo, "get_geo_index", load)
+    monkeypatch.setattr(aio, "_load_future", None)
+    asyncio.run(aio.aload())
+    asyncio.run(aio.aload())
+    assert len(calls) == 2
+
+
+def test_insights(monkeypatch):
+    monkeypatch.setattr(geo, "_geo_index", GeoIndex(SAMPLE_RECORDS))
+
+    async def main():
+        return await asyncio.gather(
+            aio.zip_code_insight("99686"),
+            aio.zip_code_insight_many(["02138", "00000"]),
+            aio.phone_number_insight("(907) 200-1234"),
+            aio.phone_number_insight_many(["(617) 495-0000", "invalid"], skip_invalid=True),
+        )
+
+    zip_info, zip_infos, phone_info, phone_infos = asyncio.run(main())
+    assert zip_info["city"] == "Valdez"
+    assert [info["city"] for info in zip_infos] == ["Cambridge", ""]
+    assert phone_info["state"] == "Alaska"
+    assert phone_infos[0]["city"] == "Cambridge"
+    assert phone_infos[1] is None
+
+
+def test_insights_use_the_awaited_index(monkeypatch):
+    # with the files missing, the empty index is not cached: a second load on
+    # the event loop thread would run again
+    loads = []
+
+    def load():
+        loads.append(threading.current_thread())
+        return GeoIndex([])
+
+    monkeypatch.setattr(geo, "_geo_index", None)
+    monkeypatch.setattr(geo, "get_geo_index", load)
+    monkeypatch.setattr(aio, "_load_future", None)
+
+    info = asyncio.run(aio.zip_code_insight("99686"))
+    assert info["city"] == ""
+    assert len(loads) == 1
+    assert loads[0] is not threading.main_thread()
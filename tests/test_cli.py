@@ -0,0 +1,121 @@
+import csv
+import io
+import json
+
+import pytest
+
+from uscodekit import cli
+from uscodekit.records import NaicsCode
+from uscodekit.services import geo, naics
+from uscodekit.services.geo import GeoIndex
+from uscodekit.shared import parallel
+
+from tests.sample_data import SAMPLE_RECORDS
+
+
+NAICS_RECORDS = [
+    {"code": "92", "title": "Public Administration"},
+    {"code": "921", "title": "Executive, Legislative, and Other General Government Support"},
+    {"code": "921130", "title": "Public Finance Activities"},
+]
+
+CSV_INPUT = (
+    "name,phone,zip,naics\n"
+    "Harvard,617-495-1000,02138,921130\n"
+    'Port,"(907) 225-1234",99901,92\n'
+    "Nobody,not a phone,00000,\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def databases(monkeypatch):
+    monkeypatch.setattr(geo, "_geo_index", GeoIndex(SAMPLE_RECORDS))
+    monkeypatch.setattr(naics, "_database", [NaicsCode.from_dict(r) for r in NAICS_RECORDS])
+    monkeypatch.setattr("gc.freeze", lambda: None)
+
+
+def run(tmp_path, text, *args, name="input.csv"):
+    source = tmp_path / name
+    source.write_text(text)
+    target = tmp_path / ("output" + source.suffix)
+    assert cli.main(["enrich", str(source), "-o", str(target), *args]) == 0
+    return target.read_text()
+
+
+def test_enrich_csv(tmp_path):
+    output = run(tmp_path, CSV_INPUT, "--phone", "phone", "--zip", "zip", "--naics", "naics")
+    rows = list(csv.DictReader(io.StringIO(output)))
+    assert [row["name"] for row in rows] == ["Harvard", "Port", "Nobody"]
+    assert rows[0]["phone_phone"] == "(617) 495-1000"
+    assert rows[0]["phone_city"] == "Cambridge"
+    assert rows[1]["phone_timezone"] == "AKST"
+    assert rows[1]["zip_city"] == "Ketchikan"
+    assert rows[0]["zip_latitude"] == "42.372"
+    assert rows[0]["naics_title"] == "Public Finance Activities"
+    assert rows[0]["naics_subsector"].startswith("Executive")
+    assert rows[1]["naics_sector"] == "Public Administration"
+    assert rows[1]["naics_subsector"] == ""
+    assert all(rows[2][field] == "" for field in rows[2] if "_" in field)
+
+
+# the workers see the sample databases of the fixture only if they are forked
+@pytest.mark.skipif(not parallel.FORK, reason="needs fork")
+def test_enrich_csv_with_workers(tmp_path):
+    text = "name,phone,zip\n" + "".join(
+        f"row{i},617-495-{i:04d},{'02138' if i % 2 else '99686'}\n" for i in range(200)
+    )
+    args = ("--phone", "phone", "--zip", "zip", "--chunksize", "16")
+    assert run(tmp_path, text, *args, "--workers", "2") == run(tmp_path, text, *args)
+
+
+def test_enrich_jsonl(tmp_path):
+    lines = [
+        {"id": 1, "phone": 6174951000, "zip": 2138},
+        {"id": 2, "phone": None, "zip": "99686", "extra": [1, 2]},
+    ]
+    text = "\n".join(json.dumps(line) for line in lines) + "\n\n"
+    output = run(tmp_path, text, "--phone", "phone", "--zip", "zip", name="input.jsonl")
+    records = [json.loads(line) for line in output.splitlines()]
+    assert len(records) == 2
+    assert records[0]["phone_phone"] == "(617) 495-1000"
+    assert records[0]["zip_city"] == "Cambridge"
+    assert records[1]["phone_city"] == ""
+    assert records[1]["extra"] == [1, 2]
+    assert records[1]["zip_timezone"] == "AKST"
+
+
+def test_enrich_errors(tmp_path, capsys):
+    source = tmp_path / "input.csv"
+    source.write_text(CSV_INPUT)
+    assert cli.main(["enrich", str(source), "--phone", "telephone"]) == 1
+    assert "'telephone'" in capsys.readouterr().err
+
+    source = tmp_path / "input.jsonl"
+    source.write_text("[1, 2]\n")
+    assert cli.main(["enrich", str(source), "--zip", "zip"]) == 1
+    assert "JSON object" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit):
+        cli.main(["enrich", str(source)])
+
+
+def test_enrich_reports_missing_database(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(geo, "_geo_index", GeoIndex([]))
+    monkeypatch.setattr(geo, "get_geo_index", lambda: geo._geo_index)
+    monkeypatch.setattr("uscodekit.warmup.get_geo_index", lambda: geo._geo_index)
+    source = tmp_path / "input.csv"
+    source.write_text(CSV_INPUT)
+    assert cli.main(["enrich", str(source), "--zip", "zip"]) == 1
+    assert "geo database" in capsys.readouterr().err
+
+
+@pytest.mark.skipif(not parallel.FORK, reason="needs fork")
+def test_only_the_command_line_freezes(tmp_path, monkeypatch):
+    frozen = []
+    preload = cli.preload
+    monkeypatch.setattr(cli, "preload", lambda datasets, freeze: frozen.append(freeze) or preload(datasets))
+    source = tmp_path / "input.csv"
+    source.write_text(CSV_INPUT)
+    cli.enrich(str(source), str(tmp_path / "output.csv"), fmt="csv", zip_code=["zip"], workers=2)
+    run(tmp_path, CSV_INPUT, "--zip", "zip", "--workers", "2")
+    assert frozen == [False, True]
@@ -16,6 +16,7 @@ def test_geo_config():
     assert GeoConfig.encrypted_database_fp == GeoConfig.root / "geo.gz"
     assert GeoConfig.decompressed_data_fp == GeoConfig.root / "decompressed.geo.bin"
     assert GeoConfig.decompressed_json_fp == GeoConfig.root / "decompressed.geo.json"
+    assert GeoConfig.snapshot_fp == GeoConfig.root / "geo.snapshot"
 
 
 def test_naics2022_config():
@@ -0,0 +1,51 @@
+import unittest
+from unittest.mock import patch
+
+from uscodekit.entities import PHONE, ZIP_CODE, extract_entities
+from uscodekit.phone import PhoneMatch, extract_phone_numbers
+from uscodekit.services.geo import GeoIndex
+from uscodekit.zip_code import ZipCodeMatch, extract_all_zip_codes
+
+from tests.sample_data import SAMPLE_RECORDS
+
+
+class TestExtractEntities(unittest.TestCase):
+
+    def test_typed_spans(self):
+        text = "Call +1 (617) 495-1000, Cambridge MA 02138-4321."
+        entities = extract_entities(text)
+        self.assertEqual(
+            entities,
+            [PhoneMatch(5, 22, "617", "495", "1000"), ZipCodeMatch(37, 47, "02138-4321")],
+        )
+        self.assertEqual([entity.kind for entity in entities], [PHONE, ZIP_CODE])
+        self.assertEqual([text[slice(*entity.span)] for entity in entities],
+                         ["+1 (617) 495-1000", "02138-4321"])
+        self.assertEqual([str(entity) for entity in entities], ["(617) 495-1000", "02138-4321"])
+
+    def test_phone_digits_are_not_zip_codes(self):
+        text = "Dial 617-495-10001 today"
+        self.assertEqual(extract_all_zip_codes(text), ["10001"])
+        entities = extract_entities(text)
+        self.assertEqual([entity.kind for entity in entities], [PHONE])
+
+    def test_same_results_without_overlaps(self):
+        text = "Ship 90210 and 12345-6789 to (987) 654-3210 or 123.456.7890; ref 2024."
+        entities = extract_entities(text)
+        self.assertEqual(
+            [entity.formatted for entity in entities if entity.kind == PHONE],
+            extract_phone_numbers(text),
+        )
+        self.assertEqual(
+            [entity.zip_code for entity in entities if entity.kind == ZIP_CODE],
+            extract_all_zip_codes(text),
+        )
+
+    def test_no_entities(self):
+        self.assertEqual(extract_entities("nothing here (+)"), [])
+
+    @patch("uscodekit.services.geo._geo_index", GeoIndex(SAMPLE_RECORDS))
+    def test_strict_and_validate(self):
+        text = "(123) 456-7890 617-495-1000 12345 99686"
+        entities = extract_entities(text, strict=True, validate=True)
+        self.assertEqual([str(entity) for entity in entities], ["(617) 495-1000", "99686"])
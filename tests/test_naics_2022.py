@@ -0,0 +1,132 @@
+import threading
+import time
+
+import pytest
+
+from uscodekit.configs import Config, NAICS2022Config
+from uscodekit.services import naics
+from uscodekit.services.naics import NAICS2022Service
+from uscodekit.services.naics_index import NaicsIndex
+
+
+RECORDS = [
+    {"code": "11", "title": "Agriculture, Forestry, Fishing and Hunting"},
+    {"code": "111", "title": "Crop Production"},
+]
+
+
+@pytest.fixture
+def cold_database(tmp_path, monkeypatch):
+    """Points the service at present (but fake) files, with nothing loaded yet."""
+    key_fp = tmp_path / "encryption.key"
+    db_fp = tmp_path / "naics.bin"
+    key_fp.write_bytes(b"")
+    db_fp.write_bytes(b"")
+    monkeypatch.setattr(Config, "encryption_key_fp", key_fp)
+    monkeypatch.setattr(NAICS2022Config, "encrypted_database_fp", db_fp)
+    monkeypatch.setattr(naics, "_database", None)
+    monkeypatch.setattr(naics, "_index", None)
+    decrypts = []
+
+    def slow_decrypt(file_path):
+        decrypts.append(file_path)
+        time.sleep(0.1)
+        return [dict(record) for record in RECORDS]
+
+    monkeypatch.setattr(naics, "decrypt", slow_decrypt)
+    return decrypts
+
+
+def test_cold_start_decrypts_once(cold_database):
+    count = 32
+    barrier = threading.Barrier(count)
+    databases = [None] * count
+
+    def worker(i):
+        barrier.wait()
+        databases[i] = NAICS2022Service().search_database
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cold_database) == 1
+    assert all(database is databases[0] for database in databases)
+    assert NAICS2022Service().industry_name("111") == "Crop Production"
+    assert len(cold_database) == 1
+
+
+def test_cold_start_indexes_once(cold_database, monkeypatch):
+    builds = []
+
+    def counting_index(records):
+        builds.append(records)
+        time.sleep(0.1)
+        return NaicsIndex(records)
+
+    monkeypatch.setattr(naics, "NaicsIndex", counting_index)
+    count = 32
+    barrier = threading.Barrier(count)
+    indexes = [None] * count
+
+    def worker(i):
+        barrier.wait()
+        indexes[i] = naics.get_index()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert all(index is indexes[0] for index in indexes)
+    assert indexes[0].records is naics.get_database()
+
+
+def test_missing_files_are_not_cached(cold_database, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr("uscodekit.shared.file._missing_reported", False)
+    monkeypatch.setattr(Config, "encryption_key_fp", tmp_path / "missing.key")
+    assert NAICS2022Service().data == []
+    assert cold_database == []
+    assert NAICS2022Service().get("11") is None
+    # reported once, not on every lookup
+    assert capsys.readouterr().out.count(Config.file_missing_message) == 1
+    # an empty index, shared rather than rebuilt on every call
+    assert naics.get_index() is naics.get_index()
+    assert NAICS2022Service().search("crop") == []
+
+    monkeypatch.setattr(Config, "encryption_key_fp", tmp_path / "encryption.key")
+    assert NAICS2022Service().get("11")["title"].startswith("Agriculture")
+
+
+def test_get_returns_shared_records(cold_database):
+    service = NAICS2022Service()
+    rec = service.get("111")
+    assert rec is service.get("111")
+    assert rec == RECORDS[1]
+    with pytest.raises(AttributeError):
+        rec.title = "Crops"
+    hierarchy = service.industry_hierarchy("111")
+    assert hierarchy["sector"] is service.get("11")
+    assert hierarchy["subsector"].to_dict() == RECORDS[1]
+
+
+def test_hierarchy_many(cold_database):
+    service = NAICS2022Service()
+    results = service.hierarchy_many(["111", "999", "111", "11"])
+    assert results[0] == service.industry_hierarchy("111")
+    assert results[0] is results[2]
+    assert results[1] is None
+    assert results[3] == {"code": "11", "title": RECORDS[0]["title"], "sector": RECORDS[0]}
+
+
+def test_index_follows_the_database(cold_database, monkeypatch):
+    service = NAICS2022Service()
+    index = service.index
+    assert service.index is index
+    monkeypatch.setattr(naics, "_database", [naics.NaicsCode("11", "Farming")])
+    assert service.index is not index
+    assert service.industry_name("11") == "Farming"
@@ -1,13 +1,36 @@
 # tests/test_phone.py
 
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
+
 from uscodekit.phone import (
     is_valid_phone,
     extract_phone_number,
     extract_phone_numbers,
+    extract_phone_numbers_many,
+    iter_phone_numbers,
+    normalize_many,
+    enable_insight_cache,
+    disable_insight_cache,
+    insight_cache_info,
+    PhoneMatch,
     cleaned_phone,
     prettify,
+    phone_number_insight,
+    phone_number_insight_many,
+    scan_file,
+    US_PHONE_PATTERN,
 )
+from uscodekit.services.geo import GeoIndex
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tests.sample_data import SAMPLE_RECORDS
 
 
 class TestPhoneUtils(unittest.TestCase):
@@ -51,6 +74,31 @@ class TestPhoneUtils(unittest.TestCase):
         extracted = extract_phone_numbers(text)
         self.assertEqual(extracted, ["(123) 456-7890", "(987) 654-3210"])
 
+    def test_iter_phone_numbers(self):
+        text = "Call +1 (617) 495-1000 or 907.835.4321, not 123-45-7890."
+        matches = list(iter_phone_numbers(text))
+        self.assertEqual(len(matches), 2)
+        first, second = matches
+        self.assertEqual(first.span, (5, 22))
+        self.assertEqual(text[first.start:first.end], "+1 (617) 495-1000")
+        self.assertEqual(
+            (first.area_code, first.exchange, first.line, first.digits),
+            ("617", "495", "1000", "6174951000"),
+        )
+        self.assertEqual(first.formatted, "(617) 495-1000")
+        self.assertEqual(str(second), "(907) 835-4321")
+        self.assertEqual(first, PhoneMatch(5, 22, "617", "495", "1000"))
+        self.assertNotEqual(first, second)
+        self.assertFalse(hasattr(first, "__dict__"))
+
+    def test_extract_phone_numbers_matches_the_scanner(self):
+        text = "(123) 456-7890 +11234567890 123.456.7890x 1234567890123"
+        expected = ["".join(groups) for groups in US_PHONE_PATTERN.findall(text)]
+        self.assertEqual(
+            [cleaned_phone(phone) for phone in extract_phone_numbers(text)], expected
+        )
+        self.assertEqual(extract_phone_number(text), "(123) 456-7890")
+
     def test_cleaned_phone(self):
         self.assertEqual(cleaned_phone("(123) 456-7890"), "1234567890")
         self.assertEqual(cleaned_phone("+1-123-456-7890"), "1234567890")
@@ -60,3 +108,176 @@ class TestPhoneUtils(unittest.TestCase):
     def test_prettify(self):
         self.assertEqual(prettify("1234567890"), "(123) 456-7890")
         self.assertEqual(prettify("18234567890"), "(823) 456-7890")
+
+
+@patch("uscodekit.services.geo._geo_index", GeoIndex(SAMPLE_RECORDS))
+class TestPhoneInsight(unittest.TestCase):
+
+    def test_strict_without_the_database(self):
+        with patch("uscodekit.services.geo._geo_index", None), patch(
+            "uscodekit.configs.GeoConfig.encrypted_database_fp", "/nonexistent/geo.gz"
+        ), patch("uscodekit.shared.file._missing_reported", True):
+            # any area code of the NXX form, rather than only the toll-free ones
+            self.assertTrue(is_valid_phone("212-495-1000", strict=True))
+            self.assertFalse(is_valid_phone("(123) 456-7890", strict=True))
+            self.assertFalse(is_valid_phone("617-911-1000", strict=True))
+
+    def test_is_valid_phone_strict(self):
+        self.assertTrue(is_valid_phone("(617) 495-1000", strict=True))
+        self.assertTrue(is_valid_phone("+1 907-835-4321", strict=True))
+        self.assertTrue(is_valid_phone("800-275-8777", strict=True))  # toll-free
+        self.assertFalse(is_valid_phone("(123) 456-7890", strict=True))  # NPA starts with 1
+        self.assertFalse(is_valid_phone("411-495-1000", strict=True))  # N11 NPA
+        self.assertFalse(is_valid_phone("212-495-1000", strict=True))  # not in the database
+        self.assertFalse(is_valid_phone("617-095-1000", strict=True))  # exchange starts with 0
+        self.assertFalse(is_valid_phone("617-911-1000", strict=True))  # N11 exchange
+        self.assertFalse(is_valid_phone("617-495-100", strict=True))
+
+    def test_extract_phone_numbers_strict(self):
+        text = "Call (123) 456-7890, 617-911-1000 or +1 (617) 495-1000; fax 907.835.4321."
+        self.assertEqual(
+            extract_phone_numbers(text, strict=True), ["(617) 495-1000", "(907) 835-4321"]
+        )
+        self.assertEqual(extract_phone_number(text, strict=True), "(617) 495-1000")
+        self.assertIsNone(extract_phone_number("Call (123) 456-7890", strict=True))
+
+    def test_scan_file(self):
+        text = "Call (123) 456-7890, 617-911-1000 or +1 (617) 495-1000;\nfax 907.835.4321.\n" * 50
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "contacts.txt")
+            with open(file_path, "w") as f:
+                f.write(text)
+
+            found = list(scan_file(file_path, chunk_size=16))
+            self.assertEqual([phone for _, _, phone in found], extract_phone_numbers(text))
+            start, end, phone = found[2]
+            self.assertEqual(text[start:end], "+1 (617) 495-1000")
+            self.assertEqual(phone, "(617) 495-1000")
+
+            strict = [phone for _, _, phone in scan_file(file_path, strict=True)]
+            self.assertEqual(strict, extract_phone_numbers(text, strict=True))
+
+    def test_extract_phone_numbers_many(self):
+        texts = [f"Call 617-495-{1000 + i} or (123) 456-7890" for i in range(50)] + [""]
+        for workers in (1, 2):
+            results = list(extract_phone_numbers_many(texts, workers=workers, chunksize=8))
+            self.assertEqual(results, [extract_phone_numbers(text) for text in texts])
+        strict = list(extract_phone_numbers_many(texts, strict=True, workers=2, chunksize=8))
+        self.assertEqual(strict, [extract_phone_numbers(text, strict=True) for text in texts])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = []
+            for i, text in enumerate(texts[:5]):
+                paths.append(os.path.join(tmp_dir, f"{i}.txt"))
+                with open(paths[-1], "w") as f:
+                    f.write(text)
+            results = list(extract_phone_numbers_many(paths, paths=True, workers=2, chunksize=2))
+            self.assertEqual(results, [extract_phone_numbers(text) for text in texts[:5]])
+
+    def test_phone_number_insight_cache(self):
+        self.assertIsNone(insight_cache_info())
+        enable_insight_cache(maxsize=2)
+        try:
+            first = phone_number_insight("617-495-1000")
+            self.assertIs(phone_number_insight("+1 (617) 495-1000"), first)
+            self.assertEqual(first["city"], "Cambridge")
+            unknown = phone_number_insight("212-555-0100")
+            self.assertIs(phone_number_insight("2125550100"), unknown)
+            self.assertEqual(unknown["city"], "")
+            phone_number_insight("907-835-4321")  # evicts 617-495-1000
+            self.assertEqual(phone_number_insight("6174951000"), first)
+            self.assertEqual(
+                insight_cache_info(),
+                {"hits": 2, "misses": 4, "evictions": 2, "size": 2, "maxsize": 2},
+            )
+            with patch("uscodekit.services.geo._geo_index", GeoIndex(SAMPLE_RECORDS[:1])):
+                # the database was reloaded: entries of the previous index are dropped
+                self.assertEqual(phone_number_insight("617-495-1000")["city"], "")
+        finally:
+            disable_insight_cache()
+        self.assertIsNone(insight_cache_info())
+
+    def test_phone_number_insight(self):
+        info = phone_number_insight("+1 617-495-1000")
+        self.assertEqual(info["phone"], "(617) 495-1000")
+        self.assertEqual(info["areaCode"], "617")
+        self.assertEqual(info["city"], "Cambridge")
+
+    def test_phone_number_insight_shares_area_code_details(self):
+        first = phone_number_insight("617-495-1000")
+        second = phone_number_insight("617-555-0199")
+        self.assertEqual(second.phone, "(617) 555-0199")
+        self.assertIs(first.location, second.location)
+        self.assertEqual(first.to_dict(), {**second.to_dict(), "phone": "(617) 495-1000"})
+        with self.assertRaises(AttributeError):
+            first.city = "Boston"
+
+    def test_phone_number_insight_many_matches_single(self):
+        phones = ["617-495-1000", "(907) 200-1234", "212 555 0100"]
+        self.assertEqual(
+            phone_number_insight_many(phones),
+            [phone_number_insight(p) for p in phones],
+        )
+
+    def test_phone_number_insight_many_dedupes(self):
+        results = phone_number_insight_many(["6174951000", "9072001234", "6174951000"])
+        self.assertEqual([r["areaCode"] for r in results], ["617", "907", "617"])
+        self.assertIs(results[0], results[2])
+
+    def test_phone_number_insight_many_invalid(self):
+        with self.assertRaises(ValueError):
+            phone_number_insight_many(["6174951000", "123-45-789"])
+        results = phone_number_insight_many(["123-45-789", "6174951000"], skip_invalid=True)
+        self.assertIsNone(results[0])
+        self.assertEqual(results[1]["city"], "Cambridge")
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+@patch("uscodekit.services.geo._geo_index", GeoIndex(SAMPLE_RECORDS))
+class TestNormalizeMany(unittest.TestCase):
+
+    PHONES = [
+        "(617) 495-1000",
+        "+1 907.835.4321",
+        "1-012-345-6789",
+        "2-123-456-7890",
+        "617-495-100",
+        "",
+        "call me",
+        "１２３4567890",
+    ]
+
+    def test_numbers(self):
+        numbers, valid = normalize_many(self.PHONES, block_size=3)
+        self.assertEqual(numbers.dtype, np.uint64)
+        self.assertEqual(
+            numbers.tolist(), [6174951000, 9078354321, 123456789, 0, 0, 0, 0, 0]
+        )
+        self.assertEqual(valid.tolist(), [True, True, True] + [False] * 5)
+
+    def test_matches_cleaned_phone(self):
+        phones = self.PHONES + ["+1 (617) 495-1000 ext. 12", "16174951000", "26174951000"]
+        numbers, valid = normalize_many(np.array(phones))
+        for phone, number, is_valid in zip(phones, numbers.tolist(), valid.tolist()):
+            try:
+                expected = int(cleaned_phone(phone))
+            except ValueError:
+                expected = None
+            if not phone.isascii():
+                expected = None  # only ASCII digits are recognized
+            self.assertEqual(number if is_valid else None, expected, phone)
+
+    def test_e164(self):
+        strings, valid = normalize_many(self.PHONES[:4], e164=True)
+        self.assertEqual(strings.tolist(), ["+16174951000", "+19078354321", "+10123456789", ""])
+        self.assertEqual(valid.tolist(), [True, True, True, False])
+
+    def test_strict(self):
+        numbers, valid = normalize_many(self.PHONES[:3] + ["617-911-1000"], strict=True)
+        self.assertEqual(numbers.tolist(), [6174951000, 9078354321, 0, 0])
+        self.assertEqual(valid.tolist(), [True, True, False, False])
+
+    def test_empty(self):
+        numbers, valid = normalize_many([])
+        self.assertEqual((numbers.shape, valid.shape), ((0,), (0,)))
+
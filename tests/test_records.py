@@ -0,0 +1,104 @@
+import pickle
+
+import pytest
+
+from uscodekit.records import (
+    UNKNOWN_LOCATION,
+    UNKNOWN_TIMEZONE,
+    AreaCodeInfo,
+    Location,
+    NaicsCode,
+    Timezone,
+    ZipInfo,
+)
+
+
+def zip_info():
+    return ZipInfo(
+        "02138", "617", "Cambridge", "Massachusetts", "MA",
+        Location(42.372, -71.1137), Timezone("EST", "UTC-5"),
+    )
+
+
+def test_record_reads_like_a_dict():
+    info = zip_info()
+    assert info["city"] == info.city == "Cambridge"
+    assert info.get("county", "") == ""
+    assert list(info) == ["zipCode", "areaCode", "city", "state", "stateISO", "location", "timezone"]
+    assert len(info) == 7
+    assert info == {
+        "zipCode": "02138",
+        "areaCode": "617",
+        "city": "Cambridge",
+        "state": "Massachusetts",
+        "stateISO": "MA",
+        "location": {"latitude": 42.372, "longitude": -71.1137},
+        "timezone": {"name": "EST", "offset": "UTC-5"},
+    }
+    with pytest.raises(KeyError):
+        info["county"]
+
+
+def test_record_is_immutable():
+    info = zip_info()
+    with pytest.raises(AttributeError):
+        info.city = "Boston"
+    with pytest.raises(AttributeError):
+        del info.city
+    with pytest.raises(AttributeError):
+        info.county = "Middlesex"
+    with pytest.raises(TypeError):
+        info["city"] = "Boston"
+    with pytest.raises(TypeError):
+        Location(42.372)
+
+
+def test_to_dict_returns_a_mutable_copy():
+    info = zip_info()
+    copy = info.to_dict()
+    assert type(copy) is dict and type(copy["location"]) is dict
+    assert copy == info
+    copy["location"]["latitude"] = 0
+    assert info.location.latitude == 42.372
+
+
+def test_replace_shares_nested_records():
+    record = AreaCodeInfo("", "617", "Cambridge", "Massachusetts", "MA", "02138",
+                          UNKNOWN_LOCATION, UNKNOWN_TIMEZONE)
+    info = record.replace(phone="(617) 495-1000")
+    assert info.phone == "(617) 495-1000" and record.phone == ""
+    assert info.timezone is record.timezone
+    assert UNKNOWN_TIMEZONE == {"name": "", "offset": ""}
+
+
+def test_records_pickle():
+    info = zip_info()
+    assert pickle.loads(pickle.dumps(info)) == info
+    code = NaicsCode.from_dict({"code": "111", "title": "Crop Production", "level": 3})
+    assert pickle.loads(pickle.dumps(code)).to_dict() == code.to_dict()
+
+
+def test_naics_code_freezes_nested_values():
+    record = {"code": "111", "title": "Crop Production", "examples": ["Wheat"], "meta": {"tags": ["a"]}}
+    code = NaicsCode.from_dict(record)
+    assert code == record
+    assert code["examples"] == ("Wheat",)
+    with pytest.raises(TypeError):
+        code["meta"]["tags"] = []
+    copy = code.to_dict()
+    copy["examples"].append("Corn")
+    copy["meta"]["tags"].append("b")
+    assert code.to_dict() == record
+    assert pickle.loads(pickle.dumps(code)) == record
+
+
+def test_naics_code_keeps_extra_fields():
+    code = NaicsCode.from_dict({"code": "111", "title": "Crop Production", "level": 3})
+    assert code.code == "111" and code["title"] == "Crop Production"
+    assert code["level"] == 3
+    assert dict(code) == {"code": "111", "title": "Crop Production", "level": 3}
+    assert NaicsCode("11", "Agriculture") == {"code": "11", "title": "Agriculture"}
+    with pytest.raises(AttributeError):
+        code.title = "Crops"
+    with pytest.raises(KeyError):
+        code["description"]
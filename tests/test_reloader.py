@@ -0,0 +1,144 @@
+import gzip
+import json
+import os
+import threading
+
+import pytest
+from cryptography.fernet import Fernet
+
+import uscodekit
+from uscodekit.configs import Config, GeoConfig, NAICS2022Config
+from uscodekit.reloader import DatasetWatcher
+from uscodekit.services import geo, naics
+from uscodekit.services.naics import NAICS2022Service
+from uscodekit.shared.jsonfile import encrypt
+
+from tests.sample_data import SAMPLE_RECORDS
+
+
+NEW_RECORD = {
+    "npa": "212",
+    "zipCode": "10001",
+    "city": "New York",
+    "state": "New York",
+    "stateISO": "NY",
+    "location": {"latitude": 40.7506, "longitude": -73.9972},
+}
+
+
+def bump_mtime(file_path):
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def key(tmp_path, monkeypatch):
+    key = Fernet.generate_key()
+    key_fp = tmp_path / "encryption.key"
+    key_fp.write_bytes(key)
+    monkeypatch.setattr(Config, "encryption_key_fp", key_fp)
+    return key
+
+
+@pytest.fixture
+def geo_files(tmp_path, monkeypatch, key):
+    db_fp = tmp_path / "geo.gz"
+    monkeypatch.setattr(GeoConfig, "encrypted_database_fp", db_fp)
+    monkeypatch.setattr(GeoConfig, "snapshot_fp", tmp_path / "geo.snapshot")
+    for name in ("_geo_index", "_geo_source", "_geo_digest"):
+        monkeypatch.setattr(geo, name, None)
+
+    def write(records):
+        with gzip.open(db_fp, "wb") as f:
+            f.write(Fernet(key).encrypt(json.dumps(records).encode("utf-8")))
+        bump_mtime(db_fp)
+
+    write(SAMPLE_RECORDS)
+    return db_fp, write
+
+
+def test_geo_reload(geo_files):
+    db_fp, write = geo_files
+    assert uscodekit.reload(["geo"]) == {"geo": False}  # never loaded
+
+    old = geo.get_geo_index()
+    old.postings
+    assert uscodekit.reload(["geo"]) == {"geo": False}  # unchanged
+
+    # touched after the first load: neither reloaded nor written to a new snapshot
+    snapshot = os.stat(GeoConfig.snapshot_fp).st_mtime_ns
+    bump_mtime(db_fp)
+    assert uscodekit.reload(["geo"]) == {"geo": False}
+    assert geo.get_geo_index() is old
+    assert os.stat(GeoConfig.snapshot_fp).st_mtime_ns == snapshot
+
+    write(SAMPLE_RECORDS + [NEW_RECORD])
+    assert uscodekit.reload(["geo"]) == {"geo": True}
+    new = geo.get_geo_index()
+    assert new is not old
+    assert new.zip_code_info("10001")["city"] == "New York"
+    # the secondary indexes were built before the swap
+    assert new._postings is not None
+    assert new._city_search is not None
+    # lookups holding the previous index keep working on it
+    assert old.zip_code_info("10001") == {}
+    assert old.zip_code_info("99686")["city"] == "Valdez"
+
+    # a file that is only touched is not reloaded
+    bump_mtime(db_fp)
+    assert uscodekit.reload(["geo"]) == {"geo": False}
+    assert geo.get_geo_index() is new
+
+
+def test_geo_reload_keeps_serving_on_a_broken_file(geo_files):
+    db_fp, _ = geo_files
+    index = geo.get_geo_index()
+    db_fp.write_bytes(b"not gzip")
+    bump_mtime(db_fp)
+    assert geo.reload_geo_index() is False
+    assert geo.get_geo_index() is index
+
+
+def test_naics_reload(tmp_path, monkeypatch, key):
+    db_fp = tmp_path / "naics.bin"
+    monkeypatch.setattr(NAICS2022Config, "encrypted_database_fp", db_fp)
+    for name in ("_database", "_database_source", "_database_digest"):
+        monkeypatch.setattr(naics, name, None)
+    encrypt(db_fp, [{"code": "11", "title": "Agriculture"}], key)
+
+    service = NAICS2022Service()
+    assert service.industry_name("11") == "Agriculture"
+    assert uscodekit.reload(["naics"]) == {"naics": False}
+    database = naics.get_database()
+    bump_mtime(db_fp)
+    assert uscodekit.reload(["naics"]) == {"naics": False}
+    assert naics.get_database() is database
+
+    encrypt(db_fp, [{"code": "11", "title": "Farming"}], key)
+    bump_mtime(db_fp)
+    assert uscodekit.reload(["naics"]) == {"naics": True}
+    assert service.industry_name("11") == "Farming"
+
+
+def test_watch(monkeypatch):
+    checked = threading.Event()
+    calls = []
+
+    def reload_geo_index():
+        calls.append(threading.current_thread())
+        checked.set()
+        return False
+
+    monkeypatch.setattr(geo, "reload_geo_index", reload_geo_index)
+    watcher = uscodekit.watch(interval=0.01, datasets=["geo"])
+    assert checked.wait(5)
+    watcher.stop()
+    assert not watcher.is_alive()
+    assert calls[0] is watcher
+
+
+def test_unknown_dataset():
+    with pytest.raises(ValueError):
+        uscodekit.reload(["counties"])
+    with pytest.raises(ValueError):
+        DatasetWatcher(datasets=["counties"])
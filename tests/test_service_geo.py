@@ -1,7 +1,9 @@
 import json
 import pytest
 from unittest.mock import patch, mock_open
-from uscodekit.services.geo import GeoService, get_cached_database
+from uscodekit.services.geo import GeoIndex, GeoService, get_cached_database
+
+from tests.sample_data import SAMPLE_RECORDS
 
 
 class MockConfig:
@@ -124,3 +126,149 @@ def test_get_phone_info(geo_service):
 #         assert result["location"]["longitude"] == -146.3572
 #         assert result["timezone"]["name"] == "AKST"
 #         assert result["timezone"]["offset"] == "UTC-9"
+
+
+@pytest.fixture
+def sample_index(monkeypatch):
+    index = GeoIndex(SAMPLE_RECORDS)
+    monkeypatch.setattr("uscodekit.services.geo._geo_index", index)
+    return index
+
+
+def test_geo_index_lookups():
+    index = GeoIndex(SAMPLE_RECORDS)
+    assert index.zip_code_info("99901")["city"] == "Ketchikan"
+    # the first record of an area code wins, like the previous linear scan
+    assert index.area_code_info("907")["zipCode"] == "99686"
+    assert index.zip_code_info("1234") == {}
+    assert index.area_code_info("abc") == {}
+
+
+def test_geo_index_is_shared(sample_index):
+    assert GeoService().index is GeoService().index is sample_index
+    assert GeoService().database == SAMPLE_RECORDS
+    # materialized once, then shared
+    assert GeoService().database is GeoService().database
+
+
+def test_get_zip_code_info_indexed(sample_index, geo_service):
+    assert geo_service.get_zip_code_info("02138")["city"] == "Cambridge"
+    assert geo_service.get_zip_code_info("00000") == {}
+
+
+def test_get_phone_info_indexed(sample_index, geo_service):
+    assert geo_service.get_phone_info("617")["zipCode"] == "02138"
+    assert geo_service.get_phone_info("123") == {}
+
+
+def test_stream_database(tmp_path, monkeypatch):
+    import gzip
+    from cryptography.fernet import Fernet
+    from uscodekit.configs import Config, GeoConfig
+    from uscodekit.services.geo import stream_database
+
+    key = Fernet.generate_key()
+    key_fp = tmp_path / "encryption.key"
+    key_fp.write_bytes(key)
+    db_fp = tmp_path / "geo.gz"
+    with gzip.open(db_fp, "wb") as f:
+        f.write(Fernet(key).encrypt(json.dumps(SAMPLE_RECORDS).encode("utf-8")))
+    monkeypatch.setattr(Config, "encryption_key_fp", key_fp)
+    monkeypatch.setattr(GeoConfig, "encrypted_database_fp", db_fp)
+
+    assert stream_database() == SAMPLE_RECORDS
+    # nothing but the inputs is left on disk
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["encryption.key", "geo.gz"]
+
+    monkeypatch.setattr(Config, "encryption_key_fp", tmp_path / "missing.key")
+    assert stream_database() == []
+
+
+def test_get_geo_index_cold_start_loads_once(tmp_path, monkeypatch):
+    import threading
+    import time
+    from uscodekit.configs import GeoConfig
+    from uscodekit.services import geo
+    from uscodekit.services.geo_store import GeoStore
+
+    db_fp = tmp_path / "geo.gz"
+    db_fp.write_bytes(b"")
+    monkeypatch.setattr(GeoConfig, "encrypted_database_fp", db_fp)
+    monkeypatch.setattr(geo, "_geo_index", None)
+    loads = []
+
+    def slow_load():
+        loads.append(threading.current_thread())
+        time.sleep(0.1)
+        return GeoStore.from_records(SAMPLE_RECORDS)
+
+    monkeypatch.setattr(geo, "load_geo_store", slow_load)
+
+    count = 32
+    barrier = threading.Barrier(count)
+    indexes = [None] * count
+
+    def worker(i):
+        barrier.wait()
+        indexes[i] = geo.get_geo_index()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert all(index is indexes[0] for index in indexes)
+    assert indexes[0].zip_code_info("99686")["city"] == "Valdez"
+    assert geo.get_geo_index() is indexes[0]
+    # the secondary indexes were built with the database
+    assert indexes[0]._spatial is not None
+    assert indexes[0]._city_search is not None
+
+
+@pytest.mark.parametrize("name", ["spatial", "postings", "city_search", "zip_bitmap", "nanp"])
+def test_secondary_index_builds_once(name, monkeypatch):
+    import threading
+    import time
+    from types import SimpleNamespace
+    from uscodekit.services import geo
+
+    builds = []
+
+    def slow(build):
+        def wrapper(store):
+            builds.append(store)
+            time.sleep(0.1)
+            return build(store)
+
+        return wrapper
+
+    if name == "spatial":
+        monkeypatch.setattr(geo, "SpatialIndex", slow(geo.SpatialIndex))
+    elif name == "postings":
+        monkeypatch.setattr(geo, "PostingIndex", slow(geo.PostingIndex))
+    elif name == "city_search":
+        monkeypatch.setattr(geo, "CitySearchIndex", slow(geo.CitySearchIndex))
+    else:
+        factory = {"zip_bitmap": "ZipCodeBitmap", "nanp": "NanpTables"}[name]
+        from_store = getattr(geo, factory).from_store
+        monkeypatch.setattr(geo, factory, SimpleNamespace(from_store=slow(from_store)))
+
+    index = GeoIndex(SAMPLE_RECORDS)
+    count = 16
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(i):
+        barrier.wait()
+        results[i] = getattr(index, name)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert all(result is results[0] is getattr(index, name) for result in results)
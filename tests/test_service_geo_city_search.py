@@ -0,0 +1,108 @@
+import random
+
+import pytest
+
+from uscodekit.services.geo_store import GeoStore
+from uscodekit.services.geo_postings import PostingIndex
+from uscodekit.services.geo_city_search import (
+    CitySearchIndex,
+    levenshtein,
+    max_edits,
+    normalize_city,
+)
+
+from tests.sample_data import SAMPLE_RECORDS
+
+
+def city(zip_code, name, state, state_iso):
+    return {"zipCode": zip_code, "city": name, "state": state, "stateISO": state_iso}
+
+
+@pytest.fixture
+def search():
+    records = SAMPLE_RECORDS + [
+        city("94102", "San Francisco", "California", "CA"),
+        city("94103", "San Francisco", "California", "CA"),
+        city("63101", "St. Louis", "Missouri", "MO"),
+        city("63102", "Saint Louis", "Missouri", "MO"),
+        city("49880", "Rock", "Michigan", "MI"),
+        city("02139", "Cambridge", "Massachusetts", "MA"),
+        city("05444", "Cambridge", "Vermont", "VT"),
+    ]
+    return CitySearchIndex(PostingIndex(GeoStore.from_records(records)))
+
+
+def matches(search, *args, **kwargs):
+    return [
+        (search.labels[entry][0], search.labels[entry][2], distance)
+        for distance, entry in search.search(*args, **kwargs)
+    ]
+
+
+def edit_distance(a, b):
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+            )
+        previous = current
+    return previous[-1]
+
+
+def test_levenshtein_matches_dynamic_programming():
+    rng = random.Random(0)
+    for _ in range(2000):
+        a = "".join(rng.choice("ab ") for _ in range(rng.randint(0, 12)))
+        b = "".join(rng.choice("ab ") for _ in range(rng.randint(0, 12)))
+        expected = edit_distance(a, b)
+        assert levenshtein(a, b) == expected
+        assert levenshtein(a, b, 2) == expected if expected <= 2 else levenshtein(a, b, 2) > 2
+
+
+def test_normalize_city():
+    assert normalize_city("St. Louis") == "saint louis"
+    assert normalize_city("  FT   Worth ") == "fort worth"
+    assert normalize_city("Mt. Pleasant") == "mount pleasant"
+    assert normalize_city("...") == ""
+
+
+def test_max_edits():
+    assert [max_edits(n) for n in (2, 3, 5, 6, 20)] == [0, 1, 1, 2, 2]
+
+
+def test_misspelled(search):
+    assert matches(search, "Sn Fransisco") == [("San Francisco", "CA", 2)]
+    assert matches(search, "ketchikn") == [("Ketchikan", "AK", 1)]
+
+
+def test_abbreviations_share_an_entry(search):
+    assert matches(search, "St Louis") == [("St. Louis", "MO", 0)]
+    assert matches(search, "saint louis") == [("St. Louis", "MO", 0)]
+    (_, entry), = search.search("St Louis")
+    column = search.postings.store.column("zipCode")
+    assert [column[row] for row in search.rows(entry)] == ["63101", "63102"]
+
+
+def test_ranking_and_state(search):
+    # the Massachusetts entry has more zip codes
+    assert matches(search, "Cambrige") == [("Cambridge", "MA", 1), ("Cambridge", "VT", 1)]
+    assert matches(search, "Cambrige", state="Vermont") == [("Cambridge", "VT", 1)]
+    assert matches(search, "Cambrige", state="CA") == []
+    assert matches(search, "Cambrige", top_n=1) == [("Cambridge", "MA", 1)]
+
+
+def test_no_match(search):
+    assert matches(search, "Anchorage") == []
+    # short names tolerate fewer typos
+    assert matches(search, "Rok") == [("Rock", "MI", 1)]
+    assert matches(search, "Ro") == []
+    assert matches(search, "") == []
+    assert matches(search, "Valdez", top_n=0) == []
+
+
+def test_empty_store():
+    search = CitySearchIndex(PostingIndex(GeoStore.from_records([])))
+    assert len(search) == 0
+    assert search.search("Valdez") == []
@@ -0,0 +1,31 @@
+from uscodekit.services.geo import GeoIndex
+from uscodekit.services.geo_nanp import TOLL_FREE_AREA_CODES, VALID_EXCHANGES, NanpTables
+
+from tests.sample_data import SAMPLE_RECORDS
+
+
+def test_exchange_rules():
+    assert sum(VALID_EXCHANGES) == 800 - 8
+    for code in (0, 99, 100, 199, 211, 411, 911):
+        assert not VALID_EXCHANGES[code]
+    for code in (200, 210, 212, 555, 999):
+        assert VALID_EXCHANGES[code]
+
+
+def test_area_codes():
+    tables = NanpTables([617, 111, 411, 907])
+    assert tables.is_valid("6174951000")
+    assert tables.is_valid("9072001000")
+    assert not tables.is_valid("1114951000")  # not an NXX code
+    assert not tables.is_valid("4114951000")
+    assert not tables.is_valid("2124951000")  # not assigned
+    assert not tables.is_valid("6171234567")
+    assert all(tables.area_codes[code] for code in TOLL_FREE_AREA_CODES)
+
+
+def test_tables_from_store():
+    tables = GeoIndex(SAMPLE_RECORDS).nanp
+    assigned = {int(record["npa"]) for record in SAMPLE_RECORDS}
+    assert {code for code in range(1000) if tables.area_codes[code]} == assigned | set(
+        TOLL_FREE_AREA_CODES
+    )
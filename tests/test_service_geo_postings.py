@@ -0,0 +1,59 @@
+import pytest
+
+from uscodekit.services.geo_store import GeoStore
+from uscodekit.services.geo_postings import AREA_CODE, CITY, STATE, TIMEZONE, PostingIndex
+
+from tests.sample_data import SAMPLE_RECORDS
+
+
+@pytest.fixture
+def postings():
+    records = SAMPLE_RECORDS + [
+        {"npa": "617", "zipCode": "02139", "city": "Cambridge", "state": "Massachusetts",
+         "stateISO": "MA", "timezone": {"name": "EST", "offset": "UTC-5"}},
+        {"npa": "907", "zipCode": "00501", "city": "Valdez", "state": "Alaska", "stateISO": "AK"},
+        # a duplicate zip code is only indexed through its first row
+        {"npa": "212", "zipCode": "02138", "city": "Elsewhere", "stateISO": "NY"},
+    ]
+    return PostingIndex(GeoStore.from_records(records))
+
+
+def zips(postings, *args):
+    column = postings.store.column("zipCode")
+    return [column[row] for row in postings.rows(*args)]
+
+
+def test_area_code(postings):
+    assert zips(postings, AREA_CODE, "907") == ["00501", "99686", "99901"]
+    assert zips(postings, AREA_CODE, "617") == ["02138", "02139"]
+    assert zips(postings, AREA_CODE, "212") == []
+
+
+def test_state_by_code_or_name(postings):
+    assert zips(postings, STATE, "AK") == ["00501", "99686", "99901"]
+    assert zips(postings, STATE, "alaska") == ["00501", "99686", "99901"]
+    assert zips(postings, STATE, " ma ") == ["02138", "02139"]
+    assert zips(postings, STATE, "NY") == []
+
+
+def test_city(postings):
+    assert zips(postings, CITY, "cambridge", "Massachusetts") == ["02138", "02139"]
+    assert zips(postings, CITY, "Valdez", "AK") == ["00501", "99686"]
+    assert zips(postings, CITY, "Valdez", "MA") == []
+    with pytest.raises(ValueError):
+        postings.rows(CITY, "Valdez")
+
+
+def test_timezone(postings):
+    assert zips(postings, TIMEZONE, "est") == ["02138", "02139"]
+    assert postings.count(TIMEZONE, "AKST") == 2
+
+
+def test_unknown_kind(postings):
+    with pytest.raises(ValueError):
+        postings.rows("county", "Middlesex")
+
+
+def test_empty_store():
+    postings = PostingIndex(GeoStore.from_records([]))
+    assert postings.count(STATE, "MA") == 0
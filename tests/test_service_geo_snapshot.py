@@ -0,0 +1,97 @@
+import pytest
+
+from uscodekit.configs import GeoConfig
+from uscodekit.services import geo
+from uscodekit.services.geo_store import GeoStore, MISSING
+from uscodekit.services.geo_snapshot import (
+    SnapshotCategories,
+    is_snapshot_fresh,
+    open_snapshot,
+    read_manifest,
+    source_signature,
+    write_snapshot,
+)
+
+from tests.sample_data import SAMPLE_RECORDS
+
+
+@pytest.fixture
+def snapshot_fp(tmp_path):
+    fp = tmp_path / "geo.snapshot"
+    write_snapshot(GeoStore.from_records(SAMPLE_RECORDS), str(fp))
+    return fp
+
+
+def test_round_trip(snapshot_fp):
+    store = open_snapshot(str(snapshot_fp))
+    assert list(store.records()) == SAMPLE_RECORDS
+    assert store.zip_code_row("99901") == 1
+    assert store.area_code_row("617") == 2
+
+
+def test_columns_are_zero_copy(snapshot_fp):
+    store = open_snapshot(str(snapshot_fp))
+    assert isinstance(store.column("zipCode").values, memoryview)
+    assert isinstance(store.column("location.latitude").values, memoryview)
+    assert isinstance(store.column("city").categories, SnapshotCategories)
+    assert isinstance(store.zip_rows, memoryview)
+    assert store.column("stateISO").code_of("MA") == 1
+
+
+def test_irregular_values_round_trip(tmp_path):
+    records = [
+        {"zipCode": "1234", "npa": 212, "location": {"latitude": ""}},
+        {"zipCode": "12345", "city": None, "extra": {"n": 1}, "aliases": ["X", "Y"]},
+        {"zipCode": "99686", "location": {"latitude": "61.1380", "longitude": -146.3572}},
+    ]
+    fp = tmp_path / "geo.snapshot"
+    write_snapshot(GeoStore.from_records(records), str(fp))
+    store = open_snapshot(str(fp))
+    assert list(store.records()) == records
+    assert store.zip_code_row("1234") == 0
+    assert store.column("city")[0] is MISSING
+
+
+def test_to_numpy_from_snapshot(snapshot_fp):
+    np = pytest.importorskip("numpy")
+    store = open_snapshot(str(snapshot_fp))
+    assert store.to_numpy("npa").tolist() == [907, 907, 617]
+    assert store.to_numpy("stateISO").tolist() == ["AK", "AK", "MA"]
+
+
+def test_invalid_snapshot(tmp_path):
+    fp = tmp_path / "geo.snapshot"
+    fp.write_bytes(b"not a snapshot at all")
+    assert read_manifest(str(fp)) is None
+    with pytest.raises(ValueError):
+        open_snapshot(str(fp))
+
+
+def test_freshness(tmp_path):
+    source_fp = tmp_path / "geo.gz"
+    source_fp.write_bytes(b"v1")
+    source = source_signature(str(source_fp))
+    fp = tmp_path / "geo.snapshot"
+    assert not is_snapshot_fresh(str(fp), source)
+
+    write_snapshot(GeoStore.from_records(SAMPLE_RECORDS), str(fp), source)
+    assert is_snapshot_fresh(str(fp), source)
+
+    source_fp.write_bytes(b"version 2")
+    assert not is_snapshot_fresh(str(fp), source_signature(str(source_fp)))
+
+
+def test_load_geo_store_writes_and_maps_snapshot(tmp_path, monkeypatch):
+    source_fp = tmp_path / "geo.gz"
+    source_fp.write_bytes(b"encrypted")
+    monkeypatch.setattr(GeoConfig, "encrypted_database_fp", source_fp)
+    monkeypatch.setattr(GeoConfig, "snapshot_fp", tmp_path / "geo.snapshot")
+    monkeypatch.setattr(geo, "stream_database", lambda: SAMPLE_RECORDS)
+
+    store = geo.load_geo_store()
+    assert store.mapping is not None
+    assert list(store.records()) == SAMPLE_RECORDS
+
+    # a fresh snapshot is mapped without touching the database again
+    monkeypatch.setattr(geo, "stream_database", lambda: pytest.fail("reloaded"))
+    assert list(geo.load_geo_store().records()) == SAMPLE_RECORDS
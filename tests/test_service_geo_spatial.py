@@ -0,0 +1,98 @@
+import random
+import pytest
+
+from uscodekit.services.geo_store import GeoStore
+from uscodekit.services.geo_spatial import SpatialIndex, haversine_miles
+
+from tests.sample_data import SAMPLE_RECORDS
+
+
+def random_records(size=600, seed=11):
+    rng = random.Random(seed)
+    records = []
+    for zc in rng.sample(range(1000, 99999), size):
+        records.append(
+            {
+                "zipCode": f"{zc:05d}",
+                "location": {
+                    "latitude": round(rng.uniform(18.0, 71.0), 4),
+                    "longitude": round(rng.uniform(-170.0, -65.0), 4),
+                },
+            }
+        )
+    return records
+
+
+@pytest.fixture(scope="module")
+def spatial():
+    return SpatialIndex(GeoStore.from_records(random_records()), cell_size=1.0)
+
+
+def brute_force(spatial, lat, lon):
+    store = spatial.store
+    lats = store.column("location.latitude").values
+    lons = store.column("location.longitude").values
+    return sorted((haversine_miles(lat, lon, lats[r], lons[r]), r) for r in range(len(store)))
+
+
+def test_haversine_miles():
+    # Cambridge, MA to Valdez, AK
+    assert haversine_miles(42.372, -71.1137, 61.1381, -146.3572) == pytest.approx(3254, abs=5)
+    assert haversine_miles(40.0, -75.0, 40.0, -75.0) == 0
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_nearest_matches_brute_force(spatial, seed):
+    rng = random.Random(seed)
+    lat, lon, k = rng.uniform(15, 75), rng.uniform(-175, -60), rng.randint(1, 25)
+    assert spatial.nearest(lat, lon, k) == brute_force(spatial, lat, lon)[:k]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_within_matches_brute_force(spatial, seed):
+    rng = random.Random(seed)
+    lat, lon, radius = rng.uniform(15, 75), rng.uniform(-175, -60), rng.uniform(0, 400)
+    expected = [m for m in brute_force(spatial, lat, lon) if m[0] <= radius]
+    assert spatial.within(lat, lon, radius) == expected
+
+
+def test_in_bbox_matches_brute_force(spatial):
+    store = spatial.store
+    lats = store.column("location.latitude").values
+    lons = store.column("location.longitude").values
+    expected = [r for r in range(len(store)) if 30 <= lats[r] <= 40 and -100 <= lons[r] <= -90]
+    assert sorted(spatial.in_bbox(30, -100, 40, -90)) == expected
+    assert len(spatial.in_bbox(-90, -180, 90, 180)) == len(store)
+
+
+def test_far_away_and_edge_queries(spatial):
+    assert len(spatial.nearest(-45.0, 120.0, 3)) == 3
+    assert spatial.nearest(40.0, -100.0, 0) == []
+    assert len(spatial.nearest(40.0, -100.0, 10000)) == len(spatial)
+    with pytest.raises(ValueError):
+        spatial.within(40.0, -100.0, -1)
+    with pytest.raises(ValueError):
+        spatial.in_bbox(40, -100, 30, -90)
+
+
+def test_skips_rows_without_coordinates():
+    records = SAMPLE_RECORDS + [{"zipCode": "10001"}, {"zipCode": "99686", "location": {"latitude": 0.0, "longitude": 0.0}}]
+    spatial = SpatialIndex(GeoStore.from_records(records))
+    # the duplicate 99686 row is not indexed; the zip code resolves to the first row
+    assert len(spatial) == 3
+    assert SpatialIndex(GeoStore.from_records([])).nearest(0, 0, 1) == []
+
+
+def test_haversine_matrix_matches_scalar():
+    np = pytest.importorskip("numpy")
+    from uscodekit.services.geo_spatial import haversine_matrix
+
+    rng = random.Random(5)
+    a = [(rng.uniform(-80, 80), rng.uniform(-180, 180)) for _ in range(7)]
+    b = [(rng.uniform(-80, 80), rng.uniform(-180, 180)) for _ in range(5)] + [(np.nan, 0.0)]
+    matrix = haversine_matrix([p[0] for p in a], [p[1] for p in a], [p[0] for p in b], [p[1] for p in b])
+    assert matrix.shape == (7, 6)
+    for i, (lat1, lon1) in enumerate(a):
+        for j, (lat2, lon2) in enumerate(b[:-1]):
+            assert matrix[i, j] == pytest.approx(haversine_miles(lat1, lon1, lat2, lon2))
+    assert np.isnan(matrix[:, -1]).all()
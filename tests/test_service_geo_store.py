@@ -0,0 +1,111 @@
+import math
+import pytest
+
+from uscodekit.services.geo_store import (
+    MISSING,
+    CategoricalColumn,
+    FloatColumn,
+    GeoStore,
+    IntColumn,
+)
+
+from tests.sample_data import SAMPLE_RECORDS
+
+
+@pytest.fixture
+def store():
+    return GeoStore.from_records(SAMPLE_RECORDS)
+
+
+def test_round_trip(store):
+    assert len(store) == len(SAMPLE_RECORDS)
+    assert list(store.records()) == SAMPLE_RECORDS
+
+
+def test_column_types(store):
+    assert isinstance(store.column("zipCode"), IntColumn)
+    assert store.column("zipCode").values.tolist() == [99686, 99901, 2138]
+    assert store.column("zipCode")[2] == "02138"
+    assert isinstance(store.column("location.latitude"), FloatColumn)
+    state = store.column("stateISO")
+    assert isinstance(state, CategoricalColumn)
+    assert state.categories == ["AK", "MA"]
+    assert state.codes.tolist() == [0, 0, 1]
+    assert state.codes.typecode == "H"
+
+
+def test_coordinates_parsed_once():
+    records = [
+        {"zipCode": "10001", "location": {"latitude": "40.75", "longitude": ""}},
+        {"zipCode": "10002"},
+    ]
+    store = GeoStore.from_records(records)
+    assert store.record(0) == {
+        "zipCode": "10001",
+        "location": {"latitude": "40.75", "longitude": ""},
+    }
+    assert store.record(1) == {"zipCode": "10002"}
+    assert store.column("location.latitude").values[0] == 40.75
+    assert math.isnan(store.column("location.latitude").values[1])
+
+
+def test_coordinates_keep_their_text():
+    records = [
+        {"zipCode": "99686", "location": {"latitude": "61.1380", "longitude": "-146.3572"}},
+        {"zipCode": "02138", "location": {"latitude": "42", "longitude": " -71.11"}},
+        {"zipCode": "99901", "location": {"latitude": 55.3422, "longitude": "n/a"}},
+    ]
+    store = GeoStore.from_records(records)
+    assert list(store.records()) == records
+    latitudes = store.column("location.latitude")
+    assert latitudes.values.tolist() == [61.138, 42.0, 55.3422]
+    assert store.column("location.longitude").values[1] == -71.11
+    assert store.column("location.longitude").overflow == {1: " -71.11", 2: "n/a"}
+
+
+def test_unhashable_values_are_kept():
+    records = [
+        {"zipCode": "10001", "city": "New York", "aliases": ["NYC", "Manhattan"]},
+        {"zipCode": "10002", "aliases": "LES"},
+        {"zipCode": "10003"},
+    ]
+    store = GeoStore.from_records(records)
+    assert list(store.records()) == records
+    aliases = store.column("aliases")
+    assert aliases.overflow == {0: ["NYC", "Manhattan"]}
+    assert aliases[2] is MISSING
+    assert aliases.code_of("LES") == 1
+    assert aliases.code_of(["NYC"]) == -1
+
+
+def test_code_of():
+    store = GeoStore.from_records(SAMPLE_RECORDS)
+    assert store.column("stateISO").code_of("MA") == 1
+    assert store.column("stateISO").code_of("NY") == -1
+
+
+def test_irregular_values_are_kept():
+    records = [{"zipCode": "1234", "npa": 212}, {"zipCode": "12345-6789", "city": "X"}]
+    store = GeoStore.from_records(records)
+    assert list(store.records()) == records
+    assert store.zip_code_row("1234") == 0
+    assert store.zip_code_row("12345") == -1
+    assert store.column("city")[0] is MISSING
+
+
+def test_lookup_tables(store):
+    assert store.zip_code_row("02138") == 2
+    assert store.zip_code_row("00000") == -1
+    assert store.area_code_row("907") == 0
+    assert store.area_code_row("617") == 2
+    assert store.area_code_row("9") == -1
+
+
+def test_to_numpy(store):
+    np = pytest.importorskip("numpy")
+    zips = store.to_numpy("zipCode")
+    assert zips.dtype == np.uint32
+    assert zips.tolist() == [99686, 99901, 2138]
+    assert store.to_numpy("location.longitude")[2] == -71.1137
+    assert store.to_numpy("timezone.name").tolist() == ["AKST", "AKST", "EST"]
+    assert set(store.to_numpy()) == set(store.fields)
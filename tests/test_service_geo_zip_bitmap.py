@@ -0,0 +1,25 @@
+from uscodekit.services.geo import GeoIndex
+from uscodekit.services.geo_store import GeoStore
+from uscodekit.services.geo_zip_bitmap import ZipCodeBitmap
+
+from tests.sample_data import SAMPLE_RECORDS
+
+
+def test_bitmap_membership():
+    bitmap = ZipCodeBitmap([0, 7, 8, 99999])
+    assert len(bitmap.bits) == 12500
+    assert len(bitmap) == 4
+    for zip_code in ("00000", "00007", "00008", "99999", "00008-1234"):
+        assert zip_code in bitmap
+    for zip_code in ("00001", "00006", "00009", "99998", "0000", "000000", "00008-12", 8, None):
+        assert zip_code not in bitmap
+
+
+def test_bitmap_from_store():
+    index = GeoIndex(SAMPLE_RECORDS)
+    zip_codes = {record["zipCode"] for record in SAMPLE_RECORDS}
+    bitmap = index.zip_bitmap
+    assert bitmap is index.zip_bitmap
+    assert len(bitmap) == len(zip_codes)
+    assert all(zip_code in bitmap for zip_code in zip_codes)
+    assert len(ZipCodeBitmap.from_store(GeoStore.from_records([]))) == 0
@@ -0,0 +1,71 @@
+from uscodekit.records import NaicsCode
+from uscodekit.services.naics_index import CodeTrie, NaicsIndex
+
+
+RECORDS = [
+    NaicsCode.from_dict(record)
+    for record in [
+        {"code": "31-33", "title": "Manufacturing"},
+        {"code": "311", "title": "Food Manufacturing"},
+        {"code": "3111", "title": "Animal Food Manufacturing"},
+        {"code": "311111", "title": "Dog and Cat Food Manufacturing"},
+        {"code": "92", "title": "Public Administration"},
+        {"code": "921", "title": "Executive, Legislative, and Other General Government Support"},
+        {"code": "9211", "title": "Executive, Legislative, and Other General Government Support"},
+        {"code": "92113", "title": "Public Finance Activities"},
+        {"code": "921130", "title": "Public Finance Activities"},
+    ]
+]
+
+
+def test_get():
+    index = NaicsIndex(RECORDS)
+    assert index.get("921130") is RECORDS[8]
+    assert index.get("31-33") is RECORDS[0]
+    assert index.get("31") is None
+    assert index.get("000000") is None
+
+
+def test_levels_walk_up_the_trie():
+    trie = CodeTrie(RECORDS)
+    assert trie.levels("921130") == {
+        "sector": RECORDS[4],
+        "subsector": RECORDS[5],
+        "industry_group": RECORDS[6],
+        "naics_industry": RECORDS[7],
+        "national_industry": RECORDS[8],
+    }
+    # missing levels are left out, and a range of sectors is the sector of its codes
+    assert list(trie.levels("311111")) == ["sector", "subsector", "industry_group", "national_industry"]
+    assert trie.levels("311111")["sector"] is RECORDS[0]
+    assert trie.levels("55") == {}
+    assert trie.levels("3a1") == {}
+
+
+def test_hierarchy():
+    index = NaicsIndex(RECORDS)
+    hierarchy = index.hierarchy("9211")
+    assert list(hierarchy) == ["code", "title", "sector", "subsector", "industry_group"]
+    assert hierarchy["title"] == RECORDS[6].title
+    assert index.hierarchy("31-33") == {"code": "31-33", "title": "Manufacturing", "sector": RECORDS[0]}
+    assert index.hierarchy("99") is None
+
+
+def test_hierarchy_of_a_code_in_a_range_of_sectors():
+    # deliberate: the sector of a manufacturing code is the "31-33" range, which
+    # earlier versions left out because no "31" record exists
+    assert NaicsIndex(RECORDS).hierarchy("311") == {
+        "code": "311",
+        "title": "Food Manufacturing",
+        "sector": {"code": "31-33", "title": "Manufacturing"},
+        "subsector": {"code": "311", "title": "Food Manufacturing"},
+    }
+
+
+def test_with_prefix():
+    trie = CodeTrie(RECORDS)
+    assert [record.code for record in trie.with_prefix("92")] == ["92", "921", "9211", "92113", "921130"]
+    assert [record.code for record in trie.with_prefix("3")] == ["31-33", "311", "3111", "311111"]
+    assert [record.code for record in trie.with_prefix("32")] == []
+    assert list(trie.with_prefix("7")) == []
+    assert list(trie.with_prefix("Food")) == []
@@ -0,0 +1,78 @@
+from uscodekit.records import NaicsCode
+from uscodekit.services.naics_index import NaicsIndex
+from uscodekit.services.naics_search import TextSearchIndex, tokenize
+
+
+RECORDS = [
+    NaicsCode.from_dict(record)
+    for record in [
+        {"code": "52", "title": "Finance and Insurance"},
+        {"code": "5221", "title": "Depository Credit Intermediation"},
+        {"code": "92", "title": "Public Administration"},
+        {"code": "921", "title": "Executive, Legislative, and Other General Government Support"},
+        {"code": "92113", "title": "Public Finance Activities"},
+        {"code": "921130", "title": "Public Finance Activities"},
+        {"code": "923", "title": "Administration of Human Resource Programs"},
+        {
+            "code": "311111",
+            "title": "Dog and Cat Food Manufacturing",
+            "description": "Establishments manufacturing pet food from meat and grain.",
+        },
+    ]
+]
+
+
+def codes(results):
+    return [record.code for record in results]
+
+
+def test_tokenize():
+    assert tokenize("Executive, Legislative, and Other") == ["executive", "legislative", "and", "other"]
+    assert tokenize("Pet-food_MAKERS") == ["pet", "food", "makers"]
+
+
+def test_terms_expand_the_last_word():
+    index = TextSearchIndex(RECORDS)
+    assert index.terms("public fin") == ["public", "finance"]
+    assert index.terms("admin") == ["administration"]
+    assert index.terms("zzz") == []
+    assert index.terms("  ") == []
+
+
+def test_short_last_words_are_not_expanded():
+    index = TextSearchIndex(RECORDS)
+    assert index.terms("public f") == ["public"]
+    assert index.terms("dog an") == ["dog"]
+    assert index.terms("dog and") == ["dog", "and"]
+    assert index.terms("foo") == ["food"]
+    # words are matched on their start only
+    assert index.terms("anufact") == []
+
+
+def test_bm25_ranks_records_matching_more_and_rarer_words():
+    index = NaicsIndex(RECORDS)
+    # exact title matches come first, then records matching both words
+    assert codes(index.search("Public Finance Activities")) == ["92113", "921130", "92", "52"]
+    assert codes(index.search("public finance")) == ["92113", "921130", "92", "52"]
+    assert codes(index.search("administration", top_n=2)) == ["92", "923"]
+
+
+def test_descriptions_are_searched():
+    index = NaicsIndex(RECORDS)
+    assert codes(index.search("pet food")) == ["311111"]
+
+
+def test_code_matches_keep_their_boosts():
+    index = NaicsIndex(RECORDS)
+    assert codes(index.search("921130")) == ["921130"]
+    # prefix matches keep the order of the database
+    assert codes(index.search("92")) == ["92", "921", "92113", "921130", "923"]
+    assert codes(index.search("92", top_n=3)) == ["92", "921", "92113"]
+    assert codes(index.search("7")) == []
+
+
+def test_empty_queries():
+    index = NaicsIndex(RECORDS)
+    assert codes(index.search("", top_n=2)) == ["52", "5221"]
+    assert index.search("finance", top_n=0) == []
+    assert NaicsIndex([]).search("finance") == []
@@ -0,0 +1,44 @@
+import pytest
+
+from uscodekit.shared.cache import LRUCache
+
+
+def test_lru_eviction_and_counters():
+    cache = LRUCache(2)
+    owner = object()
+    computed = []
+
+    def get(key):
+        return cache.get_or_compute(owner, key, lambda: computed.append(key) or key.upper())
+
+    assert get("a") == "A"
+    assert get("b") == "B"
+    assert get("a") == "A"  # hit: "a" is now the most recently used
+    assert get("c") == "C"  # evicts "b"
+    assert get("a") == "A"
+    assert get("b") == "B"
+    assert computed == ["a", "b", "c", "b"]
+    assert cache.info() == {"hits": 2, "misses": 4, "evictions": 2, "size": 2, "maxsize": 2}
+
+
+def test_entries_are_bound_to_their_owner():
+    cache = LRUCache(10)
+    old, new = object(), object()
+    assert cache.get_or_compute(old, "key", lambda: 1) == 1
+    assert cache.get_or_compute(old, "key", lambda: 2) == 1
+    assert cache.get_or_compute(new, "key", lambda: 3) == 3
+    assert len(cache) == 1
+
+
+def test_clear_keeps_counters():
+    cache = LRUCache(10)
+    cache.get_or_compute(None, "key", lambda: None)
+    cache.get_or_compute(None, "key", lambda: None)
+    cache.clear()
+    assert cache.info()["size"] == 0
+    assert cache.info()["hits"] == 1
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        LRUCache(0)
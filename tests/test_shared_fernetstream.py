@@ -0,0 +1,56 @@
+import base64
+import io
+import os
+import pytest
+from cryptography.fernet import Fernet, InvalidToken
+
+from uscodekit.shared import fernetstream
+from uscodekit.shared.fernetstream import decrypt_stream
+
+
+key = Fernet.generate_key()
+
+
+@pytest.mark.parametrize("size", [0, 1, 16, 17, 4099])
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, 1 << 20])
+def test_matches_fernet(size, chunk_size):
+    data = os.urandom(size)
+    token = Fernet(key).encrypt(data)
+    assert decrypt_stream(io.BytesIO(token), key, chunk_size) == data
+
+
+def test_ignores_surrounding_whitespace():
+    token = Fernet(key).encrypt(b'{"a": 1}')
+    assert decrypt_stream(io.BytesIO(token + b"\n"), key) == b'{"a": 1}'
+
+
+def test_rejects_tampered_token():
+    token = bytearray(Fernet(key).encrypt(b"some plaintext"))
+    token[40] = ord("A") if token[40] != ord("A") else ord("B")
+    with pytest.raises(InvalidToken):
+        decrypt_stream(io.BytesIO(bytes(token)), key)
+
+
+def test_rejects_corrupted_hmac_before_decrypting(monkeypatch):
+    raw = bytearray(base64.urlsafe_b64decode(Fernet(key).encrypt(b"some plaintext")))
+    raw[-1] ^= 1
+    token = base64.urlsafe_b64encode(bytes(raw))
+
+    def cipher(*args):
+        raise AssertionError("decrypted before the HMAC was verified")
+
+    monkeypatch.setattr(fernetstream, "Cipher", cipher)
+    with pytest.raises(InvalidToken):
+        decrypt_stream(io.BytesIO(token), key)
+
+
+def test_rejects_wrong_key():
+    token = Fernet(key).encrypt(b"some plaintext")
+    with pytest.raises(InvalidToken):
+        decrypt_stream(io.BytesIO(token), Fernet.generate_key())
+
+
+@pytest.mark.parametrize("token", [b"", b"abc", b"!!!!", b"gAAAAA"])
+def test_rejects_malformed_token(token):
+    with pytest.raises(InvalidToken):
+        decrypt_stream(io.BytesIO(token), key)
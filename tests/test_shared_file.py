@@ -2,7 +2,7 @@ import pytest
 import shutil
 
 
-from uscodekit.shared.file import copy_file_to_dir, rename_file
+from uscodekit.shared.file import atomic_open, copy_file_to_dir, rename_file
 
 
 @pytest.fixture
@@ -53,3 +53,19 @@ def test_rename_file_success(tmp_path):
 def test_rename_file_not_found():
     result = rename_file("non_existent_file.txt", "new_name.txt")
     assert result is False
+
+
+def test_atomic_open(tmp_path):
+    target = tmp_path / "data.json"
+    target.write_text("old")
+
+    with pytest.raises(RuntimeError):
+        with atomic_open(str(target), "w") as f:
+            f.write("partial")
+            raise RuntimeError("interrupted")
+    assert target.read_text() == "old"
+
+    with atomic_open(str(target), "w") as f:
+        f.write("new")
+    assert target.read_text() == "new"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
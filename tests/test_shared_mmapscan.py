@@ -0,0 +1,73 @@
+import random
+import re
+
+import pytest
+
+from uscodekit.shared.mmapscan import bytes_pattern, scan_file
+
+
+PATTERN = re.compile(rb"\b\d{5}(?:-\d{4})?\b")
+
+
+def whole_file_matches(data):
+    return [(m.start(), m.end(), m.group()) for m in PATTERN.finditer(data)]
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    rng = random.Random(5)
+    words = ["02138", "99686-1234", "123456", "2024", "zip", "12345-67", "\n", "a1b2c"]
+    data = " ".join(rng.choice(words) for _ in range(5000)).encode("ascii")
+    file_path = tmp_path / "data.txt"
+    file_path.write_bytes(data)
+    return file_path, data
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 4096, 1 << 20])
+def test_scan_matches_whole_file_search(data_file, chunk_size):
+    file_path, data = data_file
+    found = list(scan_file(file_path, PATTERN, lambda m: m.group(), chunk_size))
+    assert found == whole_file_matches(data)
+    assert all(data[start:end] == value for start, end, value in found)
+
+
+def test_matches_resume_after_previous_match(tmp_path):
+    # like finditer, a match is never searched inside the previous match
+    pattern = re.compile(rb"\d{3}")
+    data = b"x1234567 89 0123456789"
+    file_path = tmp_path / "digits.txt"
+    file_path.write_bytes(data)
+    expected = [m.span() for m in pattern.finditer(data)]
+    for chunk_size in range(1, len(data) + 1):
+        found = [(start, end) for start, end, _ in scan_file(file_path, pattern, bool, chunk_size)]
+        assert found == expected
+
+
+def test_convert_filters_matches(data_file):
+    file_path, _ = data_file
+    values = {value for _, _, value in scan_file(file_path, PATTERN, _only_zip, 100)}
+    assert values == {"02138"}
+
+
+def _only_zip(match):
+    value = match.group().decode("ascii")
+    return value if value == "02138" else None
+
+
+def test_abandoned_scan_releases_the_file(data_file):
+    file_path, _ = data_file
+    scan = scan_file(file_path, PATTERN, lambda m: m.group(), 16)
+    next(scan)
+    scan.close()
+
+
+def test_empty_file(tmp_path):
+    file_path = tmp_path / "empty.txt"
+    file_path.write_bytes(b"")
+    assert list(scan_file(file_path, PATTERN, lambda m: m.group())) == []
+
+
+def test_bytes_pattern():
+    pattern = bytes_pattern(re.compile(r"(?x) \d{3}  # digits"))
+    assert pattern.flags & re.VERBOSE
+    assert pattern.findall(b"12 345 \xd9\xa1\xd9\xa2\xd9\xa3") == [b"345"]
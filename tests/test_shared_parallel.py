@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+from uscodekit.shared import parallel
+from uscodekit.shared.parallel import chunked, ordered_map, resolve_workers
+
+
+# set by a test in the parent process, after the import of this module
+STATE = {}
+
+
+def squares(chunk):
+    return [(value * value, os.getpid()) for value in chunk]
+
+
+def read_state(chunk):
+    return [STATE.get(key) for key in chunk]
+
+
+def test_chunked():
+    assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(chunked([], 3)) == []
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_ordered_map(workers):
+    results = list(ordered_map(squares, iter(range(100)), workers, chunksize=7, max_pending=2))
+    assert [value for value, _ in results] == [value * value for value in range(100)]
+    pids = {pid for _, pid in results}
+    if workers == 1:
+        assert pids == {os.getpid()}
+    else:
+        assert os.getpid() not in pids
+
+
+@pytest.mark.skipif(not parallel.FORK, reason="needs fork")
+def test_ordered_map_workers_inherit_state(monkeypatch):
+    monkeypatch.setitem(STATE, "loaded", 42)
+    assert list(ordered_map(read_state, ["loaded"] * 4, workers=2, chunksize=1)) == [42] * 4
+
+
+def test_ordered_map_is_lazy():
+    consumed = []
+
+    def items():
+        for value in range(1000):
+            consumed.append(value)
+            yield value
+
+    results = ordered_map(squares, items(), workers=2, chunksize=10, max_pending=2)
+    assert next(results)[0] == 0
+    # only the chunks in flight were read
+    assert len(consumed) <= 40
+    results.close()
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        ordered_map(squares, [], workers=0)
+    with pytest.raises(ValueError):
+        ordered_map(squares, [], chunksize=0)
+    assert resolve_workers(None) >= 1
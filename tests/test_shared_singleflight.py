@@ -0,0 +1,62 @@
+import threading
+import time
+
+import pytest
+
+from uscodekit.shared.singleflight import SingleFlight
+
+
+def run_threads(count, target):
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(i):
+        barrier.wait()
+        try:
+            results[i] = target()
+        except Exception as exc:
+            results[i] = exc
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    results = run_threads(16, lambda: flight.do(load))
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_exception_reaches_every_waiter():
+    flight = SingleFlight()
+    calls = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.05)
+        raise OSError("unreadable")
+
+    results = run_threads(8, lambda: flight.do(load))
+    assert len(calls) == 1
+    assert all(isinstance(result, OSError) for result in results)
+
+
+def test_completed_call_runs_again():
+    flight = SingleFlight()
+    assert flight.do(lambda: 1) == 1
+    assert flight.do(lambda: 2) == 2
+    with pytest.raises(ValueError):
+        flight.do(lambda: int("x"))
+    assert flight.do(lambda: 3) == 3
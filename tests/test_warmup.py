@@ -0,0 +1,98 @@
+import copy
+import gc
+import os
+import random
+import string
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+import uscodekit
+from uscodekit.services import geo
+from uscodekit.services.geo import GeoIndex, GeoService
+from uscodekit.warmup import preload
+
+from tests.sample_data import SAMPLE_RECORDS
+
+
+@pytest.fixture
+def unfrozen():
+    yield
+    gc.unfreeze()
+
+
+def test_preload_geo_builds_the_indexes(monkeypatch, unfrozen):
+    index = GeoIndex(SAMPLE_RECORDS)
+    monkeypatch.setattr(geo, "_geo_index", index)
+    assert uscodekit.preload(["geo"]) == {"geo": 3}
+    assert index._spatial is not None
+    assert index._postings is not None
+    assert index._city_search is not None
+    assert gc.get_freeze_count() > 0
+
+
+def test_preload_naics(monkeypatch):
+    monkeypatch.setattr(uscodekit, "naics2k22", SimpleNamespace(index=SimpleNamespace(records=[{}, {}])))
+    assert preload(["naics", "naics"], freeze=False) == {"naics": 2}
+    assert gc.get_freeze_count() == 0
+
+
+def test_unknown_dataset():
+    with pytest.raises(ValueError):
+        preload(["geo", "counties"])
+
+
+def _memory():
+    with open("/proc/self/smaps_rollup") as f:
+        return {
+            line.split()[0].rstrip(":"): int(line.split()[1])
+            for line in f
+            if line.endswith("kB\n")
+        }
+
+
+def _private_growth_in_child() -> int:
+    """Forks a worker that serves a few lookups, and returns the KiB it un-shares."""
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        before = _memory()["Private_Dirty"]
+        service = GeoService()
+        for zip_code in ("00007", "00700", "07000", "70000"):
+            service.get_zip_code_info(zip_code)
+        service.nearest_zip_codes(42.37, -71.11, k=5)
+        service.search_city("Springfeld")
+        gc.collect()
+        os.write(write_end, str(_memory()["Private_Dirty"] - before).encode())
+        os._exit(0)
+    os.close(write_end)
+    os.waitpid(pid, 0)
+    with os.fdopen(read_end) as f:
+        return int(f.read())
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux") or not os.path.exists("/proc/self/smaps_rollup"),
+    reason="needs fork and /proc/self/smaps_rollup",
+)
+def test_forked_workers_share_preloaded_data(monkeypatch, unfrozen):
+    rng = random.Random(0)
+    records = []
+    for i in range(20000):
+        record = copy.deepcopy(SAMPLE_RECORDS[i % 3])
+        record["zipCode"] = f"{i * 5:05d}"
+        record["city"] = "".join(rng.choices(string.ascii_lowercase, k=8)).title()
+        records.append(record)
+    monkeypatch.setattr(geo, "_geo_index", GeoIndex(records))
+    del records
+    preload(["geo"], freeze=False)
+
+    thawed = _private_growth_in_child()
+    gc.freeze()
+    frozen = _private_growth_in_child()
+
+    # a collection in the worker writes to every object it tracks, un-sharing
+    # their pages, unless they were frozen before the fork
+    assert frozen < thawed / 4
+    assert frozen < 4096
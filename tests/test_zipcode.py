@@ -1,9 +1,37 @@
+import os
+import tempfile
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 
-from uscodekit.services.geo import GeoService
-from uscodekit.zip_code import extract_zip_code, extract_all_zip_codes, zip_code_insight
+from uscodekit.services import geo
+from uscodekit.services.geo import GeoIndex, GeoService
+from uscodekit.zip_code import (
+    extract_zip_code,
+    extract_all_zip_codes,
+    extract_all_zip_codes_many,
+    is_valid_zip_code,
+    zip_code_insight,
+    zip_code_insight_many,
+    enable_insight_cache,
+    disable_insight_cache,
+    insight_cache_info,
+    nearest_zip_codes,
+    zip_codes_within,
+    zip_codes_in_bbox,
+    distance,
+    pairwise_distances,
+    pairwise_top_k,
+    zip_codes_by_area_code,
+    zip_codes_by_state,
+    zip_codes_by_city,
+    zip_codes_by_timezone,
+    count_zip_codes,
+    search_city,
+    scan_file,
+)
+
+from tests.sample_data import SAMPLE_RECORDS
 
 
 class TestZipCodeFunctions(unittest.TestCase):
@@ -36,3 +64,178 @@ class TestZipCodeFunctions(unittest.TestCase):
     def test_extract_all_zip_codes_no_codes(self):
         text = "No ZIP codes are found in this text."
         self.assertEqual(extract_all_zip_codes(text), [])
+
+
+@patch("uscodekit.services.geo._geo_index", GeoIndex(SAMPLE_RECORDS))
+class TestZipCodeInsight(unittest.TestCase):
+
+    def test_zip_code_insight(self):
+        info = zip_code_insight("99686")
+        self.assertEqual(info["areaCode"], "907")
+        self.assertEqual(info["city"], "Valdez")
+        self.assertEqual(zip_code_insight("00000")["city"], "")
+
+    def test_zip_code_insight_keeps_coordinate_text(self):
+        record = dict(SAMPLE_RECORDS[0], location={"latitude": "61.1380", "longitude": "-146.3572"})
+        with patch("uscodekit.services.geo._geo_index", GeoIndex([record])):
+            info = zip_code_insight("99686")
+        self.assertEqual(info.location.latitude, "61.1380")
+        self.assertEqual(info.location.longitude, "-146.3572")
+
+    def test_zip_code_insight_is_shared_and_immutable(self):
+        info = zip_code_insight("02138")
+        self.assertIs(zip_code_insight("02138"), info)
+        self.assertEqual(info.timezone.name, info["timezone"]["name"])
+        with self.assertRaises(AttributeError):
+            info.city = "Boston"
+        copy = info.to_dict()
+        copy["city"] = "Boston"
+        self.assertEqual(zip_code_insight("02138")["city"], "Cambridge")
+
+    def test_extract_validated_zip_codes(self):
+        text = "Order 12345 of 2024-01-15 ships from 02138 to 99686-1234, ref 10001."
+        self.assertEqual(extract_all_zip_codes(text, validate=True), ["02138", "99686-1234"])
+        self.assertEqual(extract_zip_code(text, validate=True), "02138")
+        self.assertIsNone(extract_zip_code("Order 12345", validate=True))
+
+    def test_scan_file(self):
+        text = "Order 12345 of 2024-01-15 ships from 02138 to 99686-1234, ref 10001.\n" * 50
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "orders.txt")
+            with open(file_path, "w") as f:
+                f.write(text)
+
+            found = list(scan_file(file_path, chunk_size=16))
+            self.assertEqual([zip_code for _, _, zip_code in found], extract_all_zip_codes(text))
+            self.assertTrue(all(text[start:end] == zip_code for start, end, zip_code in found))
+
+            valid = [zip_code for _, _, zip_code in scan_file(file_path, validate=True)]
+            self.assertEqual(valid, extract_all_zip_codes(text, validate=True))
+
+    def test_extract_all_zip_codes_many(self):
+        texts = [f"Order {12345 + i} ships from 02138 to 99686-1234" for i in range(50)]
+        results = list(extract_all_zip_codes_many(texts, workers=2, chunksize=8))
+        self.assertEqual(results, [extract_all_zip_codes(text) for text in texts])
+        valid = list(extract_all_zip_codes_many(texts, validate=True, workers=2, chunksize=8))
+        self.assertEqual(valid, [["02138", "99686-1234"]] * len(texts))
+
+    def test_validation_needs_the_database(self):
+        with patch("uscodekit.services.geo._geo_index", None), patch(
+            "uscodekit.configs.GeoConfig.encrypted_database_fp", "/nonexistent/geo.gz"
+        ), patch("uscodekit.shared.file._missing_reported", True):
+            self.assertIs(geo.get_geo_index(), geo.get_geo_index())
+            with self.assertRaises(ValueError):
+                is_valid_zip_code("02138")
+            with self.assertRaises(ValueError):
+                extract_all_zip_codes("Cambridge, MA 02138", validate=True)
+            self.assertEqual(extract_all_zip_codes("Cambridge, MA 02138"), ["02138"])
+
+    def test_is_valid_zip_code(self):
+        self.assertTrue(is_valid_zip_code("99686"))
+        self.assertTrue(is_valid_zip_code("02138-4321"))
+        self.assertFalse(is_valid_zip_code("12345"))
+        self.assertFalse(is_valid_zip_code("2138"))
+        self.assertFalse(is_valid_zip_code("02138-43"))
+        self.assertFalse(is_valid_zip_code("０２１３８"))
+
+    def test_zip_code_insight_cache(self):
+        enable_insight_cache(maxsize=8)
+        try:
+            info = zip_code_insight("99686")
+            self.assertIs(zip_code_insight("99686"), info)
+            self.assertIs(zip_code_insight("00000"), zip_code_insight("00000"))
+            self.assertEqual(zip_code_insight("00000")["city"], "")
+            self.assertEqual(
+                insight_cache_info(),
+                {"hits": 3, "misses": 2, "evictions": 0, "size": 2, "maxsize": 8},
+            )
+        finally:
+            disable_insight_cache()
+
+    def test_zip_code_insight_many(self):
+        zips = ["02138", "00000", "99686", "02138"]
+        results = zip_code_insight_many(zips)
+        self.assertEqual(results, [zip_code_insight(z) for z in zips])
+        self.assertIs(results[0], results[3])
+
+    def test_zip_code_insight_many_accepts_iterators(self):
+        results = zip_code_insight_many(iter(["99901"]))
+        self.assertEqual(results[0]["city"], "Ketchikan")
+
+    def test_nearest_zip_codes(self):
+        results = nearest_zip_codes(42.37, -71.11, k=2)
+        self.assertEqual([r["zipCode"] for r in results], ["02138", "99901"])
+        self.assertLess(results[0]["distance"], 1)
+
+    def test_zip_codes_within(self):
+        results = zip_codes_within(61.0, -146.0, 50)
+        self.assertEqual([r["zipCode"] for r in results], ["99686"])
+        self.assertEqual(zip_codes_within(0.0, 0.0, 50), [])
+
+    def test_zip_codes_in_bbox(self):
+        self.assertEqual(zip_codes_in_bbox(50, -150, 65, -130), ["99686", "99901"])
+        self.assertEqual(zip_codes_in_bbox(0, 0, 1, 1), [])
+
+    def test_distance(self):
+        self.assertAlmostEqual(distance("02138", "99686"), 3254, delta=5)
+        self.assertEqual(distance("02138", "02138"), 0)
+        self.assertIsNone(distance("02138", "00000"))
+
+    def test_pairwise_distances(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        matrix = pairwise_distances(["02138", "00000"], ["99686", "02138", "99901"])
+        self.assertEqual(matrix.shape, (2, 3))
+        self.assertAlmostEqual(matrix[0, 0], distance("02138", "99686"))
+        self.assertEqual(matrix[0, 1], 0)
+        self.assertTrue(np.isnan(matrix[1]).all())
+
+    def test_pairwise_top_k(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        rows = list(
+            pairwise_top_k(["99686", "00000", "02138"], ["02138", "99901", "99686", "11111"], k=2, block_size=2)
+        )
+        self.assertEqual([[m["zipCode"] for m in r] for r in rows], [["99686", "99901"], [], ["02138", "99901"]])
+        self.assertEqual(rows[0][0]["distance"], 0)
+        everything = list(pairwise_top_k(["02138"], ["99686", "02138"], k=10))
+        self.assertEqual([m["zipCode"] for m in everything[0]], ["02138", "99686"])
+
+    def test_zip_codes_by(self):
+        self.assertEqual(zip_codes_by_area_code("907"), ["99686", "99901"])
+        self.assertEqual(zip_codes_by_state("Alaska"), ["99686", "99901"])
+        self.assertEqual(zip_codes_by_city("Cambridge", "MA"), ["02138"])
+        self.assertEqual(zip_codes_by_timezone("EST"), ["02138"])
+        self.assertEqual(zip_codes_by_state("TX"), [])
+
+    def test_count_zip_codes(self):
+        self.assertEqual(count_zip_codes(area_code="907"), 2)
+        self.assertEqual(count_zip_codes(state="AK"), 2)
+        self.assertEqual(count_zip_codes(city="Valdez", state="AK"), 1)
+        self.assertEqual(count_zip_codes(timezone="AKST"), 2)
+        with self.assertRaises(ValueError):
+            count_zip_codes()
+        with self.assertRaises(ValueError):
+            count_zip_codes(state="AK", timezone="AKST")
+        with self.assertRaises(ValueError):
+            count_zip_codes(city="Valdez")
+
+    def test_search_city(self):
+        self.assertEqual(
+            search_city("Ketchican"),
+            [
+                {
+                    "city": "Ketchikan",
+                    "state": "Alaska",
+                    "stateISO": "AK",
+                    "zipCodes": ["99901"],
+                    "edits": 1,
+                }
+            ],
+        )
+        self.assertEqual(search_city("Ketchican", state="MA"), [])
+        self.assertEqual(search_city("Springfield"), [])
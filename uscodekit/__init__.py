@@ -2,4 +2,7 @@ from .services.naics import NAICS2022Service
 
 naics2k22 = NAICS2022Service()
 
-__all__ = ["naics2k22"]
+from .warmup import preload  # noqa: E402
+from .reloader import reload, watch  # noqa: E402
+
+__all__ = ["naics2k22", "preload", "reload", "watch"]
@@ -0,0 +1,8 @@
+# uscodekit/__main__.py
+
+import sys
+
+from uscodekit.cli import main
+
+
+sys.exit(main())
@@ -0,0 +1,101 @@
+# uscodekit/aio.py
+
+import asyncio
+import threading
+from concurrent.futures import Executor, Future
+from typing import Iterable, List, Optional
+
+from uscodekit import phone as _phone, zip_code as _zip_code
+from uscodekit.records import AreaCodeInfo, ZipInfo
+from uscodekit.services import geo
+from uscodekit.services.geo import GeoIndex
+
+
+# The load in progress, shared by every caller (and event loop) awaiting it.
+_load_future: Optional[Future] = None
+_load_lock = threading.Lock()
+
+
+def _load(future: Future) -> None:
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        index = geo.get_geo_index()
+    except BaseException as exc:
+        future.set_exception(exc)
+    else:
+        future.set_result(index)
+
+
+def _forget(future: Future) -> None:
+    # an empty index means the database files are missing: let a later call retry
+    global _load_future
+    if (
+        future.cancelled()
+        or future.exception() is not None
+        or not len(future.result().store)
+    ):
+        with _load_lock:
+            if _load_future is future:
+                _load_future = None
+
+
+async def aload(executor: Optional[Executor] = None) -> GeoIndex:
+    """
+    Loads the geo database without blocking the event loop.
+
+    Reading, decompressing, decrypting and indexing the database runs once, in
+    an executor; concurrent callers all await that single load. Once it has
+    completed, this returns immediately, without a hop to another thread.
+
+    Args:
+        executor (Executor | None): The executor running the load. Defaults to
+                                    the event loop's default executor.
+
+    Returns:
+        GeoIndex: The shared index of the geo database.
+    """
+    global _load_future
+    if geo._geo_index is not None:
+        return geo._geo_index
+
+    with _load_lock:
+        future = _load_future
+        if future is None:
+            future = _load_future = Future()
+            future.add_done_callback(_forget)
+            start = True
+        else:
+            start = False
+    if start:
+        asyncio.get_running_loop().run_in_executor(executor, _load, future)
+    # shielded, so that a cancelled caller does not cancel the load other callers await
+    return await asyncio.shield(asyncio.wrap_future(future))
+
+
+async def zip_code_insight(zip_code: str) -> ZipInfo:
+    """
+    Asynchronous `uscodekit.zip_code.zip_code_insight`: awaits `aload` on first
+    use, then looks the ZIP code up in the index it returned.
+    """
+    return _zip_code._insight(await aload(), zip_code)
+
+
+async def zip_code_insight_many(zip_codes: Iterable[str]) -> List[ZipInfo]:
+    """Asynchronous `uscodekit.zip_code.zip_code_insight_many`."""
+    return _zip_code._insight_many(await aload(), zip_codes)
+
+
+async def phone_number_insight(phone: str) -> AreaCodeInfo:
+    """
+    Asynchronous `uscodekit.phone.phone_number_insight`: awaits `aload` on first
+    use, then looks the area code up in the index it returned.
+    """
+    return _phone._insight(await aload(), phone)
+
+
+async def phone_number_insight_many(
+    phones: Iterable[str], skip_invalid: bool = False
+) -> List[Optional[AreaCodeInfo]]:
+    """Asynchronous `uscodekit.phone.phone_number_insight_many`."""
+    return _phone._insight_many(await aload(), phones, skip_invalid)
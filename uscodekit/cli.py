@@ -0,0 +1,400 @@
+# uscodekit/cli.py
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import sys
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+
+from uscodekit.phone import cleaned_phone
+from uscodekit.services import naics
+from uscodekit.services.geo import GeoService
+from uscodekit.shared import parallel
+from uscodekit.warmup import GEO, NAICS, preload
+
+
+CSV = "csv"
+JSONL = "jsonl"
+
+FORMATS = (CSV, JSONL)
+
+# The kinds of column `enrich` can look up, and the fields it appends for each,
+# as "<column>_<field>".
+PHONE = "phone"
+ZIP = "zip"
+NAICS_CODE = "naics"
+
+FIELDS = {
+    PHONE: (
+        "phone",
+        "areaCode",
+        "city",
+        "state",
+        "stateISO",
+        "zipCode",
+        "latitude",
+        "longitude",
+        "timezone",
+        "utcOffset",
+    ),
+    ZIP: (
+        "areaCode",
+        "city",
+        "state",
+        "stateISO",
+        "latitude",
+        "longitude",
+        "timezone",
+        "utcOffset",
+    ),
+    NAICS_CODE: ("title", "sector", "subsector", "industry_group", "naics_industry"),
+}
+
+# (kind, column) pairs: what to look up, and where the value is read from
+Plan = Tuple[Tuple[str, Any], ...]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Runs the `uscodekit` command line.
+
+    Args:
+        argv (Sequence[str] | None): The arguments, without the program name.
+                                     Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit status.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if not (args.phone or args.zip or args.naics):
+        parser.error("enrich: at least one of --phone, --zip or --naics is required")
+    if args.workers < 1 or args.chunksize < 1:
+        parser.error("enrich: --workers and --chunksize must be at least 1")
+    try:
+        enrich(
+            args.input,
+            args.output,
+            args.format,
+            phone=args.phone,
+            zip_code=args.zip,
+            naics_code=args.naics,
+            workers=args.workers,
+            chunksize=args.chunksize,
+            freeze=True,
+        )
+    except BrokenPipeError:
+        # the reader went away, e.g. `uscodekit enrich ... | head`
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"uscodekit enrich: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="uscodekit", description="U.S. phone, ZIP code and NAICS code tools."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    command = commands.add_parser(
+        "enrich",
+        help="append geo and NAICS columns to a CSV or JSONL file",
+        description=(
+            "Streams a CSV or JSON Lines file and appends the details of the phone "
+            "numbers, ZIP codes and NAICS codes of the chosen columns, as "
+            "<column>_<field> columns."
+        ),
+    )
+    command.add_argument(
+        "input", nargs="?", default="-", help="the input file (default: standard input)"
+    )
+    command.add_argument(
+        "-o", "--output", default="-", help="the output file (default: standard output)"
+    )
+    command.add_argument(
+        "-f",
+        "--format",
+        choices=FORMATS,
+        help="the input and output format (default: jsonl for .jsonl and .ndjson files, else csv)",
+    )
+    command.add_argument(
+        "--phone",
+        action="append",
+        default=[],
+        metavar="COLUMN",
+        help="a column of phone numbers (repeatable)",
+    )
+    command.add_argument(
+        "--zip",
+        action="append",
+        default=[],
+        metavar="COLUMN",
+        help="a column of ZIP codes (repeatable)",
+    )
+    command.add_argument(
+        "--naics",
+        action="append",
+        default=[],
+        metavar="COLUMN",
+        help="a column of NAICS codes (repeatable)",
+    )
+    command.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="the number of worker processes (default: 1)",
+    )
+    command.add_argument(
+        "--chunksize",
+        type=int,
+        default=1000,
+        help="the number of rows sent to a worker at a time (default: 1000)",
+    )
+    return parser
+
+
+def enrich(
+    source: str = "-",
+    output: str = "-",
+    fmt: Optional[str] = None,
+    phone: Sequence[str] = (),
+    zip_code: Sequence[str] = (),
+    naics_code: Sequence[str] = (),
+    workers: int = 1,
+    chunksize: int = 1000,
+    freeze: bool = False,
+) -> int:
+    """
+    Appends the details of phone numbers, ZIP codes and NAICS codes to the rows of
+    a CSV or JSON Lines file.
+
+    Rows are read, enriched and written as a stream: memory use does not depend
+    on the size of the file. For each chosen column, the fields of `FIELDS` are
+    appended as "<column>_<field>" columns (keys, for JSON Lines); they are empty
+    for values that are not valid or not in the database.
+
+    The datasets are loaded once, before any row is read. With several workers,
+    rows are sent to them `chunksize` at a time and written in their original
+    order. Where processes can be forked (see `parallel.FORK`), the workers are
+    forked from this loaded state and share its memory pages; elsewhere (Windows)
+    each worker loads the datasets again. With `freeze`, the loaded datasets are
+    moved out of the garbage collector's reach (`gc.freeze`) before forking, so
+    that collections in the workers do not copy their pages; this affects the
+    whole process, which is why only the command line asks for it.
+
+    Args:
+        source (str): The input file, or "-" for standard input.
+        output (str): The output file, or "-" for standard output.
+        fmt (str | None): "csv" or "jsonl". Defaults to "jsonl" for ".jsonl"
+                          and ".ndjson" files and to "csv" otherwise.
+        phone (Sequence[str]): The columns holding phone numbers.
+        zip_code (Sequence[str]): The columns holding ZIP codes.
+        naics_code (Sequence[str]): The columns holding NAICS codes.
+        workers (int): The number of worker processes.
+        chunksize (int): The number of rows sent to a worker at a time.
+        freeze (bool): Whether to freeze the loaded datasets with `gc.freeze`
+                       before forking workers. Defaults to False.
+
+    Returns:
+        int: The number of rows written.
+
+    Raises:
+        ValueError: If a database cannot be loaded, a CSV column is not in the
+                    header, or a line of a JSON Lines file is not a JSON object.
+        OSError: If a file cannot be read or written.
+    """
+    if fmt is None:
+        fmt = JSONL if source.endswith((".jsonl", ".ndjson")) else CSV
+    columns = (
+        [(PHONE, column) for column in phone]
+        + [(ZIP, column) for column in zip_code]
+        + [(NAICS_CODE, column) for column in naics_code]
+    )
+
+    datasets = []
+    if phone or zip_code:
+        datasets.append(GEO)
+    if naics_code:
+        datasets.append(NAICS)
+    # loading reports its progress on standard output, which may be the output file
+    with contextlib.redirect_stdout(sys.stderr):
+        # freezing only helps forked workers, whose collections would copy the pages
+        loaded = preload(datasets, freeze=freeze and workers > 1 and parallel.FORK)
+    missing = [name for name, count in loaded.items() if not count]
+    if missing:
+        raise ValueError(
+            f"the {' and '.join(missing)} database(s) could not be loaded; see the setup guide."
+        )
+
+    with _open(source, "r", sys.stdin) as infile, _open(
+        output, "w", sys.stdout
+    ) as outfile:
+        if fmt == CSV:
+            return _enrich_csv(infile, outfile, columns, workers, chunksize)
+        return _enrich_jsonl(infile, outfile, columns, workers, chunksize)
+
+
+def _enrich_csv(
+    source: TextIO, target: TextIO, columns, workers: int, chunksize: int
+) -> int:
+    reader = csv.reader(source)
+    writer = csv.writer(target, lineterminator="\n")
+    header = next(reader, None)
+    if header is None:
+        return 0
+    positions: Dict[str, int] = {}
+    for position, name in enumerate(header):
+        positions.setdefault(name, position)
+    missing = [column for _, column in columns if column not in positions]
+    if missing:
+        raise ValueError(
+            f"column(s) {', '.join(map(repr, missing))} not in the CSV header."
+        )
+
+    plan: Plan = tuple((kind, positions[column]) for kind, column in columns)
+    writer.writerow(header + _field_names(columns))
+    count = 0
+    for row in parallel.ordered_map(
+        partial(_enrich_csv_chunk, plan), reader, workers=workers, chunksize=chunksize
+    ):
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def _enrich_jsonl(
+    source: TextIO, target: TextIO, columns, workers: int, chunksize: int
+) -> int:
+    plan: Plan = tuple(columns)
+    names = tuple(_field_names(columns))
+    count = 0
+    for line in parallel.ordered_map(
+        partial(_enrich_jsonl_chunk, plan, names),
+        (line for line in source if line.strip()),
+        workers=workers,
+        chunksize=chunksize,
+    ):
+        target.write(line)
+        count += 1
+    return count
+
+
+def _enrich_csv_chunk(plan: Plan, rows: List[List[str]]) -> List[List[str]]:
+    lookups = _lookups(plan)
+    for row in rows:
+        for kind, position in plan:
+            row.extend(lookups[kind](row[position] if position < len(row) else ""))
+    return rows
+
+
+def _enrich_jsonl_chunk(
+    plan: Plan, names: Tuple[str, ...], lines: List[str]
+) -> List[str]:
+    lookups = _lookups(plan)
+    results = []
+    for line in lines:
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError(
+                f"expected a JSON object per line, got {line.strip()[:80]!r}."
+            )
+        values: List[str] = []
+        for kind, key in plan:
+            values.extend(lookups[kind](record.get(key)))
+        record.update(zip(names, values))
+        results.append(json.dumps(record) + "\n")
+    return results
+
+
+def _field_names(columns) -> List[str]:
+    return [f"{column}_{field}" for kind, column in columns for field in FIELDS[kind]]
+
+
+def _lookups(plan: Plan) -> Dict[str, Callable[[Any], List[str]]]:
+    # only the indexes of the planned kinds are resolved
+    kinds = {kind for kind, _ in plan}
+    lookups = {}
+    if PHONE in kinds or ZIP in kinds:
+        index = GeoService().index
+        lookups[PHONE] = partial(_phone_fields, index)
+        lookups[ZIP] = partial(_zip_fields, index)
+    if NAICS_CODE in kinds:
+        lookups[NAICS_CODE] = partial(_naics_fields, naics.get_index())
+    return lookups
+
+
+def _phone_fields(index, value: Any) -> List[str]:
+    if not value:
+        return [""] * len(FIELDS[PHONE])
+    try:
+        digits = cleaned_phone(str(value))
+    except ValueError:
+        return [""] * len(FIELDS[PHONE])
+    # the shared record of the area code, rather than a copy per number
+    info = index.area_code_record(digits[:3])
+    return [
+        f"({digits[:3]}) {digits[3:6]}-{digits[6:]}",
+        info.areaCode,
+        info.city,
+        info.state,
+        info.stateISO,
+        info.zipCode,
+        *_geo_fields(info),
+    ]
+
+
+def _zip_fields(index, value: Any) -> List[str]:
+    if isinstance(value, int):
+        value = f"{value:05d}"
+    info = index.zip_code_record(str(value or ""))
+    return [info.areaCode, info.city, info.state, info.stateISO, *_geo_fields(info)]
+
+
+def _geo_fields(info) -> List[str]:
+    location, timezone = info.location, info.timezone
+    return [location.latitude, location.longitude, timezone.name, timezone.offset]
+
+
+def _naics_fields(index, value: Any) -> List[str]:
+    code = str(value or "").strip()
+    hierarchy = index.hierarchy(code) if code else None
+    if hierarchy is None:
+        return [""] * len(FIELDS[NAICS_CODE])
+    return [hierarchy["title"]] + [
+        hierarchy[level].title if level in hierarchy else ""
+        for level in FIELDS[NAICS_CODE][1:]
+    ]
+
+
+@contextlib.contextmanager
+def _open(path: str, mode: str, standard: TextIO) -> Iterator[TextIO]:
+    if path == "-":
+        # newline="" leaves line endings inside quoted CSV fields to the csv module
+        stream = io.TextIOWrapper(
+            standard.buffer, encoding="utf-8", newline="", write_through=False
+        )
+        try:
+            yield stream
+        finally:
+            if mode == "w":
+                stream.flush()
+            stream.detach()
+        return
+    with open(path, mode, encoding="utf-8", newline="") as f:
+        yield f
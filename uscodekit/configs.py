@@ -19,6 +19,7 @@ class GeoConfig:
     encrypted_database_fp = root / "geo.gz"
     decompressed_data_fp = root / "decompressed.geo.bin"
     decompressed_json_fp = root / "decompressed.geo.json"
+    snapshot_fp = root / "geo.snapshot"
 
 
 class NAICS2022Config:
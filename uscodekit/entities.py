@@ -0,0 +1,75 @@
+# uscodekit/entities.py
+
+import re
+from typing import List, Union
+
+from uscodekit.phone import US_PHONE_PATTERN, PhoneMatch, _nanp_tables
+from uscodekit.zip_code import ZIP_CODE_PATTERN, ZipCodeMatch, _zip_bitmap
+
+
+# The kinds of entity found by `extract_entities`.
+PHONE = PhoneMatch.kind
+ZIP_CODE = ZipCodeMatch.kind
+
+KINDS = (PHONE, ZIP_CODE)
+
+# Both patterns as the branches of one alternation; phone numbers are tried first.
+# Every entity starts with "+", "(" or a digit: the leading lookahead lets the
+# search skip other positions without trying either branch, which makes the
+# combined scan several times faster than the two patterns run one after another.
+ENTITY_PATTERN = re.compile(
+    rf"""(?=[+(\d])(?:
+        (?P<{PHONE}>{US_PHONE_PATTERN.pattern})
+        |(?P<{ZIP_CODE}>{ZIP_CODE_PATTERN.pattern})
+    )""",
+    US_PHONE_PATTERN.flags | ZIP_CODE_PATTERN.flags | re.VERBOSE,
+)
+
+Entity = Union[PhoneMatch, ZipCodeMatch]
+
+
+def extract_entities(
+    text: str, strict: bool = False, validate: bool = False
+) -> List[Entity]:
+    """
+    Extracts the U.S. phone numbers and ZIP codes of a text in a single pass.
+
+    Phone numbers and ZIP codes are searched together, left to right, by one
+    pattern, so entities never overlap: digits that are part of a phone number
+    are not reported again as a ZIP code, as `extract_all_zip_codes` would for
+    "617-495-10001". Where both could start at the same position, the phone
+    number is preferred.
+
+    Args:
+        text (str): The text to search.
+        strict (bool): Whether to skip phone numbers that break the NANP rules
+                       (see `uscodekit.phone.is_valid_phone`).
+        validate (bool): Whether to skip ZIP code candidates that are not ZIP
+                         codes of the database.
+
+    Returns:
+        list: The entities in order of appearance: a `PhoneMatch` for each phone
+              number and a `ZipCodeMatch` for each ZIP code, told apart by their
+              `kind` ("phone" or "zip_code"). Both have a `span`.
+
+    Example:
+        >>> for entity in extract_entities("Call 617-495-1000, Cambridge MA 02138"):
+        ...     print(entity.kind, entity.span, entity)
+        phone (5, 17) (617) 495-1000
+        zip_code (32, 37) 02138
+    """
+    tables = _nanp_tables() if strict else None
+    bitmap = _zip_bitmap() if validate else None
+    entities: List[Entity] = []
+    for match in ENTITY_PATTERN.finditer(text):
+        start, end = match.span()
+        if match.lastgroup == PHONE:
+            _, paren_area_code, area_code, exchange, line, _ = match.groups()
+            phone = PhoneMatch(start, end, paren_area_code or area_code, exchange, line)
+            if tables is None or tables.is_valid(phone.digits):
+                entities.append(phone)
+        else:
+            zip_code = match.group(ZIP_CODE)
+            if bitmap is None or zip_code in bitmap:
+                entities.append(ZipCodeMatch(start, end, zip_code))
+    return entities
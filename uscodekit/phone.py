@@ -1,8 +1,14 @@
 # src/phone.py
 
 import re
-from typing import Optional, List, Dict
+from functools import partial
+from typing import Optional, List, Dict, Iterable, Iterator, Tuple
+from uscodekit.records import AreaCodeInfo
 from uscodekit.services.geo import GeoService
+from uscodekit.services.geo_nanp import NXX_TABLES
+from uscodekit.services.geo_store import require_numpy
+from uscodekit.shared import mmapscan, parallel
+from uscodekit.shared.cache import LRUCache
 
 
 US_PHONE_PATTERN = re.compile(
@@ -15,8 +21,77 @@ US_PHONE_PATTERN = re.compile(
     re.VERBOSE,
 )
 
+# US_PHONE_PATTERN over bytes, for scanning files without decoding them
+US_PHONE_BYTES_PATTERN = mmapscan.bytes_pattern(US_PHONE_PATTERN)
 
-def is_valid_phone(phone: str) -> bool:
+NON_DIGIT_PATTERN = re.compile(r"\D")
+
+# The memoized results of `phone_number_insight`, by cleaned digits, when enabled.
+_insight_cache: Optional[LRUCache] = None
+
+
+class PhoneMatch:
+    """
+    A U.S. phone number found in a text, as returned by `iter_phone_numbers`.
+
+    Only the span and the three parts of the number are stored; the digits and
+    the formatted number are built when asked for.
+
+    Attributes
+    ----------
+    kind : str
+        "phone", to tell phone numbers from the other entities of `extract_entities`.
+    start, end : int
+        The span of the number in the text, country code and separators included.
+    area_code : str
+        The 3-digit area code (NPA).
+    exchange : str
+        The 3-digit exchange code (NXX).
+    line : str
+        The 4-digit line number.
+    """
+
+    __slots__ = ("start", "end", "area_code", "exchange", "line")
+
+    kind = "phone"
+
+    def __init__(self, start: int, end: int, area_code: str, exchange: str, line: str):
+        self.start = start
+        self.end = end
+        self.area_code = area_code
+        self.exchange = exchange
+        self.line = line
+
+    @property
+    def span(self) -> Tuple[int, int]:
+        return self.start, self.end
+
+    @property
+    def digits(self) -> str:
+        """The 10 digits of the number, without country code: 6174951000."""
+        return self.area_code + self.exchange + self.line
+
+    @property
+    def formatted(self) -> str:
+        """The number in the standard U.S. format: (617) 495-1000."""
+        return f"({self.area_code}) {self.exchange}-{self.line}"
+
+    def __str__(self) -> str:
+        return self.formatted
+
+    def __repr__(self) -> str:
+        return f"PhoneMatch(span={self.span}, phone={self.formatted!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PhoneMatch):
+            return NotImplemented
+        return self.span == other.span and self.digits == other.digits
+
+    def __hash__(self) -> int:
+        return hash((self.start, self.end, self.digits))
+
+
+def is_valid_phone(phone: str, strict: bool = False) -> bool:
     """
     Validates if the provided phone number matches the U.S. phone number format.
 
@@ -28,19 +103,51 @@ def is_valid_phone(phone: str) -> bool:
 
     Args:
         phone (str): The phone number string to validate.
+        strict (bool): Whether to also check the number against the NANP rules: the
+                       area code must be assigned (in the geo database, or toll-free)
+                       and the exchange code must not start with 0 or 1 nor be an
+                       N11 service code. Without the geo database, the area code
+                       is only checked to follow the same form as exchange codes.
 
     Returns:
         bool: True if the phone number matches the U.S. phone number format, False otherwise.
     """
-    return bool(US_PHONE_PATTERN.fullmatch(phone))
+    match = US_PHONE_PATTERN.fullmatch(phone)
+    if match is None:
+        return False
+    return not strict or _nanp_tables().is_valid(_match_digits(match))
+
+
+def iter_phone_numbers(text: str, strict: bool = False) -> Iterator[PhoneMatch]:
+    """
+    Finds the U.S. phone numbers of a text, in a single pass of the pattern.
+
+    Args:
+        text (str): The text to search.
+        strict (bool): Whether to skip numbers that break the NANP rules (see `is_valid_phone`).
+
+    Yields:
+        PhoneMatch: Each number, in order of appearance, with its span in the text.
+
+    Example:
+        >>> [m.span for m in iter_phone_numbers("Call 617-495-1000 now")]
+        [(5, 17)]
+    """
+    tables = _nanp_tables() if strict else None
+    for match in US_PHONE_PATTERN.finditer(text):
+        paren_area_code, area_code, exchange, line = match.groups()
+        phone = PhoneMatch(*match.span(), paren_area_code or area_code, exchange, line)
+        if tables is None or tables.is_valid(phone.digits):
+            yield phone
 
 
-def extract_phone_number(text: str) -> Optional[str]:
+def extract_phone_number(text: str, strict: bool = False) -> Optional[str]:
     """
     Formats a valid U.S. phone number to the standard format: (123) 456-7890.
 
     Args:
         text (str): The text string to find phone from. It should contain a valid U.S. phone number.
+        strict (bool): Whether to skip numbers that break the NANP rules (see `is_valid_phone`).
 
     Returns:
         str: The phone number formatted in the standard U.S. format (123) 456-7890.
@@ -52,16 +159,11 @@ def extract_phone_number(text: str) -> Optional[str]:
         >>> extract_phone_number("1234567890")
         '(123) 456-7890'
     """
-    try:
-        matched_phone = US_PHONE_PATTERN.findall(text)[0]
-        phone = "".join(matched_phone)
-        cleaned = cleaned_phone(phone)
-        return f"({cleaned[:3]}) {cleaned[3:6]}-{cleaned[6:]}"
-    except Exception:
-        return None
+    phone = next(iter_phone_numbers(text, strict), None)
+    return phone.formatted if phone is not None else None
 
 
-def extract_phone_numbers(text: str) -> List[str]:
+def extract_phone_numbers(text: str, strict: bool = False) -> List[str]:
     """
     Extracts all U.S. phone numbers from a given text.
 
@@ -71,6 +173,7 @@ def extract_phone_numbers(text: str) -> List[str]:
 
     Args:
         text (str): The input text from which to extract phone numbers.
+        strict (bool): Whether to skip numbers that break the NANP rules (see `is_valid_phone`).
 
     Returns:
         list of str: A list of strings, each representing a U.S. phone number in the format (XXX) XXX-XXXX.
@@ -79,17 +182,118 @@ def extract_phone_numbers(text: str) -> List[str]:
         >>> extract_phone_numbers("Contact us at (123) 456-7890 or (987) 654-3210.")
         ['(123) 456-7890', '(987) 654-3210']
     """
-    results = []
-    try:
-        matched_phones = US_PHONE_PATTERN.findall(text)
-        for matched_phone in matched_phones:
-            ph = extract_phone_number("".join(matched_phone))
-            if ph:
-                results.append(ph)
-    except ValueError:
-        pass
-    finally:
-        return results
+    return [phone.formatted for phone in iter_phone_numbers(text, strict)]
+
+
+def scan_file(
+    file_path: str, strict: bool = False, chunk_size: int = mmapscan.CHUNK_SIZE
+) -> Iterator[Tuple[int, int, str]]:
+    """
+    Scans a file for U.S. phone numbers without reading it into memory.
+
+    The file is memory-mapped and its bytes are searched in place, one window
+    at a time, so memory use stays constant however large the file is. Numbers
+    are found as by `extract_phone_numbers` on the file's text; digits are
+    ASCII digits only.
+
+    Args:
+        file_path (str): The file to scan.
+        strict (bool): Whether to skip numbers that break the NANP rules (see `is_valid_phone`).
+        chunk_size (int): The number of bytes scanned per window.
+
+    Yields:
+        tuple: The start and end byte offsets of each phone number in the file,
+               and the number formatted as (XXX) XXX-XXXX.
+
+    Raises:
+        OSError: If the file cannot be opened.
+
+    Example:
+        >>> for start, end, phone in scan_file("export.csv"):
+        ...     print(start, phone)
+        1045 (617) 495-1000
+    """
+    tables = _nanp_tables() if strict else None
+
+    def convert(match: "re.Match[bytes]") -> Optional[str]:
+        digits = _match_digits(match).decode("ascii")
+        if tables is not None and not tables.is_valid(digits):
+            return None
+        return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+
+    return mmapscan.scan_file(file_path, US_PHONE_BYTES_PATTERN, convert, chunk_size)
+
+
+def extract_phone_numbers_many(
+    documents: Iterable[str],
+    strict: bool = False,
+    paths: bool = False,
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+) -> Iterator[List[str]]:
+    """
+    Extracts the U.S. phone numbers of many documents, in parallel processes.
+
+    Documents are sent to a pool of `workers` processes `chunksize` at a time,
+    with a bounded number of chunks in flight, so arbitrarily long inputs are
+    streamed rather than held in memory. Results come back in input order.
+
+    Args:
+        documents (Iterable[str]): The texts to search, or the paths of the files
+                                   to scan if `paths` is True.
+        strict (bool): Whether to skip numbers that break the NANP rules (see `is_valid_phone`).
+        paths (bool): Whether `documents` are file paths, scanned with `scan_file`.
+        workers (int | None): The number of worker processes. Defaults to one per
+                              CPU; 1 extracts in the calling process.
+        chunksize (int): The number of documents sent to a worker at a time.
+                         Larger chunks amortize the cost of sending them for
+                         short documents.
+
+    Returns:
+        Iterator[List[str]]: For each document, in order, its phone numbers as
+                             returned by `extract_phone_numbers`.
+
+    Raises:
+        ValueError: If `workers` or `chunksize` is less than 1.
+        OSError: If `paths` is True and a file cannot be opened.
+
+    Example:
+        >>> for phones in extract_phone_numbers_many(emails, workers=4):
+        ...     print(phones)
+    """
+    if strict:
+        # loaded before the pool starts, so forked workers share the tables
+        _nanp_tables()
+    return parallel.ordered_map(
+        partial(_extract_phone_numbers_chunk, strict, paths),
+        documents,
+        workers,
+        chunksize,
+    )
+
+
+def _extract_phone_numbers_chunk(
+    strict: bool, paths: bool, documents: List[str]
+) -> List[List[str]]:
+    if paths:
+        return [
+            [phone for _, _, phone in scan_file(path, strict)] for path in documents
+        ]
+    return [extract_phone_numbers(text, strict) for text in documents]
+
+
+def _nanp_tables():
+    index = GeoService().index
+    # without the geo database, no area code is known to be assigned: rather than
+    # rejecting every number, only the NXX form of the area code is checked
+    if not len(index.store):
+        return NXX_TABLES
+    return index.nanp
+
+
+def _match_digits(match: "re.Match"):
+    # the area code is in group 1 when parenthesized, in group 2 otherwise
+    return (match.group(1) or match.group(2)) + match.group(3) + match.group(4)
 
 
 def get_area_code(phone: str) -> str:
@@ -130,7 +334,7 @@ def cleaned_phone(phone: str) -> str:
         ValueError: If the cleaned phone number does not have exactly 10 digits, or if it has
                     11 digits but does not start with the country code '1'.
     """
-    digits = re.sub(r"\D", "", phone)
+    digits = NON_DIGIT_PATTERN.sub("", phone)
     if len(digits) == 10:
         return digits
     elif len(digits) == 11 and digits.startswith("1"):
@@ -155,7 +359,7 @@ def prettify(phone_str: str) -> Optional[str]:
                     otherwise None.
     """
     # Remove any non-numeric characters
-    digits = re.sub(r"\D", "", phone_str)
+    digits = NON_DIGIT_PATTERN.sub("", phone_str)
 
     # Check if it has exactly 10 or 11 digits (11 if includes leading '1' for US)
     if len(digits) == 10:
@@ -168,7 +372,117 @@ def prettify(phone_str: str) -> Optional[str]:
     return formatted_number
 
 
-def phone_number_insight(phone: str) -> Dict[str, Optional[str]]:
+def normalize_many(
+    phones: Iterable[str],
+    e164: bool = False,
+    strict: bool = False,
+    block_size: int = 65536,
+):
+    """
+    Normalizes many phone numbers at once, with NumPy array operations.
+
+    Each number is cleaned like `cleaned_phone` does: its non-digit characters
+    are dropped, and it is valid if 10 digits remain, or 11 starting with the
+    country code 1. The digits are decoded from the character codes of blocks of
+    `block_size` numbers at a time, so no Python object is built per number and
+    memory stays bounded by the block size.
+
+    Args:
+        phones (Iterable[str]): The phone numbers to normalize, such as a list or
+                                a NumPy string array. Only ASCII digits are
+                                recognized as digits.
+        e164 (bool): Whether to return E.164 strings ("+16174951000") instead of
+                     integers.
+        strict (bool): Whether numbers breaking the NANP rules are invalid (see
+                       `is_valid_phone`).
+        block_size (int): The number of phone numbers decoded at a time.
+
+    Returns:
+        tuple: A pair of arrays with one entry per input number:
+            - numbers (numpy.ndarray): The 10-digit numbers as uint64 (6174951000),
+              or as E.164 strings if `e164`; 0, or "", for invalid numbers.
+            - valid (numpy.ndarray): A boolean mask of the valid numbers.
+
+    Raises:
+        ImportError: If numpy is not installed.
+
+    Example:
+        >>> numbers, valid = normalize_many(["(617) 495-1000", "+1 907 835 4321", "n/a"])
+        >>> numbers
+        array([6174951000, 9078354321,          0], dtype=uint64)
+        >>> valid
+        array([ True,  True, False])
+    """
+    np = require_numpy()
+    tables = _nanp_tables() if strict else None
+    numbers_blocks, valid_blocks = [], []
+    if isinstance(phones, np.ndarray) and phones.dtype.kind == "U":
+        # already decoded: blocks are views of the array
+        blocks = (
+            phones[start : start + block_size]
+            for start in range(0, len(phones), block_size)
+        )
+    else:
+        blocks = parallel.chunked(phones, block_size)
+    for block in blocks:
+        numbers, valid = _normalize_block(np, block)
+        if tables is not None:
+            area_codes = np.frombuffer(tables.area_codes, dtype=np.uint8)
+            exchanges = np.frombuffer(tables.exchanges, dtype=np.uint8)
+            valid &= (
+                area_codes[numbers // 10_000_000] & exchanges[numbers // 10_000 % 1000]
+            ) > 0
+            numbers[~valid] = 0
+        numbers_blocks.append(numbers)
+        valid_blocks.append(valid)
+
+    if numbers_blocks:
+        numbers, valid = np.concatenate(numbers_blocks), np.concatenate(valid_blocks)
+    else:
+        numbers, valid = np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=bool)
+    if e164:
+        return _e164_strings(np, numbers, valid), valid
+    return numbers, valid
+
+
+def _normalize_block(np, phones):
+    chars = np.ascontiguousarray(phones, dtype=str)
+    numbers = np.zeros(len(chars), dtype=np.uint64)
+    valid = np.zeros(len(chars), dtype=bool)
+    width = chars.dtype.itemsize // 4
+    if not width:
+        return numbers, valid
+    # one row of character codes per number, shifted so that digits are 0-9
+    values = chars.view(np.uint32).reshape(len(chars), width) - np.uint32(48)
+    is_digit = values < 10
+    count = np.count_nonzero(is_digit, axis=1)
+    # the digits of every number, in order, and where each number's digits end
+    digits = values[is_digit].astype(np.uint8)
+    ends = np.cumsum(count)
+    powers = 10 ** np.arange(9, -1, -1, dtype=np.uint64)
+    for length in (10, 11):
+        rows = np.flatnonzero(count == length)
+        row_digits = digits[(ends[rows] - length)[:, None] + np.arange(length)]
+        if length == 11:
+            has_country_code = row_digits[:, 0] == 1
+            rows, row_digits = rows[has_country_code], row_digits[has_country_code, 1:]
+        numbers[rows] = row_digits @ powers
+        valid[rows] = True
+    return numbers, valid
+
+
+def _e164_strings(np, numbers, valid):
+    powers = 10 ** np.arange(9, -1, -1, dtype=np.uint64)
+    codes = np.empty((len(numbers), 12), dtype=np.uint32)
+    codes[:, 0] = ord("+")
+    codes[:, 1] = ord("1")
+    codes[:, 2:] = numbers[:, None] // powers % 10 + 48
+    strings = codes.view("U12").reshape(len(numbers))
+    strings[~valid] = ""
+    return strings
+
+
+def phone_number_insight(phone: str) -> AreaCodeInfo:
     """
     Provides detailed information about a given phone number.
 
@@ -176,32 +490,136 @@ def phone_number_insight(phone: str) -> Dict[str, Optional[str]]:
     and retrieves related information such as city, state, zip code,
     location coordinates, and timezone from a database service.
 
+    The result is an immutable record. It reads like a dictionary
+    (``info["city"]``) or through attributes (``info.city``);
+    `AreaCodeInfo.to_dict` returns a mutable copy. Numbers of the same area
+    code share their location and timezone records.
+
     Args:
         phone (str): The phone number to be analyzed.
 
     Returns:
-        dict: A dictionary containing the following keys:
+        AreaCodeInfo: A record with the following fields:
             - phone (str): The prettified phone number.
             - areaCode (str): The area code of the phone number.
             - city (str): The city associated with the area code.
             - state (str): The state associated with the area code.
             - stateISO (str): The ISO code of the state.
             - zipCode (str): The zip code associated with the area code.
-            - location (dict): A dictionary with 'latitude' and 'longitude' of the area.
-            - timezone (dict): A dictionary with 'name' and 'offset' of the timezone.
+            - location (Location): The 'latitude' and 'longitude' of the area.
+            - timezone (Timezone): The 'name' and 'offset' of the timezone.
     """
+    return _insight(GeoService().index, phone)
+
+
+def _insight(index, phone: str) -> AreaCodeInfo:
     cp = cleaned_phone(phone)
-    pp = prettify(cp)
-    area_code = get_area_code(pp)
-    npa_db = GeoService()
-    pinfo = npa_db.get_phone_info(area_code)
-    return {
-        "phone": pp,
-        "areaCode": area_code,
-        "city": pinfo.get("city", ""),
-        "state": pinfo.get("state", ""),
-        "stateISO": pinfo.get("stateISO", ""),
-        "zipCode": pinfo.get("zipCode", ""),
-        "location": pinfo.get("location", {"latitude": "", "longitude": ""}),
-        "timezone": pinfo.get("timezone", {"name": "", "offset": ""}),
-    }
+    cache = _insight_cache
+    if cache is not None:
+        return cache.get_or_compute(index, cp, lambda: _phone_number_insight(index, cp))
+    return _phone_number_insight(index, cp)
+
+
+def enable_insight_cache(maxsize: int = 4096) -> None:
+    """
+    Memoizes the results of `phone_number_insight`, keeping the `maxsize` most
+    recently used.
+
+    Results are cached by the digits of the phone number, so differently
+    formatted inputs of the same number share an entry, and numbers with an
+    unknown area code are cached too. A hit returns the very record of the
+    previous lookup instead of a new copy. The cache is emptied when the geo database is
+    reloaded. Enabling the cache again replaces it, resetting its counters.
+
+    Args:
+        maxsize (int): The maximum number of cached results.
+
+    Raises:
+        ValueError: If `maxsize` is less than 1.
+    """
+    global _insight_cache
+    _insight_cache = LRUCache(maxsize)
+
+
+def disable_insight_cache() -> None:
+    """Stops memoizing `phone_number_insight` and drops the cached results."""
+    global _insight_cache
+    _insight_cache = None
+
+
+def insight_cache_info() -> Optional[Dict[str, int]]:
+    """
+    Returns the counters of the `phone_number_insight` cache.
+
+    Returns:
+        dict | None: The "hits", "misses" and "evictions" since the cache was
+                     enabled, its "size" and "maxsize", or None if it is disabled.
+    """
+    cache = _insight_cache
+    return cache.info() if cache is not None else None
+
+
+def phone_number_insight_many(
+    phones: Iterable[str], skip_invalid: bool = False
+) -> List[Optional[AreaCodeInfo]]:
+    """
+    Provides detailed information about many phone numbers at once.
+
+    This is the batch counterpart of `phone_number_insight`. The database index is
+    resolved once for the whole batch, each distinct phone number is cleaned and
+    formatted once, and each distinct area code is looked up once. Results are
+    returned in input order; repeated inputs share the same record.
+
+    Args:
+        phones (Iterable[str]): The phone numbers to be analyzed.
+        skip_invalid (bool): If True, invalid phone numbers yield None instead of
+                             raising a ValueError.
+
+    Returns:
+        list: One record per input phone number, as returned by
+              `phone_number_insight` (or None for invalid numbers if `skip_invalid`).
+
+    Raises:
+        ValueError: If a phone number is not a valid U.S. phone number and
+                    `skip_invalid` is False.
+    """
+    return _insight_many(GeoService().index, phones, skip_invalid)
+
+
+def _insight_many(
+    index, phones: Iterable[str], skip_invalid: bool
+) -> List[Optional[AreaCodeInfo]]:
+    area_codes: Dict[str, AreaCodeInfo] = {}
+    resolved: Dict[str, Optional[AreaCodeInfo]] = {}
+    results = []
+    for phone in phones:
+        if phone in resolved:
+            results.append(resolved[phone])
+            continue
+
+        digits = NON_DIGIT_PATTERN.sub("", phone)
+        if len(digits) == 11 and digits[0] == "1":
+            digits = digits[1:]
+        if len(digits) != 10:
+            if not skip_invalid:
+                raise ValueError("Invalid U.S. phone number for cleaning")
+            resolved[phone] = None
+            results.append(None)
+            continue
+
+        area_code = digits[:3]
+        pp = f"({area_code}) {digits[3:6]}-{digits[6:]}"
+        record = area_codes.get(area_code)
+        if record is None:
+            record = area_codes[area_code] = index.area_code_record(area_code)
+        info = record.replace(phone=pp)
+        resolved[phone] = info
+        results.append(info)
+    return results
+
+
+def _phone_number_insight(index, digits: str) -> AreaCodeInfo:
+    # the record of the area code is shared; only the phone field differs per number
+    area_code = digits[:3]
+    pp = f"({area_code}) {digits[3:6]}-{digits[6:]}"
+    return index.area_code_record(area_code).replace(phone=pp)
@@ -0,0 +1,219 @@
+# uscodekit/records.py
+
+from collections.abc import Mapping
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class Record(Mapping):
+    """
+    An immutable record with a fixed set of fields, stored in ``__slots__``.
+
+    Records are read-only mappings of their fields, so they can be used like the
+    dictionaries they replace: ``info["city"]``, ``info.get("city")``,
+    ``dict(info)``, and equality with a dictionary of the same items. Fields are
+    also attributes (``info.city``). Since a record cannot be modified, a single
+    instance can be shared by every caller; `to_dict` returns a new, mutable copy.
+    """
+
+    __slots__ = ()
+
+    # the field names, in the order of the dictionary they replace
+    _fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # reads every field in one call, for `replace`
+        cls._values = attrgetter(*cls._fields) if len(cls._fields) > 1 else None
+        cls._positions = {name: position for position, name in enumerate(cls._fields)}
+
+    def __init__(self, *values: Any):
+        if len(values) != len(self._fields):
+            raise TypeError(
+                f"{type(self).__name__} takes {len(self._fields)} values, got {len(values)}."
+            )
+        for name, value in zip(self._fields, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __reduce__(self):
+        # slots are set through object.__setattr__, which the default pickling bypasses
+        return type(self), tuple(getattr(self, name) for name in self._fields)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+    def replace(self, **changes: Any) -> "Record":
+        """Returns a copy of the record with some fields replaced."""
+        values = list(self._values(self))
+        for name, value in changes.items():
+            values[self._positions[name]] = value
+        return type(self)(*values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the record as a new dictionary, nested records included."""
+        return {
+            name: value.to_dict() if isinstance(value, Record) else value
+            for name, value in ((name, getattr(self, name)) for name in self._fields)
+        }
+
+
+class Location(Record):
+    """The coordinates of a place, in degrees ("" when unknown)."""
+
+    __slots__ = _fields = ("latitude", "longitude")
+
+
+class Timezone(Record):
+    """A timezone, such as name "EST" and offset "UTC-5" ("" when unknown)."""
+
+    __slots__ = _fields = ("name", "offset")
+
+
+UNKNOWN_LOCATION = Location("", "")
+UNKNOWN_TIMEZONE = Timezone("", "")
+
+
+class ZipInfo(Record):
+    """
+    The details of a ZIP code, as returned by `uscodekit.zip_code.zip_code_insight`.
+
+    Fields: zipCode, areaCode, city, state, stateISO (strings, "" when unknown),
+    location (`Location`) and timezone (`Timezone`).
+    """
+
+    __slots__ = _fields = (
+        "zipCode",
+        "areaCode",
+        "city",
+        "state",
+        "stateISO",
+        "location",
+        "timezone",
+    )
+
+
+class AreaCodeInfo(Record):
+    """
+    The details of a phone number's area code, as returned by
+    `uscodekit.phone.phone_number_insight`.
+
+    Fields: phone (the formatted number), areaCode, city, state, stateISO and
+    zipCode (strings, "" when unknown), location (`Location`) and timezone
+    (`Timezone`).
+    """
+
+    __slots__ = _fields = (
+        "phone",
+        "areaCode",
+        "city",
+        "state",
+        "stateISO",
+        "zipCode",
+        "location",
+        "timezone",
+    )
+
+
+class NaicsCode(Record):
+    """
+    A code of the NAICS 2022 database, as returned by `NAICS2022Service.get`.
+
+    Fields: code and title, followed by any other field of the database record.
+    Nested values of these fields are frozen as well: lists become tuples and
+    dictionaries read-only mappings. `to_dict` returns them as new lists and
+    dictionaries.
+    """
+
+    __slots__ = ("code", "title", "_extra")
+    _fields = ("code", "title")
+
+    def __init__(self, code: str, title: str, extra: Optional[Dict[str, Any]] = None):
+        object.__setattr__(self, "code", code)
+        object.__setattr__(self, "title", title)
+        frozen = (
+            {key: _freeze(value) for key, value in extra.items()}
+            if extra
+            else _NO_EXTRA
+        )
+        object.__setattr__(self, "_extra", frozen)
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> "NaicsCode":
+        """Builds a code from a record of the database."""
+        extra = {key: value for key, value in record.items() if key not in cls._fields}
+        return cls(record.get("code"), record.get("title"), extra)
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "code":
+            return self.code
+        if key == "title":
+            return self.title
+        return self._extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield "code"
+        yield "title"
+        yield from self._extra
+
+    def __len__(self) -> int:
+        return 2 + len(self._extra)
+
+    def __eq__(self, other: Any) -> bool:
+        # frozen values compare equal to the lists and dictionaries they were built from
+        if isinstance(other, NaicsCode):
+            other = other.to_dict()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return type(self), (self.code, self.title, _thaw(self._extra))
+
+    def __repr__(self) -> str:
+        return f"NaicsCode(code={self.code!r}, title={self.title!r})"
+
+    def replace(self, **changes: Any) -> "NaicsCode":
+        return NaicsCode.from_dict({**self.to_dict(), **changes})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"code": self.code, "title": self.title, **_thaw(self._extra)}
+
+
+_NO_EXTRA: Dict[str, Any] = {}
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
@@ -0,0 +1,89 @@
+# uscodekit/reloader.py
+
+import threading
+from typing import Dict, Iterable, Optional
+
+from uscodekit.services import geo, naics
+from uscodekit.warmup import GEO, NAICS, select_datasets
+
+
+# looked up on each call, so that the services' functions can be replaced
+_RELOADERS = {
+    GEO: lambda: geo.reload_geo_index(),
+    NAICS: lambda: naics.reload_database(),
+}
+
+
+def reload(datasets: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+    """
+    Reloads the datasets whose files changed since they were loaded.
+
+    Each dataset is rebuilt on the calling thread, with the indexes that were in
+    use, while lookups keep using the current version; the new version is then
+    swapped in atomically. Datasets that were never loaded are left alone.
+
+    Args:
+        datasets (Iterable[str] | None): The datasets to check, among "geo" and
+                                         "naics". Defaults to all of them.
+
+    Returns:
+        dict: Whether a new version was swapped in, per dataset.
+
+    Raises:
+        ValueError: If a dataset is unknown.
+    """
+    return {name: _RELOADERS[name]() for name in select_datasets(datasets)}
+
+
+class DatasetWatcher(threading.Thread):
+    """
+    A daemon thread calling `reload` every `interval` seconds until stopped.
+
+    Checking for a change costs one ``stat`` per dataset file, so short intervals
+    are cheap; the reload itself runs on this thread, off the request path.
+    """
+
+    def __init__(
+        self, interval: float = 60.0, datasets: Optional[Iterable[str]] = None
+    ):
+        super().__init__(name="uscodekit-reloader", daemon=True)
+        self.interval = interval
+        self.datasets = select_datasets(datasets)
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                reload(self.datasets)
+            except Exception as e:
+                print(f"DatasetWatcher: {e!r}")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stops the watcher and waits for a reload in progress to finish."""
+        self._stopped.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+
+def watch(
+    interval: float = 60.0, datasets: Optional[Iterable[str]] = None
+) -> DatasetWatcher:
+    """
+    Starts watching the dataset files, reloading them when they change.
+
+    Args:
+        interval (float): Seconds between two checks.
+        datasets (Iterable[str] | None): The datasets to watch, among "geo" and
+                                         "naics". Defaults to all of them.
+
+    Returns:
+        DatasetWatcher: The started watcher; call its `stop()` to stop it.
+
+    Example:
+        >>> watcher = uscodekit.watch(interval=30)
+        >>> ...
+        >>> watcher.stop()
+    """
+    watcher = DatasetWatcher(interval, datasets)
+    watcher.start()
+    return watcher
@@ -4,16 +4,48 @@ import os
 import gzip
 import shutil
 import json
-from functools import lru_cache
-from typing import List, Dict
+import threading
+from functools import partial
+from typing import List, Dict, Iterable, Iterator, Optional, Union
 
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
 
 from uscodekit.configs import Config, GeoConfig
+from uscodekit.records import (
+    UNKNOWN_LOCATION,
+    UNKNOWN_TIMEZONE,
+    AreaCodeInfo,
+    Location,
+    Timezone,
+    ZipInfo,
+)
+from uscodekit.shared.fernetstream import decrypt_stream
+from uscodekit.shared.file import atomic_open, file_digest, report_missing_files
+from uscodekit.shared.singleflight import SingleFlight
+from uscodekit.services.geo_store import GeoStore, require_numpy
+from uscodekit.services.geo_spatial import (
+    SpatialIndex,
+    haversine_matrix,
+    haversine_miles,
+)
+from uscodekit.services.geo_postings import PostingIndex
+from uscodekit.services.geo_city_search import CitySearchIndex
+from uscodekit.services.geo_zip_bitmap import ZipCodeBitmap
+from uscodekit.services.geo_nanp import NanpTables
+from uscodekit.services.geo_snapshot import (
+    is_snapshot_fresh,
+    open_snapshot,
+    source_signature,
+    write_snapshot,
+)
 
 
-@lru_cache(maxsize=1)
 def get_cached_database() -> List[Dict]:
+    """
+    Reads the plaintext JSON copy written by `get_database`, if there is one.
+
+    Kept for compatibility; the service itself loads through `load_geo_store`.
+    """
     try:
         if not os.path.isfile(GeoConfig.decompressed_json_fp):
             return False
@@ -25,7 +57,21 @@ def get_cached_database() -> List[Dict]:
         return []
 
 
+_database_flight = SingleFlight()
+
+
 def get_database() -> List[Dict]:
+    """
+    Decrypts the geo database through intermediate files on disk.
+
+    Kept for compatibility; `stream_database` loads the same records in a single
+    pass without writing decompressed or decrypted copies. Concurrent calls share
+    a single decryption, and the intermediate files are replaced atomically.
+    """
+    return _database_flight.do(_decrypt_database)
+
+
+def _decrypt_database() -> List[Dict]:
     try:
         print("Loading encrypted database...", end="")
         # retrieve encryption key
@@ -36,7 +82,7 @@ def get_database() -> List[Dict]:
 
         # Check if the decompressed data file exists
         if not os.path.exists(GeoConfig.decompressed_data_fp):
-            with gzip.open(GeoConfig.encrypted_database_fp, "rb") as f_in, open(
+            with gzip.open(GeoConfig.encrypted_database_fp, "rb") as f_in, atomic_open(
                 GeoConfig.decompressed_data_fp, "wb"
             ) as f_out:
                 shutil.copyfileobj(f_in, f_out)
@@ -50,7 +96,7 @@ def get_database() -> List[Dict]:
 
         print("OK")
         # Cache the data
-        with open(GeoConfig.decompressed_json_fp, "w") as f:
+        with atomic_open(GeoConfig.decompressed_json_fp, "w") as f:
             f.write(json.dumps(json_data))
         if isinstance(json_data, list):
             return json_data
@@ -61,12 +107,426 @@ def get_database() -> List[Dict]:
         return []
 
 
+def stream_database() -> List[Dict]:
+    """
+    Loads the geo database straight from the compressed, encrypted file.
+
+    The file is gunzipped and base64-decoded as it is read, authenticated in a
+    first pass and decrypted in a second one, and the plaintext is parsed from
+    the single buffer it is collected into. Unlike `get_database`, no decompressed or decrypted copy is
+    written to disk and no intermediate whole-file buffers are kept.
+
+    Returns:
+        list[dict]: The records of the database, or an empty list if the database
+                    or the encryption key is missing or cannot be decrypted.
+    """
+    try:
+        print("Loading encrypted database...", end="")
+        with open(Config.encryption_key_fp, "rb") as key_file:
+            key = key_file.read()
+
+        with gzip.open(GeoConfig.encrypted_database_fp, "rb") as f:
+            plaintext = decrypt_stream(f, key)
+        json_data = json.loads(plaintext)
+        del plaintext
+
+        print("OK")
+        if isinstance(json_data, list):
+            return json_data
+        return []
+    except FileNotFoundError:
+        print("FAILED")
+        print(Config.file_missing_message)
+        return []
+    except (InvalidToken, ValueError) as e:
+        print("FAILED")
+        print(f"stream_database: {e!r}")
+        return []
+
+
+def load_geo_store() -> GeoStore:
+    """
+    Loads the geo database as a columnar store, preferring the binary snapshot.
+
+    When the snapshot at `GeoConfig.snapshot_fp` was built from the current
+    encrypted database it is memory-mapped, so worker processes share its pages
+    instead of each decrypting and parsing their own copy. Otherwise the database
+    is streamed from the encrypted file (see `stream_database`), converted and
+    written to a new snapshot, which is then mapped.
+
+    Returns:
+        GeoStore: The store, empty if the database could not be loaded.
+    """
+    source = source_signature(GeoConfig.encrypted_database_fp)
+    if is_snapshot_fresh(GeoConfig.snapshot_fp, source):
+        try:
+            return open_snapshot(GeoConfig.snapshot_fp)
+        except ValueError as e:
+            print(f"load_geo_store: {e}")
+
+    store = GeoStore.from_records(stream_database())
+    if not len(store):
+        return store
+    try:
+        write_snapshot(store, GeoConfig.snapshot_fp, source)
+        return open_snapshot(GeoConfig.snapshot_fp)
+    except (OSError, ValueError) as e:
+        print(f"load_geo_store: {e}")
+        return store
+
+
+class GeoIndex:
+    """
+    Lookup layer over the records of the geo database.
+
+    The index is built once when the database is loaded and is shared by every
+    ``GeoService`` instance. Records are held in a columnar ``GeoStore`` and only
+    materialized as dictionaries when they are looked up; zip code and area code
+    lookups go through the store's direct-address tables in constant time.
+
+    The immutable records returned by `zip_code_record` and `area_code_record`
+    are built the first time a row is looked up and then shared by every lookup.
+
+    The secondary indexes below are built on first use, once, however many
+    threads need them at the same time. The shared index returned by
+    `get_geo_index` builds all of them when the database is loaded, so no query
+    pays for a build.
+
+    Attributes
+    ----------
+    store : GeoStore
+        The columnar store holding every record of the database.
+    spatial : SpatialIndex
+        Grid index over the coordinates of the zip codes, built on first use.
+    postings : PostingIndex
+        Area code, state, city and timezone indexes to zip codes, built on first use.
+    city_search : CitySearchIndex
+        Trigram index over the city names, for typo-tolerant search, built on first use.
+    zip_bitmap : ZipCodeBitmap
+        Membership bitmap of the 5-digit zip codes, built on first use.
+    nanp : NanpTables
+        Area code and exchange validation tables of the NANP, built on first use.
+    """
+
+    def __init__(self, records: Union[List[Dict], GeoStore]):
+        if isinstance(records, GeoStore):
+            self.store = records
+        else:
+            self.store = GeoStore.from_records(records)
+        self._spatial: Optional[SpatialIndex] = None
+        self._postings: Optional[PostingIndex] = None
+        self._city_search: Optional[CitySearchIndex] = None
+        self._zip_bitmap: Optional[ZipCodeBitmap] = None
+        self._nanp: Optional[NanpTables] = None
+        # one build at a time per secondary index, however many threads need it
+        self._flights = {
+            name: SingleFlight()
+            for name in (
+                "_spatial",
+                "_postings",
+                "_city_search",
+                "_zip_bitmap",
+                "_nanp",
+            )
+        }
+        self._records: Optional[List[Dict]] = None
+        # records interned by row, and timezones by value, on first lookup
+        self._zip_records: Dict[int, ZipInfo] = {}
+        self._area_code_records: Dict[int, AreaCodeInfo] = {}
+        self._timezones: Dict[tuple, Timezone] = {}
+
+    def _build(self, name: str, build):
+        # single-flight: threads needing the index while it is built wait for it
+        return self._flights[name].do(partial(self._build_once, name, build))
+
+    def _build_once(self, name: str, build):
+        # another thread may have built the index since the caller looked
+        index = getattr(self, name)
+        if index is None:
+            index = build()
+            setattr(self, name, index)
+        return index
+
+    @property
+    def spatial(self) -> SpatialIndex:
+        if self._spatial is None:
+            return self._build("_spatial", partial(SpatialIndex, self.store))
+        return self._spatial
+
+    @property
+    def postings(self) -> PostingIndex:
+        if self._postings is None:
+            return self._build("_postings", partial(PostingIndex, self.store))
+        return self._postings
+
+    @property
+    def city_search(self) -> CitySearchIndex:
+        if self._city_search is None:
+            return self._build("_city_search", partial(CitySearchIndex, self.postings))
+        return self._city_search
+
+    @property
+    def zip_bitmap(self) -> ZipCodeBitmap:
+        if self._zip_bitmap is None:
+            return self._build(
+                "_zip_bitmap", partial(ZipCodeBitmap.from_store, self.store)
+            )
+        return self._zip_bitmap
+
+    @property
+    def nanp(self) -> NanpTables:
+        if self._nanp is None:
+            return self._build("_nanp", partial(NanpTables.from_store, self.store))
+        return self._nanp
+
+    def warm(self, like: Optional["GeoIndex"] = None) -> None:
+        """
+        Builds the secondary indexes now instead of on first use.
+
+        Args:
+            like (GeoIndex | None): If given, only the indexes already built on
+                                    this index are built.
+        """
+        if like is None or like._spatial is not None:
+            self.spatial
+        if like is None or like._postings is not None:
+            self.postings
+        if like is None or like._city_search is not None:
+            self.city_search
+        if like is None or like._zip_bitmap is not None:
+            self.zip_bitmap
+        if like is None or like._nanp is not None:
+            self.nanp
+
+    @property
+    def records(self) -> List[Dict]:
+        """
+        The records of the geo database as dictionaries, in their original order.
+
+        The list is materialized from the store on first access, at the cost of a
+        dictionary per row, and shared afterwards; per-field scans are cheaper
+        through `store.column` or `store.to_numpy`.
+        """
+        if self._records is None:
+            self._records = list(self.store.records())
+        return self._records
+
+    def zip_code_info(self, zip_code: str) -> Dict:
+        """Returns the record of a zip code, or an empty dictionary if unknown."""
+        row = self.store.zip_code_row(zip_code)
+        return self.store.record(row) if row >= 0 else {}
+
+    def area_code_info(self, area_code: str) -> Dict:
+        """Returns the first record of an area code, or an empty dictionary if unknown."""
+        row = self.store.area_code_row(area_code)
+        return self.store.record(row) if row >= 0 else {}
+
+    def zip_code_record(self, zip_code: str) -> ZipInfo:
+        """
+        Returns the shared, immutable record of a zip code.
+
+        Unknown zip codes get a new record whose other fields are empty.
+        """
+        row = self.store.zip_code_row(zip_code)
+        if row < 0:
+            return ZipInfo(zip_code, "", "", "", "", UNKNOWN_LOCATION, UNKNOWN_TIMEZONE)
+        record = self._zip_records.get(row)
+        if record is None:
+            info = self.store.record(row)
+            record = self._zip_records.setdefault(
+                row,
+                ZipInfo(
+                    zip_code,
+                    info.get("npa", ""),
+                    info.get("city", ""),
+                    info.get("state", ""),
+                    info.get("stateISO", ""),
+                    _location(info),
+                    self._timezone(info),
+                ),
+            )
+        return record
+
+    def area_code_record(self, area_code: str) -> AreaCodeInfo:
+        """
+        Returns the shared, immutable record of the first zip code of an area code.
+
+        The "phone" field of the record is empty. Unknown area codes get a new
+        record whose other fields are empty.
+        """
+        row = self.store.area_code_row(area_code)
+        if row < 0:
+            return AreaCodeInfo(
+                "", area_code, "", "", "", "", UNKNOWN_LOCATION, UNKNOWN_TIMEZONE
+            )
+        record = self._area_code_records.get(row)
+        if record is None:
+            info = self.store.record(row)
+            record = self._area_code_records.setdefault(
+                row,
+                AreaCodeInfo(
+                    "",
+                    area_code,
+                    info.get("city", ""),
+                    info.get("state", ""),
+                    info.get("stateISO", ""),
+                    info.get("zipCode", ""),
+                    _location(info),
+                    self._timezone(info),
+                ),
+            )
+        return record
+
+    def _timezone(self, info: Dict) -> Timezone:
+        timezone = info.get("timezone")
+        if not timezone:
+            return UNKNOWN_TIMEZONE
+        key = (timezone.get("name", ""), timezone.get("offset", ""))
+        interned = self._timezones.get(key)
+        if interned is None:
+            interned = self._timezones.setdefault(key, Timezone(*key))
+        return interned
+
+    def coordinates(self, zip_codes: Iterable[str]):
+        """
+        Returns the latitudes and longitudes of zip codes as two float64 arrays.
+
+        Unknown zip codes, and zip codes without coordinates, get NaN.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        np = require_numpy()
+        rows = np.fromiter(
+            (self.store.zip_code_row(zip_code) for zip_code in zip_codes), dtype="i8"
+        )
+        if not len(self.store) or "location.latitude" not in self.store.columns:
+            empty = np.full(len(rows), np.nan)
+            return empty, empty.copy()
+        known = rows >= 0
+        latitudes = np.full(len(rows), np.nan)
+        longitudes = np.full(len(rows), np.nan)
+        latitudes[known] = self.store.to_numpy("location.latitude")[rows[known]]
+        longitudes[known] = self.store.to_numpy("location.longitude")[rows[known]]
+        return latitudes, longitudes
+
+
+_geo_index: Optional[GeoIndex] = None
+_geo_index_flight = SingleFlight()
+# signature and content digest of the database file the shared index was built from
+_geo_source: Optional[Dict[str, int]] = None
+_geo_digest: Optional[str] = None
+_geo_reload_lock = threading.Lock()
+# returned while the database files are missing, rather than a new one per call
+_geo_empty_index: Optional[GeoIndex] = None
+
+
+def get_geo_index() -> GeoIndex:
+    """
+    Returns the shared index of the geo database, loading the database on first use.
+
+    Loading is single-flight: when several threads need the index before it is
+    loaded, one of them loads it, along with every secondary index, and the
+    others wait for its result.
+
+    A shared empty index is returned while the database files are missing; the
+    files are looked for again on the next call, so a later setup of the files
+    is picked up.
+    """
+    if _geo_index is not None:
+        return _geo_index
+    return _geo_index_flight.do(_load_geo_index)
+
+
+def _empty_geo_index() -> GeoIndex:
+    global _geo_empty_index
+    if _geo_empty_index is None:
+        _geo_empty_index = GeoIndex([])
+    return _geo_empty_index
+
+
+def _load_geo_index() -> GeoIndex:
+    global _geo_index, _geo_source, _geo_digest
+    # another thread may have loaded the index since the caller looked
+    if _geo_index is not None:
+        return _geo_index
+
+    if not os.path.isfile(GeoConfig.encrypted_database_fp):
+        report_missing_files()
+        return _empty_geo_index()
+
+    # taken before loading, so that a file replaced meanwhile is reloaded later;
+    # the digest lets the first reload check skip a file that was only touched
+    source = source_signature(GeoConfig.encrypted_database_fp)
+    digest = file_digest(GeoConfig.encrypted_database_fp)
+    index = GeoIndex(load_geo_store())
+    if len(index.store):
+        # built with the database, rather than by the first queries
+        index.warm()
+        _geo_source, _geo_digest = source, digest
+        _geo_index = index
+    return index
+
+
+def reload_geo_index() -> bool:
+    """
+    Reloads the shared index if the geo database file changed since it was loaded.
+
+    A change is detected from the size and modification time of the file, and
+    confirmed by a hash of its content, so a file that was only touched is not
+    reloaded. The new index and all of its secondary indexes are built on the
+    calling thread while lookups keep using the current index; it then replaces
+    the current index in a single assignment. Lookups in progress finish on the
+    index they started with.
+
+    Nothing happens if the index was never loaded, if a reload is already in
+    progress, or if the new database cannot be loaded.
+
+    Returns:
+        bool: True if a new index was swapped in.
+    """
+    global _geo_index, _geo_source, _geo_digest
+    if not _geo_reload_lock.acquire(blocking=False):
+        return False
+    try:
+        current = _geo_index
+        if current is None:
+            return False
+        source = source_signature(GeoConfig.encrypted_database_fp)
+        if source is None or source == _geo_source:
+            return False
+        digest = file_digest(GeoConfig.encrypted_database_fp)
+        if digest is not None and digest == _geo_digest:
+            _geo_source = source
+            return False
+
+        try:
+            index = GeoIndex(load_geo_store())
+        except (OSError, EOFError) as e:
+            # e.g. a file still being written
+            print(f"reload_geo_index: {e!r}")
+            return False
+        if not len(index.store):
+            # keep the current index; a later version of the file is tried again
+            _geo_source = source
+            return False
+        index.warm()
+        _geo_source, _geo_digest = source, digest
+        _geo_index = index
+        return True
+    finally:
+        _geo_reload_lock.release()
+
+
 class GeoService:
     """
     A service class to interact with a database containing geographical information.
 
     Methods
     -------
+    index : GeoIndex
+        Property that returns the shared index of the database, loading it on first use.
+
     database : list
         Property that returns the cached database if available, otherwise fetches the database.
         If the database file is not found, it prints a message and returns an empty list.
@@ -78,23 +538,165 @@ class GeoService:
     get_zip_code_info(zip_code: str) -> dict
         Returns information related to a given zip code from the database.
         If no information is found, returns an empty dictionary.
+
+    nearest_zip_codes(latitude: float, longitude: float, k: int = 1) -> list
+        Returns the `k` zip codes closest to a point, nearest first.
+
+    zip_codes_within(latitude: float, longitude: float, radius_miles: float) -> list
+        Returns the zip codes within a radius of a point, nearest first.
+
+    zip_codes_in_bbox(min_lat, min_lon, max_lat, max_lon) -> list
+        Returns the zip codes inside a bounding box, in ascending order.
+
+    distance(zip_a: str, zip_b: str) -> float | None
+        Returns the great-circle distance between two zip codes, in miles.
+
+    pairwise_distances(zips_a, zips_b) -> numpy.ndarray
+        Returns the dense matrix of distances between two lists of zip codes.
+
+    pairwise_top_k(zips_a, zips_b, k: int = 1, block_size: int = 1024) -> iterator
+        Yields, for each zip code of `zips_a`, its `k` closest zip codes of `zips_b`.
+
+    zip_codes_by(kind: str, value: str, state: str = None) -> list
+        Returns every zip code with a given area code, state, city or timezone.
+
+    count_zip_codes_by(kind: str, value: str, state: str = None) -> int
+        Returns the number of zip codes with a given area code, state, city or timezone.
+
+    search_city(query: str, state: str = None, top_n: int = 10) -> list
+        Returns the cities whose names best match a possibly misspelled query.
     """
 
     @property
-    def database(self) -> List[Dict]:
-        if not os.path.isfile(GeoConfig.encrypted_database_fp):
-            print(Config.file_missing_message)
-            return []
+    def index(self) -> GeoIndex:
+        return get_geo_index()
 
-        cached = get_cached_database()
-        if cached:
-            return cached
-        return get_database()
+    @property
+    def database(self) -> List[Dict]:
+        return self.index.records
 
     def get_phone_info(self, area_code: str) -> Dict:
-        result = list(filter(lambda x: x["npa"] == area_code, self.database))
-        return result[0] if result else {}
+        return self.index.area_code_info(area_code)
 
     def get_zip_code_info(self, zip_code: str) -> Dict:
-        result = list(filter(lambda x: x["zipCode"] == zip_code, self.database))
-        return result[0] if result else {}
+        return self.index.zip_code_info(zip_code)
+
+    def nearest_zip_codes(
+        self, latitude: float, longitude: float, k: int = 1
+    ) -> List[Dict]:
+        index = self.index
+        return _with_distances(index, index.spatial.nearest(latitude, longitude, k))
+
+    def zip_codes_within(
+        self, latitude: float, longitude: float, radius_miles: float
+    ) -> List[Dict]:
+        index = self.index
+        return _with_distances(
+            index, index.spatial.within(latitude, longitude, radius_miles)
+        )
+
+    def zip_codes_in_bbox(
+        self, min_lat: float, min_lon: float, max_lat: float, max_lon: float
+    ) -> List[str]:
+        index = self.index
+        rows = index.spatial.in_bbox(min_lat, min_lon, max_lat, max_lon)
+        return sorted(index.store.column("zipCode")[row] for row in rows)
+
+    def distance(self, zip_a: str, zip_b: str) -> Optional[float]:
+        store = self.index.store
+        row_a, row_b = store.zip_code_row(zip_a), store.zip_code_row(zip_b)
+        if row_a < 0 or row_b < 0 or "location.latitude" not in store.columns:
+            return None
+        latitudes = store.column("location.latitude")
+        longitudes = store.column("location.longitude")
+        lat_a, lon_a = latitudes.values[row_a], longitudes.values[row_a]
+        lat_b, lon_b = latitudes.values[row_b], longitudes.values[row_b]
+        if any(value != value for value in (lat_a, lon_a, lat_b, lon_b)):
+            return None
+        return haversine_miles(lat_a, lon_a, lat_b, lon_b)
+
+    def pairwise_distances(self, zips_a: Iterable[str], zips_b: Iterable[str]):
+        index = self.index
+        lat_a, lon_a = index.coordinates(zips_a)
+        lat_b, lon_b = index.coordinates(zips_b)
+        return haversine_matrix(lat_a, lon_a, lat_b, lon_b)
+
+    def pairwise_top_k(
+        self,
+        zips_a: Iterable[str],
+        zips_b: Iterable[str],
+        k: int = 1,
+        block_size: int = 1024,
+    ) -> Iterator[List[Dict]]:
+        np = require_numpy()
+        zips_b = list(zips_b)
+        index = self.index
+        lat_a, lon_a = index.coordinates(zips_a)
+        lat_b, lon_b = index.coordinates(zips_b)
+        k = max(0, min(k, len(zips_b)))
+        for start in range(0, len(lat_a), block_size):
+            block = haversine_matrix(
+                lat_a[start : start + block_size],
+                lon_a[start : start + block_size],
+                lat_b,
+                lon_b,
+            )
+            # unknown zip codes never rank
+            block[np.isnan(block)] = np.inf
+            if 0 < k < len(zips_b):
+                candidates = np.argpartition(block, k - 1, axis=1)[:, :k]
+            else:
+                candidates = np.broadcast_to(np.arange(k), (len(block), k))
+            for row, columns in zip(block, candidates):
+                columns = columns[np.argsort(row[columns], kind="stable")]
+                yield [
+                    {"zipCode": zips_b[c], "distance": float(row[c])}
+                    for c in columns.tolist()
+                    if row[c] != np.inf
+                ]
+
+    def zip_codes_by(
+        self, kind: str, value: str, state: Optional[str] = None
+    ) -> List[str]:
+        index = self.index
+        rows = index.postings.rows(kind, value, state)
+        return [index.store.column("zipCode")[row] for row in rows]
+
+    def count_zip_codes_by(
+        self, kind: str, value: str, state: Optional[str] = None
+    ) -> int:
+        return self.index.postings.count(kind, value, state)
+
+    def search_city(
+        self, query: str, state: Optional[str] = None, top_n: int = 10
+    ) -> List[Dict]:
+        index = self.index
+        search = index.city_search
+        zip_codes = index.store.column("zipCode")
+        results = []
+        for edits, entry in search.search(query, state, top_n):
+            city, state_name, state_iso = search.labels[entry]
+            results.append(
+                {
+                    "city": city,
+                    "state": state_name,
+                    "stateISO": state_iso,
+                    "zipCodes": [zip_codes[row] for row in search.rows(entry)],
+                    "edits": edits,
+                }
+            )
+        return results
+
+
+def _location(info: Dict) -> Location:
+    location = info.get("location")
+    if not location:
+        return UNKNOWN_LOCATION
+    return Location(location.get("latitude", ""), location.get("longitude", ""))
+
+
+def _with_distances(index: GeoIndex, matches: List) -> List[Dict]:
+    return [
+        {"zipCode": index.store.column("zipCode")[row], "distance": distance}
+        for distance, row in matches
+    ]
@@ -0,0 +1,293 @@
+# uscodekit/services/geo_city_search.py
+
+import heapq
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+from uscodekit.services.geo_postings import CITY, STATE, PostingIndex
+from uscodekit.services.geo_store import MISSING
+
+
+# Abbreviations expanded before names are indexed or searched, so that
+# "St Louis", "St. Louis" and "Saint Louis" all normalize to "saint louis".
+ABBREVIATIONS = {
+    "st": "saint",
+    "ste": "sainte",
+    "ft": "fort",
+    "mt": "mount",
+    "pt": "point",
+    "hts": "heights",
+    "spgs": "springs",
+    "jct": "junction",
+    "n": "north",
+    "s": "south",
+    "e": "east",
+    "w": "west",
+}
+
+_PUNCTUATION = re.compile(r"[^\w\s]+")
+_N = 3
+
+# The number of posting entries counted per query, beyond those needed to
+# guarantee that no match is missed. Counting more of them discards more
+# candidates before their edit distance is computed.
+_BUDGET = 1000
+
+_EMPTY = array("I")
+
+
+def normalize_city(name: str) -> str:
+    """
+    Normalizes a city name for fuzzy matching.
+
+    The name is case-folded, punctuation is dropped, whitespace is collapsed and
+    common abbreviations (``St``, ``Ft``, ``Mt``...) are expanded.
+    """
+    words = _PUNCTUATION.sub(" ", name.casefold()).split()
+    return " ".join(ABBREVIATIONS.get(word, word) for word in words)
+
+
+def max_edits(length: int) -> int:
+    """Returns the number of typos tolerated in a name of the given length."""
+    if length < 3:
+        return 0
+    return 1 if length < 6 else 2
+
+
+def trigrams(name: str) -> List[str]:
+    """Returns the distinct character trigrams of a normalized name, padded at both ends."""
+    padded = f"  {name} "
+    return list(
+        dict.fromkeys([padded[i : i + _N] for i in range(len(padded) - _N + 1)])
+    )
+
+
+def char_mask(name: str) -> int:
+    """Returns a bit set of the characters of a name (folded onto 64 bits)."""
+    mask = 0
+    for char in name:
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+def levenshtein(a: str, b: str, limit: Optional[int] = None) -> int:
+    """
+    Returns the edit distance between two strings.
+
+    Uses the bit-parallel algorithm of Myers (as extended by Hyyrö), which
+    processes a whole column of the dynamic-programming table per character, so
+    the cost is linear in the length of the strings rather than quadratic.
+
+    Args:
+        a (str): The first string.
+        b (str): The second string.
+        limit (int | None): If given, the computation may stop early and return
+                            any value above `limit` once the distance is known
+                            to exceed it.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not a:
+        return 0
+    return _bit_parallel_distance(_char_positions(a), len(a), b, limit)
+
+
+def _char_positions(pattern: str) -> Dict[str, int]:
+    positions: Dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        positions[char] = positions.get(char, 0) | (1 << i)
+    return positions
+
+
+def _bit_parallel_distance(
+    positions: Dict[str, int], m: int, text: str, limit: Optional[int] = None
+) -> int:
+    # `positions` maps each character of a non-empty pattern of length `m` to
+    # the bit set of its positions, so that it is computed once per pattern
+    if limit is not None and abs(m - len(text)) > limit:
+        return limit + 1
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv, score = full, 0, m
+    remaining = len(text)
+    for char in text:
+        eq = positions.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        remaining -= 1
+        # the score drops by at most one per remaining character
+        if limit is not None and score - remaining > limit:
+            return limit + 1
+        ph = (ph << 1) | 1
+        pv = ((mh << 1) | ~(xv | ph)) & full
+        mv = ph & xv & full
+    return score
+
+
+class CitySearchIndex:
+    """
+    Typo-tolerant search over the distinct (city, state) names of a geo store.
+
+    Every normalized city name is split into character trigrams, and each trigram
+    maps to the names containing it (globally and per state). A name within `k`
+    edits of a query shares all but at most ``3k`` of the query's trigrams, so a
+    query only counts the postings of its rarest trigrams, keeps the names
+    sharing enough of them, and computes the edit distance of the few survivors.
+
+    Names are numbered by length, so the names whose length is close enough to
+    the query's form a contiguous slice of every posting list.
+
+    Args:
+        postings (PostingIndex): The posting index of the store, whose city keys
+                                 give the names to search and their zip codes.
+    """
+
+    def __init__(self, postings: PostingIndex):
+        self.postings = postings
+        store = postings.store
+        cities = store.columns.get("city")
+        state_names = store.columns.get("state")
+        states = store.columns.get("stateISO")
+
+        # spellings that normalize alike (e.g. "St Paul" and "Saint Paul") share an entry
+        entries: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        for key in postings.postings[CITY]:
+            name = normalize_city(key[0])
+            if name:
+                entries.setdefault((name, key[1]), []).append(key)
+        ordered = sorted(entries, key=lambda entry: (len(entry[0]), entry))
+
+        self.names: List[str] = [name for name, _ in ordered]
+        self.states: List[str] = [state for _, state in ordered]
+        self.keys: List[List[Tuple[str, str]]] = [entries[entry] for entry in ordered]
+        # (city, state name, state ISO code) as spelled in the database
+        self.labels: List[Tuple[str, str, str]] = []
+        self.sizes = array("I")
+        self.masks = array("Q", [char_mask(name) for name in self.names])
+        # starts[n] is the first entry whose name is at least n characters long
+        longest = len(self.names[-1]) if self.names else 0
+        self.starts = array("I", [0]) * (longest + 2)
+
+        city_postings = postings.postings[CITY]
+        grams: Dict[str, List[int]] = {}
+        state_grams: Dict[str, Dict[str, List[int]]] = {}
+        length = 0
+        for entry, (name, state) in enumerate(ordered):
+            while length < len(name):
+                length += 1
+                self.starts[length] = entry
+            keys = self.keys[entry]
+            row = city_postings[keys[0]][0]
+            state_name = state_names[row] if state_names is not None else MISSING
+            self.labels.append(
+                (cities[row], "" if state_name is MISSING else state_name, states[row])
+            )
+            self.sizes.append(sum(len(city_postings[key]) for key in keys))
+            by_state = state_grams.setdefault(state, {})
+            for gram in trigrams(name):
+                grams.setdefault(gram, []).append(entry)
+                by_state.setdefault(gram, []).append(entry)
+        self.starts[longest + 1] = len(self.names)
+
+        self.grams: Dict[str, array] = {
+            gram: array("I", entries) for gram, entries in grams.items()
+        }
+        self.state_grams: Dict[str, Dict[str, array]] = {
+            state: {gram: array("I", entries) for gram, entries in by_state.items()}
+            for state, by_state in state_grams.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def search(
+        self, query: str, state: Optional[str] = None, top_n: int = 10
+    ) -> List[Tuple[int, int]]:
+        """
+        Returns the (edit distance, entry) pairs of the names best matching a query.
+
+        Matches are ordered by edit distance, then by their number of zip codes.
+        Names with too many typos (see `max_edits`) are not considered matches.
+
+        Args:
+            query (str): The (possibly misspelled or abbreviated) city name.
+            state (str | None): Restricts the search to one state (ISO code or name).
+            top_n (int): The maximum number of matches.
+        """
+        name = normalize_city(query)
+        if not name or top_n <= 0 or not self.names:
+            return []
+        if state is None:
+            grams = self.grams
+        else:
+            grams = self.state_grams.get(self.postings.key(STATE, state), {})
+        limit = max_edits(len(name))
+        longest = len(self.starts) - 2
+        lo = self.starts[min(max(0, len(name) - limit), longest + 1)]
+        hi = self.starts[min(len(name) + limit + 1, longest + 1)]
+
+        # the slice of each posting list holding names of a suitable length
+        query_grams = trigrams(name)
+        slices = []
+        for gram in query_grams:
+            posting = grams.get(gram)
+            if posting is not None:
+                start, stop = bisect_left(posting, lo), bisect_left(posting, hi)
+                if start < stop:
+                    slices.append((stop - start, start, posting))
+        slices.sort(key=itemgetter(0))
+
+        # a match lacks at most 3 * limit of the query's trigrams, some of which
+        # may already be absent from every candidate
+        slack = _N * limit - (len(query_grams) - len(slices))
+        counted = min(max(slack + 3, 0), len(slices))
+        total = sum(size for size, _, _ in slices[:counted])
+        while counted < len(slices) and total + slices[counted][0] <= _BUDGET:
+            total += slices[counted][0]
+            counted += 1
+        needed = counted - slack
+
+        selected = (
+            posting[start : start + size]
+            for size, start, posting in (slices if needed < 1 else slices[:counted])
+        )
+        if needed <= 1:
+            candidates = set(chain.from_iterable(selected))
+        else:
+            counts = Counter(chain.from_iterable(selected))
+            candidates = [entry for entry, count in counts.items() if count >= needed]
+
+        # every edit changes at most two characters of the character set
+        mask, masks, names = char_mask(name), self.masks, self.names
+        positions = _char_positions(name)
+        matches = []
+        for entry in candidates:
+            if bin(masks[entry] ^ mask).count("1") > 2 * limit:
+                continue
+            distance = _bit_parallel_distance(positions, len(name), names[entry], limit)
+            if distance <= limit:
+                matches.append((distance, -self.sizes[entry], entry))
+        return [
+            (distance, entry) for distance, _, entry in heapq.nsmallest(top_n, matches)
+        ]
+
+    def rows(self, entry: int) -> List[int]:
+        """Returns the rows of the zip codes of an entry, sorted by zip code."""
+        postings = self.postings.postings[CITY]
+        keys = self.keys[entry]
+        if len(keys) == 1:
+            return list(postings[keys[0]])
+        rows = [row for key in keys for row in postings[key]]
+        rows.sort(key=self.postings.store.columns["zipCode"].__getitem__)
+        return rows
@@ -0,0 +1,73 @@
+# uscodekit/services/geo_nanp.py
+
+from typing import Iterable
+
+from uscodekit.services.geo_store import AREA_CODE_SLOTS, GeoStore
+
+
+# Toll-free area codes: assigned, but not tied to a place of the geo database.
+TOLL_FREE_AREA_CODES = (800, 833, 844, 855, 866, 877, 888)
+
+
+def _nxx_table() -> bytearray:
+    # NXX: the first digit is 2-9, and N11 codes (211, 311... 911) are service codes
+    table = bytearray(AREA_CODE_SLOTS)
+    for code in range(200, 1000):
+        if code % 100 != 11:
+            table[code] = 1
+    return table
+
+
+# Exchange (central office) codes of the NANP, indexed by code.
+VALID_EXCHANGES = _nxx_table()
+
+
+class NanpTables:
+    """
+    Lookup tables of the North American Numbering Plan, indexed by 3-digit code.
+
+    `area_codes` flags the area codes (NPA) that follow the NXX form and are
+    assigned, and `exchanges` the exchange codes that follow the NXX form. A
+    10-digit number is checked with one integer parse and two byte lookups.
+
+    Args:
+        area_codes (Iterable[int]): The assigned area codes. Codes that do not
+                                    follow the NXX form are ignored.
+    """
+
+    __slots__ = ("area_codes", "exchanges")
+
+    def __init__(self, area_codes: Iterable[int] = ()):
+        self.area_codes = bytearray(AREA_CODE_SLOTS)
+        for code in area_codes:
+            if VALID_EXCHANGES[code]:
+                self.area_codes[code] = 1
+        for code in TOLL_FREE_AREA_CODES:
+            self.area_codes[code] = 1
+        self.exchanges = VALID_EXCHANGES
+
+    @classmethod
+    def from_store(cls, store: GeoStore) -> "NanpTables":
+        """Builds the tables with the area codes of a store, plus the toll-free ones."""
+        return cls(code for code, row in enumerate(store.area_code_rows) if row >= 0)
+
+    def is_valid(self, digits: str) -> bool:
+        """
+        Checks a 10-digit number (without country code) against the tables.
+
+        Args:
+            digits (str): The area code, exchange and line number digits.
+
+        Returns:
+            bool: True if the area code is assigned and the exchange is valid.
+        """
+        number = int(digits)
+        return bool(
+            self.area_codes[number // 10_000_000]
+            and self.exchanges[number // 10_000 % 1000]
+        )
+
+
+# Tables flagging every area code of the NXX form: the rules that can still be
+# checked when no assigned area code is known, i.e. without the geo database.
+NXX_TABLES = NanpTables(range(AREA_CODE_SLOTS))
@@ -0,0 +1,124 @@
+# uscodekit/services/geo_postings.py
+
+from array import array
+from typing import Dict, Hashable, Optional, Sequence
+
+from uscodekit.services.geo_store import MISSING, GeoStore
+
+
+# The kinds of key a posting index is kept for.
+AREA_CODE = "area_code"
+STATE = "state"
+CITY = "city"
+TIMEZONE = "timezone"
+
+KINDS = (AREA_CODE, STATE, CITY, TIMEZONE)
+
+_EMPTY = array("I")
+
+
+class PostingIndex:
+    """
+    Inverted indexes from area codes, states, cities and timezones to zip codes.
+
+    Each key maps to a posting list: the rows of every zip code carrying the key,
+    sorted by zip code. Lookups are a dictionary access, so listing the matches
+    costs time proportional to their number and counting them is constant-time.
+
+    Keys are normalized so that lookups are case-insensitive, and states can be
+    given either as their ISO code or as their name.
+
+    Args:
+        store (GeoStore): The store whose zip codes are indexed.
+    """
+
+    def __init__(self, store: GeoStore):
+        self.store = store
+        self.postings: Dict[str, Dict[Hashable, array]] = {kind: {} for kind in KINDS}
+        # state names (case-folded) to the case-folded ISO code used as the key
+        self.state_names: Dict[str, str] = {}
+
+        columns = store.columns
+        if "zipCode" not in columns:
+            return
+        zip_codes = columns["zipCode"]
+        area_codes = columns.get("npa")
+        states = columns.get("stateISO")
+        state_names = columns.get("state")
+        cities = columns.get("city")
+        timezones = columns.get("timezone.name")
+
+        # index each zip code once, through the row its lookups resolve to
+        rows = [
+            row
+            for row in range(len(store))
+            if store.zip_code_row(zip_codes[row]) == row
+        ]
+        rows.sort(key=zip_codes.__getitem__)
+
+        for row in rows:
+            state = _normalize(states[row]) if states is not None else None
+            if area_codes is not None:
+                self._add(AREA_CODE, _normalize(area_codes[row]), row)
+            if state is not None:
+                self._add(STATE, state, row)
+                if state_names is not None:
+                    name = _normalize(state_names[row])
+                    if name is not None:
+                        self.state_names.setdefault(name, state)
+            if cities is not None and state is not None:
+                city = _normalize(cities[row])
+                if city is not None:
+                    self._add(CITY, (city, state), row)
+            if timezones is not None:
+                self._add(TIMEZONE, _normalize(timezones[row]), row)
+
+    def _add(self, kind: str, key: Optional[Hashable], row: int) -> None:
+        if key is None:
+            return
+        posting = self.postings[kind].get(key)
+        if posting is None:
+            posting = self.postings[kind][key] = array("I")
+        posting.append(row)
+
+    def key(
+        self, kind: str, value: str, state: Optional[str] = None
+    ) -> Optional[Hashable]:
+        """
+        Normalizes a lookup value into the key of a posting list.
+
+        Raises:
+            ValueError: If `kind` is unknown, or a city is looked up without a state.
+        """
+        if kind not in self.postings:
+            raise ValueError(
+                f"Unknown index {kind!r}; expected one of {', '.join(KINDS)}."
+            )
+        if kind == STATE:
+            return self._state_key(value)
+        if kind == CITY:
+            if state is None:
+                raise ValueError("A city lookup needs the state of the city.")
+            city, state_key = _normalize(value), self._state_key(state)
+            return None if city is None or state_key is None else (city, state_key)
+        return _normalize(value)
+
+    def _state_key(self, state: str) -> Optional[str]:
+        state = _normalize(state)
+        return self.state_names.get(state, state)
+
+    def rows(self, kind: str, value: str, state: Optional[str] = None) -> Sequence[int]:
+        """Returns the posting list of a key: the matching rows, sorted by zip code."""
+        key = self.key(kind, value, state)
+        return self.postings[kind].get(key, _EMPTY)
+
+    def count(self, kind: str, value: str, state: Optional[str] = None) -> int:
+        """Returns the number of zip codes carrying a key."""
+        return len(self.rows(kind, value, state))
+
+
+def _normalize(value) -> Optional[str]:
+    if value is MISSING or value is None:
+        return None
+    value = str(value).strip().casefold()
+    return value or None
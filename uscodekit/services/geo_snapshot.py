@@ -0,0 +1,290 @@
+# uscodekit/services/geo_snapshot.py
+
+import sys
+import json
+import mmap
+import struct
+from array import array
+from typing import Any, Dict, Iterator, Optional
+
+from uscodekit.shared.file import atomic_open, file_signature
+from uscodekit.services.geo_store import (
+    MISSING,
+    CategoricalColumn,
+    FloatColumn,
+    GeoStore,
+    IntColumn,
+    typecode_of,
+)
+
+
+# Layout of a snapshot file:
+#
+#   magic (8 bytes) | version (u32) | manifest length (u32) | manifest (JSON)
+#   | padding to 8 bytes | data sections, each aligned to 8 bytes
+#
+# The manifest describes every column and lookup table as (offset, length)
+# ranges of the data area, so opening a snapshot only parses the manifest and
+# casts memoryviews over the mapped file: nothing is copied or decoded up front.
+MAGIC = b"USCKGEO\x00"
+VERSION = 2
+HEADER = struct.Struct("<8sII")
+ALIGNMENT = 8
+
+# Tags of the encoded categories of a dictionary-encoded column.
+_TAG_MISSING = 0
+_TAG_STR = ord("s")
+_TAG_JSON = ord("j")
+
+
+class SnapshotCategories:
+    """
+    Read-only view of the categories of a dictionary-encoded column, decoded
+    from the mapped snapshot on access.
+    """
+
+    __slots__ = ("_offsets", "_blob")
+
+    def __init__(self, offsets: memoryview, blob: memoryview):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> Any:
+        # codes are never negative; past the end, offsets[index + 1] raises IndexError
+        offsets = self._offsets
+        return _decode_category(self._blob[offsets[index] : offsets[index + 1]])
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def index(self, value: Any) -> int:
+        for index, category in enumerate(self):
+            if category == value and (category is MISSING) == (value is MISSING):
+                return index
+        raise ValueError(f"{value!r} is not a category")
+
+
+def _encode_category(value: Any) -> bytes:
+    if value is MISSING:
+        return bytes([_TAG_MISSING])
+    if isinstance(value, str):
+        return bytes([_TAG_STR]) + value.encode("utf-8")
+    return bytes([_TAG_JSON]) + json.dumps(value).encode("utf-8")
+
+
+def _decode_category(data: memoryview) -> Any:
+    tag = data[0]
+    if tag == _TAG_STR:
+        return str(data[1:], "utf-8")
+    if tag == _TAG_JSON:
+        return json.loads(str(data[1:], "utf-8"))
+    return MISSING
+
+
+class _SectionWriter:
+    def __init__(self):
+        self.chunks = []
+        self.length = 0
+
+    def add(self, data) -> Dict[str, int]:
+        data = bytes(data)
+        section = {"offset": self.length, "length": len(data)}
+        padding = -len(data) % ALIGNMENT
+        self.chunks.append(data + b"\x00" * padding)
+        self.length += len(data) + padding
+        return section
+
+
+def write_snapshot(
+    store: GeoStore, file_path: str, source: Optional[Dict[str, int]] = None
+) -> None:
+    """
+    Writes a geo store to a binary snapshot that `open_snapshot` can map.
+
+    The file is written next to its destination and moved into place, so processes
+    opening the snapshot concurrently never see a partially written file.
+
+    Args:
+        store (GeoStore): The store to write.
+        file_path (str): The destination of the snapshot.
+        source (dict | None): Signature of the database the store was built from
+                              (see `source_signature`), checked on open.
+    """
+    sections = _SectionWriter()
+    columns: Dict[str, Dict] = {}
+    for name in store.fields:
+        column = store.columns[name]
+        if isinstance(column, IntColumn):
+            columns[name] = {
+                "kind": "int",
+                "typecode": typecode_of(column.values),
+                "width": column.width,
+                "values": sections.add(column.values),
+                "overflow": sorted(column.overflow.items()),
+            }
+        elif isinstance(column, FloatColumn):
+            columns[name] = {
+                "kind": "float",
+                "values": sections.add(column.values),
+                "decimals": sections.add(column.decimals),
+                "overflow": sorted(column.overflow.items()),
+            }
+        else:
+            encoded = [_encode_category(value) for value in column.categories]
+            offsets = array("I", [0])
+            for data in encoded:
+                offsets.append(offsets[-1] + len(data))
+            columns[name] = {
+                "kind": "categorical",
+                "typecode": typecode_of(column.codes),
+                "codes": sections.add(column.codes),
+                "offsets": sections.add(offsets),
+                "blob": sections.add(b"".join(encoded)),
+                "overflow": sorted(column.overflow.items()),
+            }
+
+    manifest = {
+        "byteorder": sys.byteorder,
+        "size": store.size,
+        "source": source,
+        "fields": store.fields,
+        "columns": columns,
+        "zip_rows": sections.add(store.zip_rows),
+        "area_code_rows": sections.add(store.area_code_rows),
+        "extra_zip_rows": list(store.extra_zip_rows.items()),
+    }
+    manifest_data = json.dumps(manifest).encode("utf-8")
+    header = HEADER.pack(MAGIC, VERSION, len(manifest_data)) + manifest_data
+    header += b"\x00" * (-len(header) % ALIGNMENT)
+
+    with atomic_open(file_path, "wb") as f:
+        f.write(header)
+        for chunk in sections.chunks:
+            f.write(chunk)
+
+
+def read_manifest(file_path: str) -> Optional[Dict]:
+    """
+    Reads the manifest of a snapshot without mapping its data.
+
+    Returns:
+        dict | None: The manifest, or None if the file is missing or is not a
+                     snapshot this version of the package can read.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            return _parse_manifest(f.read(HEADER.size), f.read)
+    except OSError:
+        return None
+
+
+def _parse_manifest(header: bytes, read) -> Optional[Dict]:
+    try:
+        magic, version, length = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            return None
+        manifest = json.loads(read(length))
+    except (struct.error, ValueError):
+        return None
+    if manifest.get("byteorder") != sys.byteorder:
+        return None
+    return manifest
+
+
+def open_snapshot(file_path: str) -> GeoStore:
+    """
+    Opens a snapshot written by `write_snapshot` as a read-only, memory-mapped store.
+
+    Columns and lookup tables are memoryviews over the mapping, so every process
+    opening the same snapshot shares one copy of it in the page cache, and the
+    cost of opening does not depend on the size of the dataset.
+
+    Args:
+        file_path (str): The path of the snapshot.
+
+    Returns:
+        GeoStore: The store backed by the snapshot.
+
+    Raises:
+        ValueError: If the file is not a readable snapshot.
+    """
+    with open(file_path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # the manifest is read from the mapping itself, so a snapshot replaced
+    # while it is being opened can never be paired with another file's data
+    mm.seek(HEADER.size)
+    manifest = _parse_manifest(mm[: HEADER.size], mm.read)
+    if manifest is None:
+        mm.close()
+        raise ValueError(f"Not a valid geo snapshot: {file_path}")
+
+    header_length = mm.tell()
+    data = memoryview(mm)[header_length + (-header_length % ALIGNMENT) :]
+
+    def section(info: Dict[str, int], typecode: str = "B") -> memoryview:
+        return data[info["offset"] : info["offset"] + info["length"]].cast(typecode)
+
+    columns: Dict[str, Any] = {}
+    for name, info in manifest["columns"].items():
+        kind = info["kind"]
+        if kind == "int":
+            columns[name] = IntColumn(
+                name,
+                info["typecode"],
+                info["width"],
+                values=section(info["values"], info["typecode"]),
+                overflow=_overflow(info["overflow"]),
+            )
+        elif kind == "float":
+            columns[name] = FloatColumn(
+                name,
+                values=section(info["values"], "d"),
+                overflow=_overflow(info["overflow"]),
+                decimals=section(info["decimals"], "b"),
+            )
+        else:
+            categories = SnapshotCategories(
+                section(info["offsets"], "I"), section(info["blob"])
+            )
+            columns[name] = CategoricalColumn(
+                name,
+                categories=categories,
+                codes=section(info["codes"], info["typecode"]),
+                overflow=_overflow(info.get("overflow", ())),
+            )
+
+    store = GeoStore(
+        manifest["size"],
+        manifest["fields"],
+        columns,
+        zip_rows=section(manifest["zip_rows"], "i"),
+        area_code_rows=section(manifest["area_code_rows"], "i"),
+        extra_zip_rows={value: row for value, row in manifest["extra_zip_rows"]},
+    )
+    store.mapping = mm
+    return store
+
+
+def source_signature(file_path: str) -> Optional[Dict[str, int]]:
+    """
+    Returns the size and modification time of a file, used to tell whether a
+    snapshot was built from the current version of the database.
+    """
+    return file_signature(file_path)
+
+
+def is_snapshot_fresh(file_path: str, source: Optional[Dict[str, int]]) -> bool:
+    """Tells whether a snapshot exists and was built from the given source."""
+    manifest = read_manifest(file_path)
+    return (
+        manifest is not None and source is not None and manifest.get("source") == source
+    )
+
+
+def _overflow(items) -> Dict[int, Any]:
+    return {row: value for row, value in items}
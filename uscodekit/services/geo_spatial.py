@@ -0,0 +1,273 @@
+# uscodekit/services/geo_spatial.py
+
+import heapq
+import math
+from array import array
+from typing import Dict, List, Tuple
+
+from uscodekit.services.geo_store import GeoStore, require_numpy
+
+
+EARTH_RADIUS_MILES = 3958.8
+MILES_PER_DEGREE = math.pi * EARTH_RADIUS_MILES / 180
+
+
+def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Returns the great-circle distance between two points, in miles.
+
+    Args:
+        lat1 (float): Latitude of the first point, in degrees.
+        lon1 (float): Longitude of the first point, in degrees.
+        lat2 (float): Latitude of the second point, in degrees.
+        lon2 (float): Longitude of the second point, in degrees.
+
+    Returns:
+        float: The distance between the points along the surface of the earth.
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_MILES * math.asin(min(1.0, math.sqrt(a)))
+
+
+def haversine_matrix(lat1, lon1, lat2, lon2):
+    """
+    Returns the great-circle distances between two sets of points, in miles.
+
+    The computation is vectorized with NumPy: every pair is computed at once over
+    float arrays, without a Python-level loop. NaN coordinates yield NaN distances.
+
+    Args:
+        lat1, lon1 (array-like): Coordinates of the first set of points (length m), in degrees.
+        lat2, lon2 (array-like): Coordinates of the second set of points (length n), in degrees.
+
+    Returns:
+        numpy.ndarray: An (m, n) float64 array of distances.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    np = require_numpy()
+    phi1 = np.radians(np.asarray(lat1, dtype="d"))[:, None]
+    phi2 = np.radians(np.asarray(lat2, dtype="d"))[None, :]
+    lambda1 = np.radians(np.asarray(lon1, dtype="d"))[:, None]
+    lambda2 = np.radians(np.asarray(lon2, dtype="d"))[None, :]
+
+    # computed in place, so at most two (m, n) arrays are alive at once
+    a = lambda2 - lambda1
+    a *= 0.5
+    np.sin(a, out=a)
+    np.square(a, out=a)
+    a *= np.cos(phi1)
+    a *= np.cos(phi2)
+    b = phi2 - phi1
+    b *= 0.5
+    np.sin(b, out=b)
+    np.square(b, out=b)
+    a += b
+    del b
+    np.sqrt(a, out=a)
+    np.minimum(a, 1.0, out=a)
+    np.arcsin(a, out=a)
+    a *= 2 * EARTH_RADIUS_MILES
+    return a
+
+
+class SpatialIndex:
+    """
+    A uniform latitude/longitude grid over the zip codes of a geo store.
+
+    Every zip code with coordinates is bucketed into the grid cell holding it, so
+    box and radius queries only visit the cells they overlap, and nearest-neighbour
+    queries visit rings of cells around the query point until no unvisited cell can
+    hold anything closer than the neighbours already found.
+
+    Args:
+        store (GeoStore): The store whose zip codes are indexed.
+        cell_size (float): The side of a grid cell, in degrees.
+    """
+
+    def __init__(self, store: GeoStore, cell_size: float = 0.25):
+        self.store = store
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], array] = {}
+        self.latitudes = self.longitudes = ()
+        self.lat_range = self.lon_range = (0, -1)
+
+        columns = store.columns
+        if not {"zipCode", "location.latitude", "location.longitude"} <= set(columns):
+            return
+
+        zip_codes = columns["zipCode"]
+        latitudes = self.latitudes = columns["location.latitude"].values
+        longitudes = self.longitudes = columns["location.longitude"].values
+        for row in range(len(store)):
+            lat, lon = latitudes[row], longitudes[row]
+            if lat != lat or lon != lon:  # NaN: no coordinates
+                continue
+            # index each zip code once, through the row its lookups resolve to
+            if store.zip_code_row(zip_codes[row]) != row:
+                continue
+            key = (math.floor(lat / cell_size), math.floor(lon / cell_size))
+            cell = self.cells.get(key)
+            if cell is None:
+                cell = self.cells[key] = array("I")
+            cell.append(row)
+
+        if self.cells:
+            self.lat_range = (
+                min(i for i, _ in self.cells),
+                max(i for i, _ in self.cells),
+            )
+            self.lon_range = (
+                min(j for _, j in self.cells),
+                max(j for _, j in self.cells),
+            )
+
+    def __len__(self) -> int:
+        return sum(len(cell) for cell in self.cells.values())
+
+    def _rows_in_cells(self, i0: int, i1: int, j0: int, j1: int):
+        i0, i1 = max(i0, self.lat_range[0]), min(i1, self.lat_range[1])
+        j0, j1 = max(j0, self.lon_range[0]), min(j1, self.lon_range[1])
+        if i0 > i1 or j0 > j1:
+            return
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(self.cells):
+            for (i, j), cell in self.cells.items():
+                if i0 <= i <= i1 and j0 <= j <= j1:
+                    yield from cell
+            return
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                cell = self.cells.get((i, j))
+                if cell is not None:
+                    yield from cell
+
+    def in_bbox(
+        self, min_lat: float, min_lon: float, max_lat: float, max_lon: float
+    ) -> List[int]:
+        """Returns the rows whose coordinates fall inside a bounding box."""
+        if min_lat > max_lat or min_lon > max_lon:
+            raise ValueError(
+                "The minimum corner of the box must not exceed the maximum."
+            )
+        size = self.cell_size
+        latitudes, longitudes = self.latitudes, self.longitudes
+        return [
+            row
+            for row in self._rows_in_cells(
+                math.floor(min_lat / size),
+                math.floor(max_lat / size),
+                math.floor(min_lon / size),
+                math.floor(max_lon / size),
+            )
+            if min_lat <= latitudes[row] <= max_lat
+            and min_lon <= longitudes[row] <= max_lon
+        ]
+
+    def within(
+        self, lat: float, lon: float, radius_miles: float
+    ) -> List[Tuple[float, int]]:
+        """Returns (distance, row) pairs within a radius of a point, nearest first."""
+        if radius_miles < 0:
+            raise ValueError("The radius must not be negative.")
+        lat_delta = radius_miles / MILES_PER_DEGREE
+        # the widest longitude span is at the box edge closest to a pole
+        cos_edge = math.cos(math.radians(min(90.0, abs(lat) + lat_delta)))
+        if cos_edge * MILES_PER_DEGREE * 180 <= radius_miles:
+            lon_delta = 360.0
+        else:
+            lon_delta = radius_miles / (MILES_PER_DEGREE * cos_edge)
+
+        size = self.cell_size
+        results = []
+        for row in self._rows_in_cells(
+            math.floor((lat - lat_delta) / size),
+            math.floor((lat + lat_delta) / size),
+            math.floor((lon - lon_delta) / size),
+            math.floor((lon + lon_delta) / size),
+        ):
+            distance = haversine_miles(
+                lat, lon, self.latitudes[row], self.longitudes[row]
+            )
+            if distance <= radius_miles:
+                results.append((distance, row))
+        results.sort()
+        return results
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> List[Tuple[float, int]]:
+        """Returns the (distance, row) pairs of the `k` nearest zip codes, nearest first."""
+        if k <= 0 or not self.cells:
+            return []
+        size = self.cell_size
+        ci, cj = math.floor(lat / size), math.floor(lon / size)
+        # a max-heap of the best k, as (-distance, -row) so ties favour lower rows
+        best: List[Tuple[float, int]] = []
+        # rings closer than the nearest indexed cell are empty; start at that one
+        ring = max(
+            0,
+            self.lat_range[0] - ci,
+            ci - self.lat_range[1],
+            self.lon_range[0] - cj,
+            cj - self.lon_range[1],
+        )
+        while True:
+            if len(best) == k and self._ring_bound(lat, ring) > -best[0][0]:
+                break
+            if (
+                ci - ring < self.lat_range[0]
+                and ci + ring > self.lat_range[1]
+                and cj - ring < self.lon_range[0]
+                and cj + ring > self.lon_range[1]
+            ):
+                break
+            for row in self._ring_rows(ci, cj, ring):
+                distance = haversine_miles(
+                    lat, lon, self.latitudes[row], self.longitudes[row]
+                )
+                item = (-distance, -row)
+                if len(best) < k:
+                    heapq.heappush(best, item)
+                elif item > best[0]:
+                    heapq.heapreplace(best, item)
+            ring += 1
+        return sorted((-d, -r) for d, r in best)
+
+    def _ring_rows(self, ci: int, cj: int, ring: int):
+        if ring == 0:
+            yield from self.cells.get((ci, cj), ())
+            return
+        # walk the perimeter of the ring, clipped to the indexed cells
+        cells = self.cells
+        j0 = max(cj - ring, self.lon_range[0])
+        j1 = min(cj + ring, self.lon_range[1])
+        for i in (ci - ring, ci + ring):
+            if self.lat_range[0] <= i <= self.lat_range[1]:
+                for j in range(j0, j1 + 1):
+                    yield from cells.get((i, j), ())
+        i0 = max(ci - ring + 1, self.lat_range[0])
+        i1 = min(ci + ring - 1, self.lat_range[1])
+        for j in (cj - ring, cj + ring):
+            if self.lon_range[0] <= j <= self.lon_range[1]:
+                for i in range(i0, i1 + 1):
+                    yield from cells.get((i, j), ())
+
+    def _ring_bound(self, lat: float, ring: int) -> float:
+        # Lower bound of the distance from the query point to any cell of `ring`:
+        # such a cell is at least (ring - 1) cells away in latitude or longitude.
+        if ring <= 1:
+            return 0.0
+        gap = math.radians((ring - 1) * self.cell_size)
+        lat_bound = EARTH_RADIUS_MILES * gap
+        # hav(d) >= cos(phi1) cos(phi2) hav(dlon) >= cos(phi_max)^2 hav(dlon)
+        phi_max = math.radians(min(90.0, abs(lat) + (ring + 1) * self.cell_size))
+        lon_bound = (
+            2
+            * EARTH_RADIUS_MILES
+            * math.asin(min(1.0, math.cos(phi_max) * math.sin(min(gap, math.pi) / 2)))
+        )
+        return min(lat_bound, lon_bound)
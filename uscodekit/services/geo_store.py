@@ -0,0 +1,426 @@
+# uscodekit/services/geo_store.py
+
+import math
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+# Marks a field that is absent from a record (as opposed to present but empty).
+MISSING: Any = type("Missing", (), {"__repr__": lambda self: "MISSING"})()
+
+# Fields holding fixed-width digit strings, stored as unsigned integers.
+INT_FIELDS: Dict[str, Tuple[str, int]] = {
+    "zipCode": ("I", 5),
+    "npa": ("H", 3),
+    "nxx": ("H", 3),
+}
+
+# Fields holding coordinates, parsed to floats once at load time.
+FLOAT_FIELDS = ("location.latitude", "location.longitude")
+
+ZIP_CODE_SLOTS = 100000
+AREA_CODE_SLOTS = 1000
+
+
+def require_numpy():
+    """
+    Imports numpy, which is an optional dependency of the package.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "numpy is required for this feature. Install it with `pip install uscodekit[numpy]`."
+        )
+    return numpy
+
+
+class IntColumn:
+    """
+    A column of fixed-width digit strings (e.g. zip codes) stored as integers.
+
+    Values that are not exactly `width` ASCII digits are stored as the column's
+    sentinel and kept verbatim in `overflow`, keyed by row.
+    """
+
+    __slots__ = ("name", "width", "values", "overflow", "sentinel")
+
+    def __init__(
+        self,
+        name: str,
+        typecode: str,
+        width: int,
+        values: Optional[Sequence[int]] = None,
+        overflow: Optional[Dict[int, Any]] = None,
+    ):
+        self.name = name
+        self.width = width
+        self.values = array(typecode) if values is None else values
+        self.overflow: Dict[int, Any] = {} if overflow is None else overflow
+        self.sentinel = (1 << (8 * self.values.itemsize)) - 1
+
+    def append(self, value: Any) -> None:
+        if value is MISSING:
+            self.values.append(self.sentinel)
+        elif (
+            isinstance(value, str)
+            and len(value) == self.width
+            and value.isascii()
+            and value.isdigit()
+        ):
+            self.values.append(int(value))
+        else:
+            self.overflow[len(self.values)] = value
+            self.values.append(self.sentinel)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, row: int) -> Any:
+        value = self.values[row]
+        if value == self.sentinel:
+            return self.overflow.get(row, MISSING)
+        return str(value).zfill(self.width)
+
+    def to_numpy(self):
+        return require_numpy().frombuffer(self.values, dtype=typecode_of(self.values))
+
+
+class FloatColumn:
+    """
+    A column of floats (e.g. coordinates), parsed once from their string form.
+
+    Records keep the values as they appear in the database: for a string such as
+    "61.1380", `decimals` holds its number of decimals, so that it is formatted
+    back from the float on access. Values that are not formatted back exactly are
+    kept verbatim in `overflow`, and stored as NaN if they cannot be parsed.
+    """
+
+    __slots__ = ("name", "values", "decimals", "overflow")
+
+    def __init__(
+        self,
+        name: str,
+        values: Optional[Sequence[float]] = None,
+        overflow: Optional[Dict[int, Any]] = None,
+        decimals: Optional[Sequence[int]] = None,
+    ):
+        self.name = name
+        self.values = array("d") if values is None else values
+        self.decimals = array("b") if decimals is None else decimals
+        self.overflow: Dict[int, Any] = {} if overflow is None else overflow
+
+    def append(self, value: Any) -> None:
+        if value is MISSING:
+            self.values.append(math.nan)
+            self.decimals.append(_VERBATIM)
+            return
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            number = math.nan
+        self.decimals.append(_decimals(value, number))
+        if self.decimals[-1] == _VERBATIM:
+            self.overflow[len(self.values)] = value
+        self.values.append(number)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, row: int) -> Any:
+        decimals = self.decimals[row]
+        if decimals >= 0:
+            return f"{self.values[row]:.{decimals}f}"
+        if decimals == _NUMBER:
+            return self.values[row]
+        return self.overflow.get(row, MISSING)
+
+    def to_numpy(self):
+        return require_numpy().frombuffer(self.values, dtype="d")
+
+
+# `FloatColumn.decimals` of a value that was already a float, and of a value
+# kept in `overflow` (or missing).
+_NUMBER = -1
+_VERBATIM = -2
+
+
+def _decimals(value: Any, number: float) -> int:
+    if isinstance(value, float):
+        return _NUMBER
+    if not isinstance(value, str) or number != number:
+        return _VERBATIM
+    decimals = len(value) - value.index(".") - 1 if "." in value else 0
+    if decimals > 127 or f"{number:.{decimals}f}" != value:
+        return _VERBATIM
+    return decimals
+
+
+class CategoricalColumn:
+    """
+    A dictionary-encoded column: each distinct value is stored once in
+    `categories` and rows hold small integer codes into it.
+
+    Values that cannot be categories because they are not hashable (lists or
+    objects of the JSON database) are kept verbatim in `overflow`, keyed by row,
+    and their rows hold the code of `MISSING`.
+    """
+
+    __slots__ = ("name", "categories", "codes", "overflow", "_lookup")
+
+    def __init__(
+        self,
+        name: str,
+        categories: Optional[Sequence[Any]] = None,
+        codes: Optional[Sequence[int]] = None,
+        overflow: Optional[Dict[int, Any]] = None,
+    ):
+        self.name = name
+        self.categories = [] if categories is None else categories
+        self.codes = array("I") if codes is None else codes
+        self.overflow: Dict[int, Any] = {} if overflow is None else overflow
+        # the code of each category; built on first use for stores opened from a snapshot
+        self._lookup: Optional[Dict[Any, int]] = {} if categories is None else None
+
+    def append(self, value: Any) -> None:
+        try:
+            code = self._lookup.get(value)
+        except TypeError:
+            self.overflow[len(self.codes)] = value
+            value, code = MISSING, self._lookup.get(MISSING)
+        if code is None:
+            code = self._lookup[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+
+    def seal(self) -> None:
+        """Narrows the codes if possible, once every value was appended."""
+        if len(self.categories) <= 0xFFFF:
+            self.codes = array("H", self.codes)
+
+    def code_of(self, value: Any) -> int:
+        """Returns the code of a category, or -1 if the value never occurs."""
+        lookup = self._lookup
+        if lookup is None:
+            lookup = self._lookup = {
+                category: code for code, category in enumerate(self.categories)
+            }
+        try:
+            return lookup.get(value, -1)
+        except TypeError:
+            return -1
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> Any:
+        value = self.categories[self.codes[row]]
+        if value is MISSING and self.overflow:
+            return self.overflow.get(row, MISSING)
+        return value
+
+    def to_numpy(self):
+        np = require_numpy()
+        categories = np.array(
+            [None if c is MISSING else c for c in self.categories], dtype=object
+        )
+        values = categories[np.frombuffer(self.codes, dtype=typecode_of(self.codes))]
+        for row, value in self.overflow.items():
+            values[row] = value
+        return values
+
+
+def typecode_of(values: Sequence) -> str:
+    """Returns the item type of an array or a memoryview over one."""
+    return values.typecode if isinstance(values, array) else values.format
+
+
+def _flatten(record: Dict, prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{name}.")
+        else:
+            yield name, value
+
+
+class GeoStore:
+    """
+    Columnar, array-backed representation of the geo database.
+
+    Zip codes, area codes and exchanges live in unsigned integer arrays, coordinates
+    in float arrays, and every other field is dictionary-encoded, so the whole
+    dataset costs a few bytes per field per row instead of one dict per record.
+    Nested fields are addressed with dotted names such as ``"timezone.name"``.
+
+    Direct-address tables map a zip code (``0-99999``) and an area code (``0-999``)
+    to the row holding it, giving constant-time lookups without any per-key objects.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        fields: List[str],
+        columns: Dict[str, Any],
+        zip_rows: Optional[Sequence[int]] = None,
+        area_code_rows: Optional[Sequence[int]] = None,
+        extra_zip_rows: Optional[Dict[Any, int]] = None,
+    ):
+        self.size = size
+        self.fields = fields
+        self.columns = columns
+        # the mmap backing the store, when it was opened from a snapshot
+        self.mapping = None
+        # (column, parent keys, key) per field, so records rebuild without parsing names
+        self._layout = [
+            (columns[name], tuple(name.split(".")[:-1]), name.rsplit(".", 1)[-1])
+            for name in fields
+        ]
+        if zip_rows is None or area_code_rows is None:
+            self.zip_rows = array("i", [-1]) * ZIP_CODE_SLOTS
+            self.area_code_rows = array("i", [-1]) * AREA_CODE_SLOTS
+            self.extra_zip_rows: Dict[Any, int] = {}
+            self._build_lookup_tables()
+        else:
+            self.zip_rows = zip_rows
+            self.area_code_rows = area_code_rows
+            self.extra_zip_rows = extra_zip_rows or {}
+
+    @classmethod
+    def from_records(cls, records: List[Dict]) -> "GeoStore":
+        """
+        Builds a store from the records of the geo database.
+
+        Args:
+            records (list[dict]): The records, as decoded from the JSON database.
+
+        Returns:
+            GeoStore: The columnar store, with rows in the order of `records`.
+        """
+        fields: List[str] = []
+        columns: Dict[str, Any] = {}
+        for row, record in enumerate(records):
+            seen = set()
+            for name, value in _flatten(record):
+                column = columns.get(name)
+                if column is None:
+                    column = columns[name] = _new_column(name)
+                    fields.append(name)
+                    for _ in range(row):
+                        column.append(MISSING)
+                column.append(value)
+                seen.add(name)
+            if len(seen) != len(columns):
+                for name, column in columns.items():
+                    if name not in seen:
+                        column.append(MISSING)
+
+        for column in columns.values():
+            if isinstance(column, CategoricalColumn):
+                column.seal()
+        return cls(len(records), fields, columns)
+
+    def _build_lookup_tables(self) -> None:
+        zip_codes = self.columns.get("zipCode")
+        if isinstance(zip_codes, IntColumn):
+            sentinel = zip_codes.sentinel
+            for row, value in enumerate(zip_codes.values):
+                if value != sentinel:
+                    if self.zip_rows[value] == -1:
+                        self.zip_rows[value] = row
+                elif row in zip_codes.overflow:
+                    self.extra_zip_rows.setdefault(zip_codes.overflow[row], row)
+
+        area_codes = self.columns.get("npa")
+        if isinstance(area_codes, IntColumn):
+            sentinel = area_codes.sentinel
+            for row, value in enumerate(area_codes.values):
+                if value != sentinel and self.area_code_rows[value] == -1:
+                    self.area_code_rows[value] = row
+
+    def __len__(self) -> int:
+        return self.size
+
+    def zip_code_row(self, zip_code: str) -> int:
+        """Returns the row of a zip code, or -1 if it is not in the store."""
+        if len(zip_code) == 5 and zip_code.isascii() and zip_code.isdigit():
+            return self.zip_rows[int(zip_code)]
+        return self.extra_zip_rows.get(zip_code, -1)
+
+    def area_code_row(self, area_code: str) -> int:
+        """Returns the first row of an area code, or -1 if it is not in the store."""
+        if len(area_code) == 3 and area_code.isascii() and area_code.isdigit():
+            return self.area_code_rows[int(area_code)]
+        return -1
+
+    def record(self, row: int) -> Dict:
+        """
+        Rebuilds the record of a row in its original nested dictionary shape.
+
+        Args:
+            row (int): The row number.
+
+        Returns:
+            dict: A new dictionary holding the record's fields.
+        """
+        record: Dict = {}
+        for column, parents, key in self._layout:
+            value = column[row]
+            if value is MISSING:
+                continue
+            target = record
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            target[key] = value
+        return record
+
+    def records(self) -> Iterator[Dict]:
+        """Yields the records of every row, in order."""
+        for row in range(self.size):
+            yield self.record(row)
+
+    def column(self, name: str):
+        """
+        Returns a column by its (dotted) field name.
+
+        Integer and float columns expose their raw typed array as `values`,
+        dictionary-encoded columns expose `categories` and `codes`; all of them
+        support ``len()`` and indexing by row.
+
+        Raises:
+            KeyError: If the store has no such field.
+        """
+        return self.columns[name]
+
+    def to_numpy(self, name: Optional[str] = None):
+        """
+        Exports one column, or every column, as NumPy arrays.
+
+        Integer and float columns are exported zero-copy (``uint16``/``uint32``
+        and ``float64``); dictionary-encoded columns are decoded into object arrays.
+
+        Args:
+            name (str | None): The field to export. If None, every field is exported.
+
+        Returns:
+            numpy.ndarray | dict[str, numpy.ndarray]: The column, or a mapping of
+            field name to column.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        if name is not None:
+            return self.columns[name].to_numpy()
+        return {field: self.columns[field].to_numpy() for field in self.fields}
+
+
+def _new_column(name: str):
+    if name in INT_FIELDS:
+        typecode, width = INT_FIELDS[name]
+        return IntColumn(name, typecode, width)
+    if name in FLOAT_FIELDS:
+        return FloatColumn(name)
+    return CategoricalColumn(name)
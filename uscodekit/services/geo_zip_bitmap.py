@@ -0,0 +1,50 @@
+# uscodekit/services/geo_zip_bitmap.py
+
+from typing import Iterable
+
+from uscodekit.services.geo_store import ZIP_CODE_SLOTS, GeoStore
+
+
+class ZipCodeBitmap:
+    """
+    Membership bitmap of the 5-digit zip codes: one bit per zip code ``00000-99999``.
+
+    The whole set fits in 12.5 KB, and testing a zip code is an index into a
+    bytearray and a shift, so extracted candidates can be checked against the
+    dataset without hashing a string or going through the store.
+
+    Args:
+        zip_codes (Iterable[int]): The zip codes in the set, as integers.
+    """
+
+    __slots__ = ("bits", "count")
+
+    def __init__(self, zip_codes: Iterable[int] = ()):
+        self.bits = bytearray((ZIP_CODE_SLOTS + 7) // 8)
+        for value in zip_codes:
+            self.bits[value >> 3] |= 1 << (value & 7)
+        self.count = sum(bin(byte).count("1") for byte in self.bits)
+
+    @classmethod
+    def from_store(cls, store: GeoStore) -> "ZipCodeBitmap":
+        """Builds the bitmap of the zip codes that have a row in a store."""
+        if not len(store):
+            return cls()
+        return cls(value for value, row in enumerate(store.zip_rows) if row >= 0)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, zip_code) -> bool:
+        """
+        Tests a zip code, given as a 5-digit string or as a ZIP+4 string (whose
+        first five digits are tested).
+        """
+        if not isinstance(zip_code, str) or not zip_code.isascii():
+            return False
+        if len(zip_code) == 10 and zip_code[5] == "-" and zip_code[6:].isdigit():
+            zip_code = zip_code[:5]
+        if len(zip_code) != 5 or not zip_code.isdigit():
+            return False
+        value = int(zip_code)
+        return bool(self.bits[value >> 3] >> (value & 7) & 1)
@@ -1,55 +1,188 @@
 import os
-from functools import lru_cache
-from typing import List, Optional, Dict
+import threading
+from typing import Iterable, List, Optional, Dict
 
 from uscodekit.configs import NAICS2022Config, Config
+from uscodekit.records import NaicsCode
+from uscodekit.services.naics_index import NaicsIndex
+from uscodekit.shared.file import file_digest, file_signature, report_missing_files
 from uscodekit.shared.jsonfile import decrypt
+from uscodekit.shared.singleflight import SingleFlight
+
+
+_database: Optional[List[NaicsCode]] = None
+_database_flight = SingleFlight()
+# signature and content digest of the file the database was decrypted from
+_database_source: Optional[Dict[str, int]] = None
+_database_digest: Optional[str] = None
+_reload_lock = threading.Lock()
+# the index of the loaded database, built with it and replaced along with it
+_index: Optional[NaicsIndex] = None
+_index_flight = SingleFlight()
+# returned while the database files are missing
+_EMPTY_INDEX = NaicsIndex([])
+
+
+def get_database() -> List[NaicsCode]:
+    """
+    Returns the NAICS 2022 database, decrypting it on first use.
+
+    Each record is decrypted into an immutable `NaicsCode` once, when the
+    database is loaded; every lookup then returns these shared records.
+
+    Loading is single-flight: when several threads need the database before it
+    is loaded, one of them decrypts it and the others wait for its result. An
+    empty list is returned (and not cached) while the database files are missing.
+
+    Returns:
+        list[NaicsCode]: The records of the database.
+    """
+    if _database is not None:
+        return _database
+    return _database_flight.do(_load_database)
+
+
+def get_index() -> NaicsIndex:
+    """
+    Returns the index of the NAICS 2022 database, loading the database on first use.
+
+    The index is built along with the database, by the thread loading it, and
+    belongs to the database it was built from: once the database is replaced,
+    e.g. by `reload_database`, the next call returns the index of the new
+    database. A database replaced by other means is indexed on the next call,
+    single-flight like the loading. Lookups that hold on to an index keep a
+    consistent view of the database they started with.
+
+    A shared empty index is returned while the database files are missing.
+    """
+    # the database is read first: it is published after its index
+    database = get_database()
+    index = _index
+    if index is not None and index.records is database:
+        return index
+    if not database:
+        return _EMPTY_INDEX
+    return _index_flight.do(_build_index)
+
+
+def _build_index() -> NaicsIndex:
+    global _index
+    database = get_database()
+    # another thread may have indexed the database since the caller looked
+    if _index is None or _index.records is not database:
+        _index = NaicsIndex(database)
+    return _index
+
+
+def _load_database() -> List[NaicsCode]:
+    global _database, _database_source, _database_digest, _index
+    # another thread may have loaded the database since the caller looked
+    if _database is not None:
+        return _database
+
+    file_path = NAICS2022Config.encrypted_database_fp
+    if os.path.isfile(Config.encryption_key_fp) and os.path.isfile(file_path):
+        # the digest lets the first reload check skip a file that was only touched
+        _database_source = file_signature(file_path)
+        _database_digest = file_digest(file_path)
+        database = _records(decrypt(file_path))
+        # published before the database, so that the first lookup finds it ready
+        _index = NaicsIndex(database)
+        _database = database
+        return database
+    else:
+        report_missing_files()
+        return []
+
+
+def reload_database() -> bool:
+    """
+    Reloads the NAICS database if its file changed since it was loaded.
+
+    A change is detected from the size and modification time of the file and
+    confirmed by a hash of its content. The new database is decrypted on the
+    calling thread while lookups keep using the current one, then replaces it
+    in a single assignment.
+
+    Nothing happens if the database was never loaded, if a reload is already in
+    progress, or if the new file cannot be decrypted.
+
+    Returns:
+        bool: True if a new database was swapped in.
+    """
+    global _database, _database_source, _database_digest, _index
+    if not _reload_lock.acquire(blocking=False):
+        return False
+    try:
+        if _database is None:
+            return False
+        file_path = NAICS2022Config.encrypted_database_fp
+        source = file_signature(file_path)
+        if source is None or source == _database_source:
+            return False
+        digest = file_digest(file_path)
+        # the file is only looked at again once it changes again
+        _database_source = source
+        if digest is not None and digest == _database_digest:
+            return False
+        try:
+            database = _records(decrypt(file_path))
+        except Exception as e:
+            print(f"reload_database: {e!r}")
+            return False
+        index = NaicsIndex(database)
+        _database_digest = digest
+        # published before the database, so that the first lookup finds it ready
+        _index = index
+        _database = database
+        return True
+    finally:
+        _reload_lock.release()
+
+
+def _records(records: List[Dict]) -> List[NaicsCode]:
+    return [NaicsCode.from_dict(record) for record in records]
 
 
 class NAICS2022Service:
 
-    def __init__(self):
-        if os.path.isfile(Config.encryption_key_fp) and os.path.isfile(
-            NAICS2022Config.encrypted_database_fp
-        ):
-            self.data = self.search_database
-        else:
-            print(Config.file_missing_message)
-            self.data = []
+    @property
+    def index(self) -> NaicsIndex:
+        """The shared index of the database, loading the database on first use."""
+        return get_index()
 
     @property
-    @lru_cache(maxsize=1)
-    def search_database(self) -> List[Dict]:
+    def search_database(self) -> List[NaicsCode]:
         """
-        Property that returns a cached list of dictionaries representing the search database.
+        Property that returns the cached list of records representing the search database.
 
-        This method reads data from the file path specified in the NAICS2022Config.search_data_fp
-        and caches the result to improve performance on subsequent accesses.
+        The database is decrypted from NAICS2022Config.encrypted_database_fp on first
+        access and shared by every instance of the service (see `get_database`).
 
         Returns:
-            list[dict]: A list of dictionaries containing the search database data.
+            list[NaicsCode]: A list of immutable records containing the search database data.
         """
+        return get_database()
 
-        if os.path.isfile(Config.encryption_key_fp) and os.path.isfile(
-            NAICS2022Config.encrypted_database_fp
-        ):
-            return decrypt(NAICS2022Config.encrypted_database_fp)
-        else:
-            print(Config.file_missing_message)
-            return []
+    @property
+    def data(self) -> List[NaicsCode]:
+        return self.search_database
 
-    def get(self, code: str) -> Optional[Dict]:
+    def get(self, code: str) -> Optional[NaicsCode]:
         """
-        Retrieve a dictionary from the search database that matches the given code.
+        Retrieve the record from the search database that matches the given code.
+
+        The record is immutable and shared by every lookup; it reads like a
+        dictionary (``rec["title"]``) or through attributes (``rec.title``), and
+        `NaicsCode.to_dict` returns a mutable copy.
 
         Args:
             code (str): The code to search for in the database.
 
         Returns:
-            dict | None: The dictionary that matches the given code if found, otherwise None.
+            NaicsCode | None: The record that matches the given code if found, otherwise None.
         """
-        res = list(filter(lambda x: x["code"] == code, self.data))
-        return res[0] if res else None
+        return self.index.get(code)
 
     def industry_name(self, code: str) -> Optional[str]:
         """
@@ -62,20 +195,27 @@ class NAICS2022Service:
             dict | None: The dictionary that matches the given code if found, otherwise None.
         """
         try:
-            return self.get(code)["title"]
+            return self.get(code).title
         except Exception as e:
             return None
 
-    def search(self, query: str, top_n: int = 10) -> List[Dict]:
+    def search(self, query: str, top_n: int = 10) -> List[NaicsCode]:
         """
         Searches the database for matches on both 'code' and 'title' fields,
         prioritizing exact matches, prefix matches, and then partial matches.
 
+        Partial matches are found on the words of the titles (and descriptions,
+        where the database has them) through an inverted index built when the
+        database is loaded, and ranked by BM25: records matching more of the
+        query's words, and rarer ones, come first. The last word of the query
+        also matches the words it starts, so "public fin" finds "Public Finance".
+
         Parameters:
             query (str): The search query to match against both 'code' and 'title'.
+            top_n (int): The maximum number of results.
 
         Returns:
-            list: A sorted list of dictionaries matching the query, ranked by relevance.
+            list: A sorted list of the records matching the query, ranked by relevance.
 
         Example:
         >>> search('Public Finance') =>
@@ -84,38 +224,7 @@ class NAICS2022Service:
             {'code': '921130', 'title': 'Public Finance Activities'}
         ]
         """
-        # Normalize the query
-        query = query.strip().lower()
-
-        # Define scoring criteria
-        results = []
-
-        for entry in self.data:
-            code = entry["code"]
-            title = entry["title"].lower()
-
-            # Initialize relevance score
-            relevance_score = 0
-
-            # Check for exact matches in code or title (highest relevance)
-            if query == code or query == title:
-                relevance_score = 3
-            # Check for prefix match in code (high relevance)
-            elif code.startswith(query):
-                relevance_score = 2
-            # Check for partial match in title (medium relevance)
-            elif query in title:
-                relevance_score = 1
-
-            # If there's a match, add to results with relevance score
-            if relevance_score > 0:
-                results.append((relevance_score, entry))
-
-        # Sort results by relevance score in descending order
-        results.sort(key=lambda x: x[0], reverse=True)
-
-        # Return only the matched entries, without scores
-        return [entry for _, entry in results[:top_n]]
+        return self.index.search(query, top_n)
 
     def industry_hierarchy(self, code: str) -> Optional[Dict]:
         """
@@ -125,44 +234,37 @@ class NAICS2022Service:
         Parameters:
             code (str): The NAICS code for which to generate the hierarchy.
 
+        The levels are collected in a single walk up the prefix tree of the codes
+        (see `CodeTrie`). The sector of a code in a range of sectors, such as "311"
+        in Manufacturing ("31-33"), is that range.
+
         Returns:
-            dict: A hierarchical dictionary with details up to the specified code length.
+            dict: A hierarchical dictionary with details up to the specified code length;
+                  each level is the shared `NaicsCode` record of that level.
         """
-        rec = self.get(code)
-        if rec is None:
-            return None
+        return self.index.hierarchy(code)
+
+    def hierarchy_many(self, codes: Iterable[str]) -> List[Optional[Dict]]:
+        """
+        Generates the hierarchies of many NAICS codes at once, e.g. to enrich a table
+        of companies.
 
-        # Initialize the hierarchy dictionary
-        hierarchy = {
-            "sector": None,
-            "subsector": None,
-            "industry_group": None,
-            "naics_industry": None,
-            "national_industry": None,
-        }
-
-        # Determine hierarchy based on the length of the code
-        if len(code) >= 2:
-            hierarchy["sector"] = self.get(code[:2])
-        if len(code) >= 3:
-            hierarchy["subsector"] = self.get(code[:3])
-        if len(code) >= 4:
-            hierarchy["industry_group"] = self.get(code[:4])
-        if len(code) >= 5:
-            hierarchy["naics_industry"] = self.get(code[:5])
-        if len(code) == 6:
-            hierarchy["national_industry"] = self.get(code)
-
-        # Build the final record with available levels
-        record = {
-            "code": code,
-            "title": rec.get("title"),
-            "sector": hierarchy["sector"],
-            "subsector": hierarchy["subsector"],
-            "industry_group": hierarchy["industry_group"],
-            "naics_industry": hierarchy["naics_industry"],
-            "national_industry": hierarchy["national_industry"],
-        }
-
-        # Remove None entries for levels not included based on code length
-        return {k: v for k, v in record.items() if v is not None}
+        This is the batch counterpart of `industry_hierarchy`. The index is resolved
+        once for the whole batch and each distinct code is looked up once. Results
+        are returned in input order; repeated inputs share the same dictionary.
+
+        Parameters:
+            codes (Iterable[str]): The NAICS codes for which to generate the hierarchies.
+
+        Returns:
+            list: One hierarchy per input code, shaped like the result of
+                  `industry_hierarchy` (None for unknown codes).
+        """
+        index = self.index
+        resolved: Dict[str, Optional[Dict]] = {}
+        results = []
+        for code in codes:
+            if code not in resolved:
+                resolved[code] = index.hierarchy(code)
+            results.append(resolved[code])
+        return results
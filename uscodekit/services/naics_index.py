@@ -0,0 +1,211 @@
+# uscodekit/services/naics_index.py
+
+import heapq
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from uscodekit.records import NaicsCode
+from uscodekit.services.naics_search import CODE_PREFIX, EXACT, TEXT, TextSearchIndex
+
+
+# The levels of the NAICS hierarchy, by number of digits of their codes.
+SECTOR = "sector"
+SUBSECTOR = "subsector"
+INDUSTRY_GROUP = "industry_group"
+NAICS_INDUSTRY = "naics_industry"
+NATIONAL_INDUSTRY = "national_industry"
+
+LEVELS = (SECTOR, SUBSECTOR, INDUSTRY_GROUP, NAICS_INDUSTRY, NATIONAL_INDUSTRY)
+
+
+class _Node:
+    """A node of the code trie: one digit deeper than its parent."""
+
+    __slots__ = ("record", "parent", "children", "depth")
+
+    def __init__(self, parent: Optional["_Node"], depth: int):
+        self.record: Optional[NaicsCode] = None
+        self.parent = parent
+        self.children: Dict[str, "_Node"] = {}
+        self.depth = depth
+
+
+class CodeTrie:
+    """
+    Prefix tree over the digits of the NAICS codes.
+
+    Every node is a prefix of some code and holds the record of that prefix, if
+    it is a code. Walking up from a code visits each of its hierarchy levels in
+    one step per digit, and the subtree of a prefix holds every code starting
+    with it.
+
+    Sectors spanning several 2-digit codes, such as "31-33" (Manufacturing), are
+    held by the node of each of their 2-digit codes, so that they are found as
+    the sector of "311".
+
+    Args:
+        records (Iterable[NaicsCode]): The records of the database.
+    """
+
+    __slots__ = ("root",)
+
+    def __init__(self, records=()):
+        self.root = _Node(None, 0)
+        for record in records:
+            code = record.code
+            if not isinstance(code, str):
+                continue
+            if code.isdigit():
+                self._node(code, create=True).record = record
+            else:
+                for sector in _sector_range(code):
+                    node = self._node(sector, create=True)
+                    # a code of its own takes precedence over a range
+                    if node.record is None:
+                        node.record = record
+
+    def _node(self, code: str, create: bool = False) -> Optional[_Node]:
+        node = self.root
+        for digit in code:
+            child = node.children.get(digit)
+            if child is None:
+                if not create:
+                    return None
+                child = node.children[digit] = _Node(node, node.depth + 1)
+            node = child
+        return node
+
+    def levels(self, code: str) -> Dict[str, NaicsCode]:
+        """
+        Returns the records of the hierarchy levels of a code, from the sector
+        down to the code itself, by level name (see `LEVELS`).
+
+        Levels missing from the database are left out, as are all levels of a
+        code that is not a prefix of any code.
+        """
+        node = self._node(code) if code.isdigit() else None
+        levels: List[Tuple[str, NaicsCode]] = []
+        while node is not None and node.depth >= 2:
+            if node.record is not None and node.depth <= len(LEVELS) + 1:
+                levels.append((LEVELS[node.depth - 2], node.record))
+            node = node.parent
+        return dict(reversed(levels))
+
+    def with_prefix(self, prefix: str) -> Iterator[NaicsCode]:
+        """Yields the records of the codes starting with a prefix, shortest codes first."""
+        node = self._node(prefix) if prefix.isdigit() else None
+        if node is None:
+            return
+        nodes = [node]
+        # a range of sectors is held by several nodes, but is yielded once
+        ranges = set()
+        while nodes:
+            deeper = []
+            for node in nodes:
+                record = node.record
+                if record is not None and record.code.startswith(prefix):
+                    if record.code.isdigit():
+                        yield record
+                    elif id(record) not in ranges:
+                        ranges.add(id(record))
+                        yield record
+                deeper.extend(node.children.values())
+            nodes = deeper
+
+
+class NaicsIndex:
+    """
+    Lookup layer over the records of the NAICS database.
+
+    The index is built once per loaded database and shared by every
+    ``NAICS2022Service`` instance; a reload builds a new one.
+
+    Attributes
+    ----------
+    records : list[NaicsCode]
+        The records of the database, in their original order.
+    codes : dict[str, NaicsCode]
+        The records by code; the first record of a duplicated code is kept.
+    trie : CodeTrie
+        Prefix tree over the codes, for hierarchies and prefix searches.
+    text : TextSearchIndex
+        Inverted index over the words of the titles and descriptions.
+    """
+
+    def __init__(self, records: List[NaicsCode]):
+        self.records = records
+        self.codes: Dict[str, NaicsCode] = {}
+        # the position of each code's record in `records`
+        self.positions: Dict[str, int] = {}
+        for position, record in enumerate(records):
+            if record.code not in self.codes:
+                self.codes[record.code] = record
+                self.positions[record.code] = position
+        self.trie = CodeTrie(records)
+        self.text = TextSearchIndex(records)
+
+    def get(self, code: str) -> Optional[NaicsCode]:
+        """Returns the record of a code, or None if it is unknown."""
+        return self.codes.get(code)
+
+    def hierarchy(self, code: str) -> Optional[Dict]:
+        """
+        Returns the hierarchy of a code, shaped like the result of
+        `NAICS2022Service.industry_hierarchy`, or None if the code is unknown.
+        """
+        record = self.codes.get(code)
+        if record is None:
+            return None
+        hierarchy = {"code": code, "title": record.title}
+        if code.isdigit():
+            hierarchy.update(self.trie.levels(code))
+        else:
+            # a range of sectors, such as "31-33"
+            hierarchy[SECTOR] = record
+        return hierarchy
+
+    def search(self, query: str, top_n: int = 10) -> List[NaicsCode]:
+        """
+        Returns the records best matching a query, as `NAICS2022Service.search`.
+
+        Matches are ranked in tiers: an exact code or title first, then codes
+        starting with the query, then records matching words of the query, by
+        their BM25 score. Ties keep the order of the database. Only the posting
+        lists of the query's words and the subtree of its code prefix are read,
+        and the best `top_n` are selected with a heap rather than by sorting every
+        match.
+        """
+        query = query.strip().lower()
+        if top_n <= 0:
+            return []
+        if not query:
+            return self.records[:top_n]
+
+        # (tier, score) by position
+        matches: Dict[int, Tuple[int, float]] = {
+            position: (TEXT, score)
+            for position, score in self.text.scores(query).items()
+        }
+        if query.isdigit():
+            for record in self.trie.with_prefix(query):
+                position = self.positions[record.code]
+                tier = EXACT if record.code == query else CODE_PREFIX
+                matches[position] = (tier, matches.get(position, (TEXT, 0.0))[1])
+        elif query in self.positions:
+            position = self.positions[query]
+            matches[position] = (EXACT, matches.get(position, (TEXT, 0.0))[1])
+        for position in self.text.titles.get(query, ()):
+            matches[position] = (EXACT, matches.get(position, (TEXT, 0.0))[1])
+
+        best = heapq.nlargest(
+            top_n, matches.items(), key=lambda item: (item[1][0], item[1][1], -item[0])
+        )
+        return [self.records[position] for position, _ in best]
+
+
+def _sector_range(code: str) -> List[str]:
+    first, separator, last = code.partition("-")
+    if not separator or len(first) != 2 or len(last) != 2:
+        return []
+    if not (first.isdigit() and last.isdigit()) or first > last:
+        return []
+    return [f"{value:02d}" for value in range(int(first), int(last) + 1)]
@@ -0,0 +1,117 @@
+# uscodekit/services/naics_search.py
+
+import math
+import re
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+from uscodekit.records import NaicsCode
+
+
+# The fields of a record indexed for full-text search, when present.
+TEXT_FIELDS = ("title", "description")
+
+# BM25 parameters: term frequency saturation and length normalization.
+K1 = 1.2
+B = 0.75
+
+# The tiers of a match, best first in the ranking: an exact code or title, a
+# code starting with the query, then a match on the words of the text.
+EXACT = 3
+CODE_PREFIX = 2
+TEXT = 1
+
+# The shortest last word of a query that is expanded to the words it starts;
+# shorter ones would match a large part of the vocabulary.
+MIN_PREFIX = 3
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Splits a text into case-folded words, dropping punctuation."""
+    return _TOKEN.findall(text.casefold())
+
+
+class TextSearchIndex:
+    """
+    Inverted index over the words of the NAICS titles (and descriptions), ranked
+    with BM25.
+
+    Each word maps to a posting list of the records containing it, with its
+    number of occurrences. A query only reads the posting lists of its words, so
+    its cost grows with the number of records containing them rather than with
+    the size of the catalog. The last word of a query also matches the words it
+    is a prefix of, found by bisecting the sorted vocabulary, so that partly
+    typed queries find their matches; it must be at least `MIN_PREFIX` letters
+    long. Words are not matched on the middle of a word.
+
+    Args:
+        records (Sequence[NaicsCode]): The records of the database; postings refer
+                                       to their positions.
+    """
+
+    def __init__(self, records: Sequence[NaicsCode]):
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        # lower-cased titles to the positions of their records, for exact matches
+        self.titles: Dict[str, List[int]] = {}
+        lengths = []
+        for position, record in enumerate(records):
+            title = record.title
+            if isinstance(title, str):
+                self.titles.setdefault(title.strip().lower(), []).append(position)
+            counts: Dict[str, int] = {}
+            length = 0
+            for field in TEXT_FIELDS:
+                text = record.get(field)
+                if not isinstance(text, str):
+                    continue
+                for token in tokenize(text):
+                    counts[token] = counts.get(token, 0) + 1
+                    length += 1
+            for token, count in counts.items():
+                self.postings.setdefault(token, []).append((position, count))
+            lengths.append(length)
+
+        self.vocabulary = sorted(self.postings)
+        count = len(lengths)
+        average = sum(lengths) / count if count else 0.0
+        # the length part of the BM25 denominator, per record
+        self.norms = [
+            K1 * (1 - B + B * length / average) if average else K1 for length in lengths
+        ]
+        self.idf = {
+            token: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for token, postings in self.postings.items()
+        }
+
+    def terms(self, query: str) -> List[str]:
+        """
+        Returns the indexed words a query is searched with: its words, and the
+        words starting with its last word, if it has at least `MIN_PREFIX` letters.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+        terms = dict.fromkeys(token for token in tokens[:-1] if token in self.postings)
+        last = tokens[-1]
+        if len(last) < MIN_PREFIX:
+            if last in self.postings:
+                terms[last] = None
+            return list(terms)
+        vocabulary = self.vocabulary
+        for i in range(bisect_left(vocabulary, last), len(vocabulary)):
+            if not vocabulary[i].startswith(last):
+                break
+            terms[vocabulary[i]] = None
+        return list(terms)
+
+    def scores(self, query: str) -> Dict[int, float]:
+        """Returns the BM25 scores of the records matching the words of a query, by position."""
+        scores: Dict[int, float] = {}
+        for term in self.terms(query):
+            idf = self.idf[term]
+            for position, count in self.postings[term]:
+                score = idf * count * (K1 + 1) / (count + self.norms[position])
+                scores[position] = scores.get(position, 0.0) + score
+        return scores
@@ -0,0 +1,92 @@
+# uscodekit/shared/cache.py
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class LRUCache:
+    """
+    A thread-safe, size-bounded cache evicting the least recently used entries.
+
+    Entries can be bound to an owner, such as the index they were computed
+    from: `get_or_compute` drops every entry when it is called with another
+    owner, so results computed from a replaced index are never returned.
+
+    Hits, misses and evictions are counted from creation, across owners, to
+    size the cache from real traffic (see `info`).
+
+    Args:
+        maxsize (int): The maximum number of entries.
+
+    Raises:
+        ValueError: If `maxsize` is less than 1.
+    """
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._owner: Any = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(
+        self, owner: Any, key: Hashable, compute: Callable[[], Any]
+    ) -> Any:
+        """
+        Returns the cached value of a key, computing and caching it on a miss.
+
+        `compute` runs outside the lock, so concurrent misses of the same key may
+        both compute it; the last result is kept.
+        """
+        with self._lock:
+            if owner is not self._owner:
+                self._entries.clear()
+                self._owner = owner
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+        value = compute()
+        with self._lock:
+            if owner is self._owner:
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Drops every entry; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> Dict[str, int]:
+        """
+        Returns the counters of the cache.
+
+        Returns:
+            dict: "hits", "misses" and "evictions" since the cache was created,
+                  the current number of entries ("size") and the "maxsize".
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
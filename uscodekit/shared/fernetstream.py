@@ -0,0 +1,116 @@
+# uscodekit/shared/fernetstream.py
+
+import base64
+from typing import Any, BinaryIO, Callable
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.fernet import InvalidToken
+from cryptography.hazmat.primitives import hashes, hmac, padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+
+CHUNK_SIZE = 1 << 20
+
+# version (1) | timestamp (8) | iv (16)
+_HEADER_SIZE = 25
+_HMAC_SIZE = 32
+_WHITESPACE = b" \t\r\n"
+
+
+def decrypt_stream(
+    stream: BinaryIO, key: Any, chunk_size: int = CHUNK_SIZE
+) -> bytearray:
+    """
+    Decrypts a Fernet token read from a binary stream, chunk by chunk.
+
+    This is equivalent to ``Fernet(key).decrypt(stream.read())`` but never holds the
+    whole token in memory. The stream is read twice: a first pass authenticates
+    the whole token against its HMAC, and only once it is verified is the stream
+    rewound and the token decrypted into a single plaintext buffer. Nothing is
+    decrypted from a token that fails authentication.
+
+    Args:
+        stream (BinaryIO): A readable, seekable binary stream holding the token
+                           (e.g. a `gzip.open` file object).
+        key (bytes | str): The URL-safe base64-encoded Fernet key.
+        chunk_size (int): The number of bytes to read from the stream at a time.
+
+    Returns:
+        bytearray: The decrypted plaintext.
+
+    Raises:
+        cryptography.fernet.InvalidToken: If the token is malformed or was not
+                                          encrypted with the given key.
+    """
+    raw_key = base64.urlsafe_b64decode(key)
+    if len(raw_key) != 32:
+        raise ValueError("Fernet key must be 32 url-safe base64-encoded bytes.")
+
+    start = stream.tell()
+    header = bytearray()
+
+    def authenticate(data: bytes) -> None:
+        if len(header) < _HEADER_SIZE:
+            header.extend(data[: _HEADER_SIZE - len(header)])
+        signer.update(data)
+
+    signer = hmac.HMAC(raw_key[:16], hashes.SHA256())
+    signature = _read_token(stream, chunk_size, authenticate)
+    if len(header) < _HEADER_SIZE or header[0] != 0x80 or len(signature) != _HMAC_SIZE:
+        raise InvalidToken
+    try:
+        signer.verify(signature)
+    except InvalidSignature:
+        raise InvalidToken
+
+    stream.seek(start)
+    decryptor = Cipher(
+        algorithms.AES(raw_key[16:]), modes.CBC(header[9:25])
+    ).decryptor()
+    plaintext = bytearray()
+    skip = _HEADER_SIZE
+
+    def decrypt(data: bytes) -> None:
+        nonlocal skip
+        if skip:
+            data, skip = data[skip:], max(0, skip - len(data))
+        plaintext.extend(decryptor.update(data))
+
+    _read_token(stream, chunk_size, decrypt)
+    try:
+        plaintext += decryptor.finalize()
+        unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+        data = unpadder.update(bytes(plaintext[-16:])) + unpadder.finalize()
+    except ValueError:
+        raise InvalidToken
+    del plaintext[-16:]
+    plaintext += data
+    return plaintext
+
+
+def _read_token(
+    stream: BinaryIO, chunk_size: int, consume: Callable[[bytes], None]
+) -> bytes:
+    # Base64-decodes the token as it is read, passing the signed part (header and
+    # ciphertext) to `consume`, and returns the trailing HMAC.
+    pending = b""  # base64 text not yet forming a whole 4-character group
+    tail = b""  # decoded bytes held back because they may belong to the HMAC
+    while True:
+        chunk = stream.read(chunk_size)
+        if chunk:
+            pending += chunk.translate(None, _WHITESPACE)
+            usable = len(pending) - len(pending) % 4
+            text, pending = pending[:usable], pending[usable:]
+        else:
+            text, pending = pending, b""
+        try:
+            decoded = tail + base64.urlsafe_b64decode(text)
+        except ValueError:
+            raise InvalidToken
+        if len(decoded) > _HMAC_SIZE:
+            consume(decoded[:-_HMAC_SIZE])
+            tail = decoded[-_HMAC_SIZE:]
+        else:
+            tail = decoded
+        if not chunk:
+            return tail
@@ -2,6 +2,12 @@
 
 import shutil
 import os
+import hashlib
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Dict, Iterator, Optional
+
+from uscodekit.configs import Config
 
 
 def copy_file_to_dir(file_path: str, dest_dir: str) -> bool:
@@ -47,3 +53,74 @@ def rename_file(old_name: str, new_name: str) -> bool:
         return True
     except Exception as e:
         return False
+
+
+@contextmanager
+def atomic_open(file_path: str, mode: str = "wb") -> Iterator[IO]:
+    """
+    Opens a temporary file next to `file_path` for writing and moves it into
+    place once the block exits without an error.
+
+    Readers, including other processes, therefore see either the previous
+    file or the complete new one, never a partially written file.
+
+    :param file_path: The destination file path.
+    :param mode: The mode of the temporary file, "wb" or "w".
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def file_signature(file_path: str) -> Optional[Dict[str, int]]:
+    """
+    Returns the size and modification time of a file, a cheap way to tell
+    whether it changed, or None if it does not exist.
+
+    :param file_path: The file path.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def file_digest(file_path: str, chunk_size: int = 1 << 20) -> Optional[str]:
+    """
+    Returns the SHA-256 hex digest of a file's content, or None if it cannot be read.
+
+    :param file_path: The file path.
+    :param chunk_size: The number of bytes hashed at a time.
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+_missing_reported = False
+
+
+def report_missing_files() -> None:
+    """
+    Prints the message telling how to get the database files, once per process.
+
+    Lookups look for missing files again on every call, so that files set up
+    later are picked up; the message is only printed the first time.
+    """
+    global _missing_reported
+    if not _missing_reported:
+        _missing_reported = True
+        print(Config.file_missing_message)
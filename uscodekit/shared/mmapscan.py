@@ -0,0 +1,110 @@
+# uscodekit/shared/mmapscan.py
+
+import mmap
+import os
+import re
+from typing import Callable, Iterator, List, Optional, Pattern, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+# Bytes scanned per window; a multiple of every page size in use.
+CHUNK_SIZE = 1 << 20
+# Bytes scanned past the end of a window, so that a match starting in the window
+# is seen whole; must exceed the length of the longest match.
+OVERLAP = 64
+
+
+def bytes_pattern(pattern: Pattern[str]) -> Pattern[bytes]:
+    """
+    Compiles the bytes counterpart of an ASCII str pattern, with the same flags.
+
+    Character classes such as ``\\d`` and ``\\s`` then match ASCII characters only.
+    """
+    return re.compile(pattern.pattern.encode("ascii"), pattern.flags & ~re.UNICODE)
+
+
+def scan_file(
+    file_path: str,
+    pattern: Pattern[bytes],
+    convert: Callable[["re.Match[bytes]"], Optional[T]],
+    chunk_size: int = CHUNK_SIZE,
+    overlap: int = OVERLAP,
+) -> Iterator[Tuple[int, int, T]]:
+    """
+    Scans a file for a bytes pattern without reading it into memory.
+
+    The file is memory-mapped and searched in place, one window of `chunk_size`
+    bytes at a time. Each window is searched `overlap` bytes past its end, so
+    matches crossing a window boundary are found whole, exactly once, and the
+    result is the same as a single ``finditer`` over the whole file. Pages of
+    windows already scanned are released, so memory use does not grow with the
+    size of the file.
+
+    Args:
+        file_path (str): The file to scan.
+        pattern (Pattern[bytes]): The pattern to search for.
+        convert (Callable): Turns a match into the value yielded for it, or into
+                            None to skip it. Matches reference the mapping and
+                            must not be kept.
+        chunk_size (int): The number of bytes scanned per window.
+        overlap (int): The number of bytes searched past a window; must exceed
+                       the length of the longest match of `pattern`.
+
+    Yields:
+        tuple: The start and end byte offsets of each kept match, and its value.
+
+    Raises:
+        OSError: If the file cannot be opened.
+    """
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            _advise(mm, "MADV_SEQUENTIAL", 0, size)
+            resume = 0
+            for start in range(0, size, chunk_size):
+                end = min(start + chunk_size, size)
+                found, resume = _scan_window(
+                    mm,
+                    pattern,
+                    convert,
+                    max(start, resume),
+                    end,
+                    min(end + overlap, size),
+                )
+                # matches are collected before being yielded: the mapping cannot be
+                # closed while a match or a scanner still references it
+                yield from found
+                _advise(mm, "MADV_DONTNEED", start, end - start)
+
+
+def _scan_window(
+    mm: mmap.mmap,
+    pattern: Pattern[bytes],
+    convert: Callable,
+    pos: int,
+    end: int,
+    endpos: int,
+) -> Tuple[List[Tuple[int, int, T]], int]:
+    found = []
+    resume = max(pos, end)
+    for match in pattern.finditer(mm, pos, endpos):
+        match_start, match_end = match.span()
+        if match_start >= end:
+            # found again, from the same position, by the next window
+            break
+        # like finditer, the next search starts where this match ended
+        resume = max(resume, match_end)
+        value = convert(match)
+        if value is not None:
+            found.append((match_start, match_end, value))
+    return found, resume
+
+
+def _advise(mm: mmap.mmap, advice: str, start: int, length: int) -> None:
+    # madvise is a hint, unavailable on some platforms; it takes page-aligned starts
+    if hasattr(mm, "madvise") and hasattr(mmap, advice):
+        aligned = start - start % mmap.PAGESIZE
+        mm.madvise(getattr(mmap, advice), aligned, length + start - aligned)
@@ -0,0 +1,106 @@
+# uscodekit/shared/parallel.py
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Workers are forked wherever the platform can, including where fork is not the
+# default start method (macOS; Linux from Python 3.14), so that they inherit the
+# datasets loaded by the parent instead of each loading their own copy.
+FORK = "fork" in multiprocessing.get_all_start_methods()
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """Returns the number of worker processes to use; None means one per CPU."""
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}.")
+    return workers
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Splits an iterable into lists of `size` items (the last one may be shorter)."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def ordered_map(
+    fn: Callable[[List[T]], List[R]],
+    items: Iterable[T],
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    max_pending: Optional[int] = None,
+) -> Iterator[R]:
+    """
+    Maps a function over chunks of items in a process pool, yielding results in order.
+
+    Items are read lazily and sent to the workers `chunksize` at a time. At most
+    `max_pending` chunks are in flight, so neither the input nor the results are
+    ever held whole in memory, however long `items` is. With a single worker,
+    chunks are processed in the calling process, without a pool.
+
+    Where the platform supports it (see `FORK`), the workers are forked, and
+    share the memory of whatever the calling process loaded before the call.
+    Elsewhere (Windows), they start a new interpreter and load the datasets
+    they use themselves.
+
+    `fn` is pickled to the workers: it must be a module-level function, or a
+    `functools.partial` of one.
+
+    Args:
+        fn (Callable): Maps a chunk of items to the list of their results.
+        items (Iterable): The items to process.
+        workers (int | None): The number of worker processes. Defaults to one per CPU.
+        chunksize (int): The number of items sent to a worker at a time.
+        max_pending (int | None): The maximum number of chunks submitted but not
+                                  yet yielded. Defaults to twice the workers.
+
+    Returns:
+        Iterator: The results of the items, in the order of `items`.
+
+    Raises:
+        ValueError: If `workers` or `chunksize` is less than 1.
+    """
+    workers = resolve_workers(workers)
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}.")
+    return _ordered_map(fn, chunked(items, chunksize), workers, max_pending)
+
+
+def _ordered_map(
+    fn: Callable[[List[T]], List[R]],
+    chunks: Iterator[List[T]],
+    workers: int,
+    max_pending: Optional[int],
+) -> Iterator[R]:
+    if workers == 1:
+        for chunk in chunks:
+            yield from fn(chunk)
+        return
+
+    max_pending = max(1, max_pending or 2 * workers)
+    context = multiprocessing.get_context("fork") if FORK else None
+    pool = ProcessPoolExecutor(workers, mp_context=context)
+    try:
+        pending = deque()
+        for chunk in chunks:
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+            pending.append(pool.submit(fn, chunk))
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        # an abandoned iteration does not wait for chunks nobody will read
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,44 @@
+# uscodekit/shared/singleflight.py
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls of a function into a single execution.
+
+    The first thread calling `do` runs the function; threads calling `do` while
+    it runs wait for it and receive its result, or its exception. Once the call
+    has completed, the next `do` runs the function again, so callers cache the
+    result themselves if it should be reused.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flight: Optional[Future] = None
+
+    def do(self, fn: Callable[[], T]) -> T:
+        with self._lock:
+            flight = self._flight
+            leader = flight is None
+            if leader:
+                flight = self._flight = Future()
+        if not leader:
+            return flight.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._flight = None
@@ -0,0 +1,85 @@
+# uscodekit/warmup.py
+
+import gc
+from typing import Dict, Iterable, List, Optional
+
+from uscodekit.services.geo import get_geo_index
+
+
+GEO = "geo"
+NAICS = "naics"
+
+DATASETS = (GEO, NAICS)
+
+
+def _preload_geo() -> int:
+    index = get_geo_index()
+    # build the secondary indexes now rather than on the first query of each worker
+    index.warm()
+    return len(index.store)
+
+
+def _preload_naics() -> int:
+    from uscodekit import naics2k22
+
+    return len(naics2k22.index.records)
+
+
+_LOADERS = {GEO: _preload_geo, NAICS: _preload_naics}
+
+
+def select_datasets(datasets: Optional[Iterable[str]]) -> List[str]:
+    """
+    Validates dataset names, dropping duplicates; None selects every dataset.
+
+    Raises:
+        ValueError: If a dataset is unknown.
+    """
+    datasets = list(DATASETS if datasets is None else datasets)
+    unknown = [name for name in datasets if name not in DATASETS]
+    if unknown:
+        raise ValueError(
+            f"Unknown dataset(s) {', '.join(map(repr, unknown))}; "
+            f"expected some of {', '.join(DATASETS)}."
+        )
+    return list(dict.fromkeys(datasets))
+
+
+def preload(
+    datasets: Optional[Iterable[str]] = None, freeze: bool = True
+) -> Dict[str, int]:
+    """
+    Loads and indexes datasets eagerly, e.g. in a pre-fork server's master process.
+
+    Every dataset is otherwise loaded on first use, so each worker forked from a
+    master that did not preload pays for decrypting and indexing on its first
+    request. Preloading does that work once, before the fork, and workers share
+    the result through copy-on-write pages.
+
+    With `freeze`, the garbage collector is run and every object allocated so far
+    is moved to its permanent generation (`gc.freeze`). Collections in the workers
+    then never traverse, and so never write to, the preloaded objects, which keeps
+    their pages shared with the master.
+
+    Args:
+        datasets (Iterable[str] | None): The datasets to load, among "geo" and
+                                         "naics". Defaults to all of them.
+        freeze (bool): Whether to freeze the loaded objects out of garbage collection.
+
+    Returns:
+        dict: The number of records loaded, per dataset.
+
+    Raises:
+        ValueError: If a dataset is unknown.
+
+    Example:
+        >>> # gunicorn.conf.py
+        >>> preload_app = True
+        >>> def on_starting(server):
+        ...     uscodekit.preload()
+    """
+    loaded = {name: _LOADERS[name]() for name in select_datasets(datasets)}
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return loaded
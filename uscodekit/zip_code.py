@@ -1,9 +1,65 @@
 import re
-from typing import Optional, List, Dict, Any
+from functools import partial
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
+from uscodekit.records import ZipInfo
 from uscodekit.services.geo import GeoService
+from uscodekit.shared import mmapscan, parallel
+from uscodekit.shared.cache import LRUCache
+from uscodekit.services.geo_postings import AREA_CODE, CITY, STATE, TIMEZONE
 
 
-def extract_zip_code(text: str) -> Optional[str]:
+# Regular expression for US ZIP codes: 5-digit or ZIP+4 format
+ZIP_CODE_PATTERN = re.compile(r"\b\d{5}(?:-\d{4})?\b")
+# ZIP_CODE_PATTERN over bytes, for scanning files without decoding them
+ZIP_CODE_BYTES_PATTERN = mmapscan.bytes_pattern(ZIP_CODE_PATTERN)
+
+# The memoized results of `zip_code_insight`, by ZIP code, when enabled.
+_insight_cache: Optional[LRUCache] = None
+
+
+class ZipCodeMatch:
+    """
+    A US ZIP code found in a text, as returned by `extract_entities`.
+
+    Attributes
+    ----------
+    kind : str
+        "zip_code", to tell ZIP codes from the other entities of `extract_entities`.
+    start, end : int
+        The span of the ZIP code in the text.
+    zip_code : str
+        The ZIP code, in the 5-digit or the ZIP+4 format.
+    """
+
+    __slots__ = ("start", "end", "zip_code")
+
+    kind = "zip_code"
+
+    def __init__(self, start: int, end: int, zip_code: str):
+        self.start = start
+        self.end = end
+        self.zip_code = zip_code
+
+    @property
+    def span(self) -> Tuple[int, int]:
+        return self.start, self.end
+
+    def __str__(self) -> str:
+        return self.zip_code
+
+    def __repr__(self) -> str:
+        return f"ZipCodeMatch(span={self.span}, zip_code={self.zip_code!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ZipCodeMatch):
+            return NotImplemented
+        return self.span == other.span and self.zip_code == other.zip_code
+
+    def __hash__(self) -> int:
+        return hash((self.start, self.end, self.zip_code))
+
+
+def extract_zip_code(text: str, validate: bool = False) -> Optional[str]:
     """
     Extracts a US ZIP code from the given text.
 
@@ -12,21 +68,23 @@ def extract_zip_code(text: str) -> Optional[str]:
 
     Args:
         text (str): The text from which to extract the ZIP code.
+        validate (bool): Whether to skip candidates that are not ZIP codes of the
+                         database, such as order numbers or years.
 
     Returns:
         Optional[str]: The extracted ZIP code if found, otherwise None.
     """
-    # Regular expression for US ZIP codes: 5-digit or ZIP+4 format
-    zip_code_pattern = r"\b\d{5}(?:-\d{4})?\b"
+    if validate:
+        return next(_valid_zip_codes(text), None)
 
-    match = re.search(zip_code_pattern, text)
+    match = ZIP_CODE_PATTERN.search(text)
     if match:
         return match.group()  # Return the matched ZIP code
     else:
         return None
 
 
-def extract_all_zip_codes(text: str) -> List[str]:
+def extract_all_zip_codes(text: str, validate: bool = False) -> List[str]:
     """
     Extracts all US ZIP codes from the given text.
 
@@ -35,17 +93,143 @@ def extract_all_zip_codes(text: str) -> List[str]:
 
     Args:
         text (str): The text from which to extract the ZIP codes.
+        validate (bool): Whether to skip candidates that are not ZIP codes of the
+                         database, such as order numbers or years.
 
     Returns:
         List[str]: A list of extracted ZIP codes (empty if none found).
     """
-    # Regular expression for US ZIP codes: 5-digit or ZIP+4 format
-    zip_code_pattern = r"\b\d{5}(?:-\d{4})?\b"
+    if validate:
+        return list(_valid_zip_codes(text))
+
+    return ZIP_CODE_PATTERN.findall(text)
+
+
+def is_valid_zip_code(zip_code: str) -> bool:
+    """
+    Checks whether a ZIP code exists in the database.
+
+    The check is a bit test in a 12.5 KB bitmap of every ZIP code, built once,
+    so it is cheap enough to filter the candidates of large document sets.
+
+    Args:
+        zip_code (str): The ZIP code, in the 5-digit or the ZIP+4 format. For
+                        ZIP+4 codes, only the first five digits are checked.
+
+    Returns:
+        bool: True if the ZIP code is well-formed and in the database.
+    """
+    return zip_code in _zip_bitmap()
+
+
+def _zip_bitmap():
+    # without a database, every ZIP code would silently fail the validation
+    index = GeoService().index
+    if not len(index.store):
+        raise ValueError(
+            "ZIP codes cannot be validated without the geo database; see the setup guide."
+        )
+    return index.zip_bitmap
+
+
+def scan_file(
+    file_path: str, validate: bool = False, chunk_size: int = mmapscan.CHUNK_SIZE
+) -> Iterator[Tuple[int, int, str]]:
+    """
+    Scans a file for US ZIP codes without reading it into memory.
+
+    The file is memory-mapped and its bytes are searched in place, one window
+    at a time, so memory use stays constant however large the file is. ZIP
+    codes are found as by `extract_all_zip_codes` on the file's text; digits
+    are ASCII digits only.
+
+    Args:
+        file_path (str): The file to scan.
+        validate (bool): Whether to skip candidates that are not ZIP codes of the
+                         database, such as order numbers or years.
+        chunk_size (int): The number of bytes scanned per window.
+
+    Yields:
+        tuple: The start and end byte offsets of each ZIP code in the file, and
+               the ZIP code.
+
+    Raises:
+        OSError: If the file cannot be opened.
+    """
+    bitmap = _zip_bitmap() if validate else None
+
+    def convert(match: "re.Match[bytes]") -> Optional[str]:
+        zip_code = match.group().decode("ascii")
+        if bitmap is not None and zip_code not in bitmap:
+            return None
+        return zip_code
+
+    return mmapscan.scan_file(file_path, ZIP_CODE_BYTES_PATTERN, convert, chunk_size)
+
+
+def extract_all_zip_codes_many(
+    documents: Iterable[str],
+    validate: bool = False,
+    paths: bool = False,
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+) -> Iterator[List[str]]:
+    """
+    Extracts the US ZIP codes of many documents, in parallel processes.
+
+    Documents are sent to a pool of `workers` processes `chunksize` at a time,
+    with a bounded number of chunks in flight, so arbitrarily long inputs are
+    streamed rather than held in memory. Results come back in input order.
+
+    Args:
+        documents (Iterable[str]): The texts to search, or the paths of the files
+                                   to scan if `paths` is True.
+        validate (bool): Whether to skip candidates that are not ZIP codes of the
+                         database, such as order numbers or years.
+        paths (bool): Whether `documents` are file paths, scanned with `scan_file`.
+        workers (int | None): The number of worker processes. Defaults to one per
+                              CPU; 1 extracts in the calling process.
+        chunksize (int): The number of documents sent to a worker at a time.
+
+    Returns:
+        Iterator[List[str]]: For each document, in order, its ZIP codes as
+                             returned by `extract_all_zip_codes`.
+
+    Raises:
+        ValueError: If `workers` or `chunksize` is less than 1.
+        OSError: If `paths` is True and a file cannot be opened.
+    """
+    if validate:
+        # loaded before the pool starts, so forked workers share the bitmap
+        _zip_bitmap()
+    return parallel.ordered_map(
+        partial(_extract_all_zip_codes_chunk, validate, paths),
+        documents,
+        workers,
+        chunksize,
+    )
+
 
-    return re.findall(zip_code_pattern, text)
+def _extract_all_zip_codes_chunk(
+    validate: bool, paths: bool, documents: List[str]
+) -> List[List[str]]:
+    if paths:
+        return [
+            [zip_code for _, _, zip_code in scan_file(path, validate)]
+            for path in documents
+        ]
+    return [extract_all_zip_codes(text, validate) for text in documents]
 
 
-def zip_code_insight(zip_code: str) -> Dict[str, Any]:
+def _valid_zip_codes(text: str) -> Iterator[str]:
+    bitmap = _zip_bitmap()
+    for match in ZIP_CODE_PATTERN.finditer(text):
+        candidate = match.group()
+        if candidate in bitmap:
+            yield candidate
+
+
+def zip_code_insight(zip_code: str) -> ZipInfo:
     """
     Provides detailed information about a given ZIP code.
 
@@ -53,31 +237,345 @@ def zip_code_insight(zip_code: str) -> Dict[str, Any]:
     including area code, city, state, state ISO code, location (latitude and longitude),
     and timezone details.
 
+    The result is an immutable record shared by every lookup of the ZIP code.
+    It reads like a dictionary (``info["city"]``) or through attributes
+    (``info.city``); `ZipInfo.to_dict` returns a mutable copy.
+
     Args:
         zip_code (str): The ZIP code for which information is to be retrieved.
 
     Returns:
-        Dict[str, Any]: A dictionary containing the following keys:
+        ZipInfo: A record with the following fields:
             - zipCode (str): The provided ZIP code.
             - areaCode (str): The area code associated with the ZIP code.
             - city (str): The city associated with the ZIP code.
             - state (str): The state associated with the ZIP code.
             - stateISO (str): The ISO code of the state.
-            - location (dict): A dictionary containing latitude and longitude.
-                - latitude (str): The latitude of the location.
-                - longitude (str): The longitude of the location.
-            - timezone (dict): A dictionary containing timezone information.
-                - name (str): The name of the timezone.
-                - offset (str): The offset of the timezone from UTC.
-    """
-    npa_db = GeoService()
-    pinfo = npa_db.get_zip_code_info(zip_code)
-    return {
-        "zipCode": zip_code,
-        "areaCode": pinfo.get("npa", ""),
-        "city": pinfo.get("city", ""),
-        "state": pinfo.get("state", ""),
-        "stateISO": pinfo.get("stateISO", ""),
-        "location": pinfo.get("location", {"latitude": "", "longitude": ""}),
-        "timezone": pinfo.get("timezone", {"name": "", "offset": ""}),
-    }
+            - location (Location): The latitude and longitude of the location.
+            - timezone (Timezone): The name of the timezone and its offset from UTC.
+    """
+    return _insight(GeoService().index, zip_code)
+
+
+def _insight(index, zip_code: str) -> ZipInfo:
+    cache = _insight_cache
+    if cache is not None:
+        return cache.get_or_compute(
+            index, zip_code, lambda: index.zip_code_record(zip_code)
+        )
+    return index.zip_code_record(zip_code)
+
+
+def enable_insight_cache(maxsize: int = 4096) -> None:
+    """
+    Memoizes the results of `zip_code_insight`, keeping the `maxsize` most
+    recently used.
+
+    Unknown ZIP codes are cached too, which spares building their record again
+    (known ZIP codes are always shared). The cache is emptied when the geo database is
+    reloaded. Enabling the cache again replaces it, resetting its counters.
+
+    Args:
+        maxsize (int): The maximum number of cached results.
+
+    Raises:
+        ValueError: If `maxsize` is less than 1.
+    """
+    global _insight_cache
+    _insight_cache = LRUCache(maxsize)
+
+
+def disable_insight_cache() -> None:
+    """Stops memoizing `zip_code_insight` and drops the cached results."""
+    global _insight_cache
+    _insight_cache = None
+
+
+def insight_cache_info() -> Optional[Dict[str, int]]:
+    """
+    Returns the counters of the `zip_code_insight` cache.
+
+    Returns:
+        dict | None: The "hits", "misses" and "evictions" since the cache was
+                     enabled, its "size" and "maxsize", or None if it is disabled.
+    """
+    cache = _insight_cache
+    return cache.info() if cache is not None else None
+
+
+def zip_code_insight_many(zip_codes: Iterable[str]) -> List[ZipInfo]:
+    """
+    Provides detailed information about many ZIP codes at once.
+
+    This is the batch counterpart of `zip_code_insight`. The database index is
+    resolved once for the whole batch and each distinct ZIP code is looked up
+    once. Results are returned in input order; repeated inputs share the same
+    record.
+
+    Args:
+        zip_codes (Iterable[str]): The ZIP codes for which information is to be retrieved.
+
+    Returns:
+        List[ZipInfo]: One record per input ZIP code, as returned by `zip_code_insight`.
+    """
+    return _insight_many(GeoService().index, zip_codes)
+
+
+def _insight_many(index, zip_codes: Iterable[str]) -> List[ZipInfo]:
+    resolved: Dict[str, ZipInfo] = {}
+    results = []
+    for zip_code in zip_codes:
+        info = resolved.get(zip_code)
+        if info is None:
+            info = resolved[zip_code] = index.zip_code_record(zip_code)
+        results.append(info)
+    return results
+
+
+def nearest_zip_codes(
+    latitude: float, longitude: float, k: int = 1
+) -> List[Dict[str, Any]]:
+    """
+    Finds the ZIP codes closest to a point.
+
+    The search runs on a spatial grid index built once over the coordinates of
+    every ZIP code, so only the grid cells around the point are examined.
+
+    Args:
+        latitude (float): Latitude of the point, in degrees.
+        longitude (float): Longitude of the point, in degrees.
+        k (int): The number of ZIP codes to return.
+
+    Returns:
+        List[Dict[str, Any]]: Up to `k` dictionaries, nearest first, with keys:
+            - zipCode (str): The ZIP code.
+            - distance (float): The great-circle distance to the point, in miles.
+    """
+    return GeoService().nearest_zip_codes(latitude, longitude, k)
+
+
+def zip_codes_within(
+    latitude: float, longitude: float, radius_miles: float
+) -> List[Dict[str, Any]]:
+    """
+    Finds the ZIP codes within a radius of a point.
+
+    Args:
+        latitude (float): Latitude of the point, in degrees.
+        longitude (float): Longitude of the point, in degrees.
+        radius_miles (float): The search radius, in miles.
+
+    Returns:
+        List[Dict[str, Any]]: Dictionaries with `zipCode` and `distance` (miles)
+                              keys, nearest first.
+
+    Raises:
+        ValueError: If the radius is negative.
+    """
+    return GeoService().zip_codes_within(latitude, longitude, radius_miles)
+
+
+def zip_codes_in_bbox(
+    min_lat: float, min_lon: float, max_lat: float, max_lon: float
+) -> List[str]:
+    """
+    Finds the ZIP codes inside a latitude/longitude bounding box.
+
+    Args:
+        min_lat (float): Southern edge of the box, in degrees.
+        min_lon (float): Western edge of the box, in degrees.
+        max_lat (float): Northern edge of the box, in degrees.
+        max_lon (float): Eastern edge of the box, in degrees.
+
+    Returns:
+        List[str]: The ZIP codes inside the box (edges included), in ascending order.
+
+    Raises:
+        ValueError: If a minimum edge exceeds the matching maximum edge.
+    """
+    return GeoService().zip_codes_in_bbox(min_lat, min_lon, max_lat, max_lon)
+
+
+def distance(zip_a: str, zip_b: str) -> Optional[float]:
+    """
+    Computes the great-circle (haversine) distance between two ZIP codes.
+
+    Args:
+        zip_a (str): The first ZIP code.
+        zip_b (str): The second ZIP code.
+
+    Returns:
+        Optional[float]: The distance in miles, or None if either ZIP code is
+                         unknown or has no coordinates.
+    """
+    return GeoService().distance(zip_a, zip_b)
+
+
+def pairwise_distances(zips_a: Iterable[str], zips_b: Iterable[str]):
+    """
+    Computes the distances between every pair of ZIP codes from two lists.
+
+    The haversine distances are computed at once over NumPy float arrays rather
+    than pair by pair. The result holds len(zips_a) * len(zips_b) floats; for
+    large inputs where only the closest matches matter, use `pairwise_top_k`.
+
+    Args:
+        zips_a (Iterable[str]): The ZIP codes of the rows.
+        zips_b (Iterable[str]): The ZIP codes of the columns.
+
+    Returns:
+        numpy.ndarray: A float64 matrix of distances in miles, with NaN for pairs
+                       involving an unknown ZIP code.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    return GeoService().pairwise_distances(zips_a, zips_b)
+
+
+def pairwise_top_k(
+    zips_a: Iterable[str], zips_b: Iterable[str], k: int = 1, block_size: int = 1024
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Streams, for each ZIP code of `zips_a`, its `k` closest ZIP codes of `zips_b`.
+
+    Distances are computed for `block_size` rows at a time, so memory stays
+    bounded by block_size * len(zips_b) floats however long `zips_a` is.
+
+    Args:
+        zips_a (Iterable[str]): The ZIP codes to find matches for.
+        zips_b (Iterable[str]): The candidate ZIP codes.
+        k (int): The number of matches per ZIP code.
+        block_size (int): The number of rows computed at a time.
+
+    Yields:
+        List[Dict[str, Any]]: For each ZIP code of `zips_a`, in order, up to `k`
+                              dictionaries with `zipCode` and `distance` (miles)
+                              keys, nearest first. Unknown ZIP codes yield [].
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    return GeoService().pairwise_top_k(zips_a, zips_b, k, block_size)
+
+
+def zip_codes_by_area_code(area_code: str) -> List[str]:
+    """
+    Lists every ZIP code served by an area code.
+
+    Args:
+        area_code (str): The 3-digit area code (NPA).
+
+    Returns:
+        List[str]: The matching ZIP codes, in ascending order.
+    """
+    return GeoService().zip_codes_by(AREA_CODE, area_code)
+
+
+def zip_codes_by_state(state: str) -> List[str]:
+    """
+    Lists every ZIP code of a state.
+
+    Args:
+        state (str): The state, as its ISO code ("MA") or its name ("Massachusetts"),
+                     case-insensitively.
+
+    Returns:
+        List[str]: The matching ZIP codes, in ascending order.
+    """
+    return GeoService().zip_codes_by(STATE, state)
+
+
+def zip_codes_by_city(city: str, state: str) -> List[str]:
+    """
+    Lists every ZIP code of a city.
+
+    Args:
+        city (str): The city name, case-insensitively.
+        state (str): The state of the city, as its ISO code or its name.
+
+    Returns:
+        List[str]: The matching ZIP codes, in ascending order.
+    """
+    return GeoService().zip_codes_by(CITY, city, state)
+
+
+def zip_codes_by_timezone(timezone: str) -> List[str]:
+    """
+    Lists every ZIP code in a timezone.
+
+    Args:
+        timezone (str): The timezone name, such as "EST", case-insensitively.
+
+    Returns:
+        List[str]: The matching ZIP codes, in ascending order.
+    """
+    return GeoService().zip_codes_by(TIMEZONE, timezone)
+
+
+def count_zip_codes(
+    area_code: Optional[str] = None,
+    state: Optional[str] = None,
+    city: Optional[str] = None,
+    timezone: Optional[str] = None,
+) -> int:
+    """
+    Counts the ZIP codes of an area code, a state, a city or a timezone, in
+    constant time.
+
+    Exactly one criterion must be given, except that a city is given together
+    with its state.
+
+    Returns:
+        int: The number of matching ZIP codes.
+
+    Raises:
+        ValueError: If no criterion, or more than one, is given.
+    """
+    geo = GeoService()
+    if city is not None:
+        if state is None or area_code is not None or timezone is not None:
+            raise ValueError("A city is counted together with its state only.")
+        return geo.count_zip_codes_by(CITY, city, state)
+
+    criteria = [
+        (kind, value)
+        for kind, value in (
+            (AREA_CODE, area_code),
+            (STATE, state),
+            (TIMEZONE, timezone),
+        )
+        if value is not None
+    ]
+    if len(criteria) != 1:
+        raise ValueError(
+            "Exactly one of area_code, state, city or timezone is required."
+        )
+    kind, value = criteria[0]
+    return geo.count_zip_codes_by(kind, value)
+
+
+def search_city(
+    query: str, state: Optional[str] = None, top_n: int = 10
+) -> List[Dict[str, Any]]:
+    """
+    Finds the cities whose names best match a possibly misspelled or abbreviated
+    query, such as "Sn Fransisco" or "St Louis".
+
+    Names are compared case-insensitively, ignoring punctuation and with common
+    abbreviations ("St", "Ft", "Mt"...) expanded, and ranked by their edit
+    distance to the query.
+
+    Args:
+        query (str): The city name to search for.
+        state (str | None): Restricts the search to one state, given as its ISO
+                            code or its name.
+        top_n (int): The maximum number of cities returned.
+
+    Returns:
+        List[Dict[str, Any]]: The best matches first, each with the "city",
+        "state" and "stateISO" as spelled in the database, the city's
+        "zipCodes" in ascending order, and the number of "edits" separating
+        its name from the query.
+    """
+    return GeoService().search_city(query, state, top_n)